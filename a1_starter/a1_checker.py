@@ -1,5 +1,17 @@
-"""A simple checker for functions in fantasy_draft_functions.py."""
+"""A simple checker for functions in fantasy_draft_functions.py.
 
+Run with no arguments to check fantasy_draft_functions.py in the current
+directory. To check many submissions, each in a subdirectory of one
+directory, and write one JSON record per submission:
+
+    python a1_checker.py --batch SUBMISSIONS_DIR --output results.jsonl
+"""
+
+import argparse
+import importlib.util
+import io
+import os
+import sys
 from typing import Any, Dict
 import unittest
 import checker_generic
@@ -141,15 +153,94 @@ class CheckTest(unittest.TestCase):
             self.assertEqual(expected, actual, msg)
 
 
-print("".center(TARGET_LEN, SEP))
-print(" Start: checking coding style ".center(TARGET_LEN, SEP))
-checker_generic.run_pyta(FILENAME, PYTA_CONFIG)
-print(" End checking coding style ".center(TARGET_LEN, SEP))
-
-print(" Start: checking type contracts ".center(TARGET_LEN, SEP))
-unittest.main(exit=False)
-print(" End checking type contracts ".center(TARGET_LEN, SEP))
-
-print("\nScroll up to see ALL RESULTS:")
-print("  - checking coding style")
-print("  - checking type contract\n")
+def check_submission(directory: str) -> dict:
+    """Return the PyTA messages and type contract check results for the
+    submission in directory, as a JSON-compatible dict. If PyTA could not
+    check the submission, the dict says why under "pyta_error".
+
+    This replaces the fantasy_draft_functions module for the rest of the
+    process, so it is meant to run in a process of its own.
+    """
+
+    global df
+
+    filename = os.path.join(directory, FILENAME)
+    pyta_error = None
+    try:
+        messages = checker_generic.pyta_messages(filename, PYTA_CONFIG)
+    except ValueError as exn:
+        messages, pyta_error = [], str(exn)
+
+    spec = importlib.util.spec_from_file_location("fantasy_draft_functions",
+                                                  filename)
+    df = importlib.util.module_from_spec(spec)
+    sys.modules["fantasy_draft_functions"] = df
+    try:
+        spec.loader.exec_module(df)
+    except Exception as exn:
+        return {"pyta_messages": messages, "pyta_error": pyta_error,
+                "tests_run": 0, "failures": [
+                    {"test": "import", "details": repr(exn)}]}
+
+    suite = unittest.defaultTestLoader.loadTestsFromTestCase(CheckTest)
+    result = unittest.TextTestRunner(stream=io.StringIO()).run(suite)
+    return {
+        "pyta_messages": messages,
+        "pyta_error": pyta_error,
+        "tests_run": result.testsRun,
+        "failures": [
+            {"test": test.id(), "details": details}
+            for test, details in result.failures + result.errors
+        ],
+    }
+
+
+def run_checks() -> None:
+    """Check fantasy_draft_functions.py in the current directory."""
+
+    print("".center(TARGET_LEN, SEP))
+    print(" Start: checking coding style ".center(TARGET_LEN, SEP))
+    checker_generic.run_pyta(FILENAME, PYTA_CONFIG)
+    print(" End checking coding style ".center(TARGET_LEN, SEP))
+
+    print(" Start: checking type contracts ".center(TARGET_LEN, SEP))
+    unittest.main(exit=False)
+    print(" End checking type contracts ".center(TARGET_LEN, SEP))
+
+    print("\nScroll up to see ALL RESULTS:")
+    print("  - checking coding style")
+    print("  - checking type contract\n")
+
+
+def main() -> None:
+    """Run the checker from the command line."""
+
+    if len(sys.argv) == 1:
+        run_checks()
+        return
+
+    parser = argparse.ArgumentParser(description="Check many submissions.")
+    parser.add_argument("--batch", required=True, metavar="SUBMISSIONS_DIR",
+                        help="directory with one subdirectory per submission")
+    parser.add_argument("--output", default="-",
+                        help="file for the JSON records (default: stdout)")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="checks to run at once (default: one per CPU)")
+    parser.add_argument("--timeout", type=float, default=60,
+                        help="seconds before a submission's check is killed")
+    args = parser.parse_args()
+
+    checker_generic.warm_up_pyta()
+    submissions = checker_generic.find_submissions(args.batch, FILENAME)
+
+    if args.output == "-":
+        checker_generic.run_batch(submissions, check_submission, sys.stdout,
+                                  args.jobs, args.timeout)
+    else:
+        with open(args.output, "w", encoding="utf-8") as output:
+            checker_generic.run_batch(submissions, check_submission, output,
+                                      args.jobs, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""An index of the players that are still available in a draft.
+
+fantasy_draft_functions.py represents the available players as a string of
+player ids separated by '_', such as 'DOL_NCA_MGO_AHS_'. Looking up or
+removing a player in that string takes time proportional to its length.
+AvailablePlayers keeps the same players in a dict keyed by player id, so
+lookups and removals take constant time, and only builds the string form
+when it is asked for.
+"""
+
+import random
+
+import fantasy_draft_functions as df
+
+
+class AvailablePlayers:
+    """The available players of a draft, in their original order.
+
+    >>> available = AvailablePlayers(['MGO_PD_G0-_A14_DC43_H70_Pr5-',
+    ...                               'CLA_PG_GAA2.23_SV0.910_Pr20'])
+    >>> 'CLA' in available
+    True
+    >>> available.remove('MGO')
+    'MGO_PD_G0-_A14_DC43_H70_Pr5-'
+    >>> available.to_string()
+    'CLA_'
+    """
+
+    def __init__(self, players: list[str]) -> None:
+        """Initialize an index of the player stat strings in players."""
+
+        self._players = {df.get_player_id(p): p for p in players}
+        # The ids again, in any order, so a random id can be drawn in
+        # constant time; _positions maps each id to its place in _ids
+        self._ids = list(self._players)
+        self._positions = {player_id: i for i, player_id in enumerate(self._ids)}
+
+    def __contains__(self, player_id: str) -> bool:
+        """Return True if and only if player_id is available."""
+
+        return player_id in self._players
+
+    def __len__(self) -> int:
+        """Return the number of available players."""
+
+        return len(self._players)
+
+    def player(self, player_id: str) -> str:
+        """Return the stat string of the available player player_id."""
+
+        return self._players[player_id]
+
+    def players(self) -> list[str]:
+        """Return the stat strings of the available players, in order."""
+
+        return list(self._players.values())
+
+    def remove(self, player_id: str) -> str:
+        """Remove the available player player_id and return their stat
+        string.
+        """
+
+        player = self._players.pop(player_id)
+        position = self._positions.pop(player_id)
+        last = self._ids.pop()
+        if last != player_id:
+            self._ids[position] = last
+            self._positions[last] = position
+        return player
+
+    def random_id(self, rng: random.Random = random) -> str:
+        """Return the id of an available player chosen uniformly at random.
+
+        Precondition: at least one player is available.
+        """
+
+        return self._ids[rng.randrange(len(self._ids))]
+
+    def to_string(self) -> str:
+        """Return the available player ids in the '_' separated string form
+        used by fantasy_draft_functions.py.
+        """
+
+        return "".join(player_id + "_" for player_id in self._players)
+
+
+def available_from_string(players: list[str],
+                          all_players: str) -> AvailablePlayers:
+    """Return an index of the players in players whose ids are in the '_'
+    separated string of player ids all_players.
+
+    >>> available = available_from_string(
+    ...     ['MGO_PD_G0-_A14_DC43_H70_Pr5-', 'CLA_PG_GAA2.23_SV0.910_Pr20'],
+    ...     'CLA_')
+    >>> len(available)
+    1
+    """
+
+    ids = set(all_players.split("_"))
+    return AvailablePlayers([p for p in players
+                             if df.get_player_id(p) in ids])
@@ -0,0 +1,183 @@
+"""Vectorized scoring of many players at once.
+
+compute_fantasy_score in fantasy_draft_functions.py scores one player
+string at a time. The functions here parse a whole list of player strings
+(or a players.txt file) into NumPy columns and apply the skater and goalie
+formulas column-wise, using masks to pick the right formula per row.
+
+The scoring constants are read from the constants module when scoring, not
+when this module is imported, so what-if runs can change them between calls.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+import constants
+from player_loader import RECORD_WIDTH, load_records
+
+_ZERO = ord('0')
+_DASH = ord('-')
+
+
+class PlayerColumns(NamedTuple):
+    """Parsed stats for many players, one NumPy array per stat.
+
+    Stats that do not apply to a player's position are 0.
+    """
+
+    ids: np.ndarray
+    positions: np.ndarray
+    goals: np.ndarray
+    assists: np.ndarray
+    dcs: np.ndarray
+    hits: np.ndarray
+    gaa: np.ndarray
+    sv: np.ndarray
+    prices: np.ndarray
+
+
+def _digits(chars: np.ndarray) -> np.ndarray:
+    """Return the integer value of each row of ASCII digit columns chars."""
+
+    value = np.zeros(chars.shape[0], dtype=np.int64)
+    for column in range(chars.shape[1]):
+        value = value * 10 + (chars[:, column].astype(np.int64) - _ZERO)
+    return value
+
+
+def _padded_number(chars: np.ndarray) -> np.ndarray:
+    """Return the value of each two-character field in chars, where a single
+    digit number is padded with a trailing '-' (e.g. '5-' is 5).
+    """
+
+    tens = chars[:, 0].astype(np.int64) - _ZERO
+    ones = chars[:, 1].astype(np.int64) - _ZERO
+    return np.where(chars[:, 1] == _DASH, tens, tens * 10 + ones)
+
+
+def _skater_stat(chars: np.ndarray, goalies: np.ndarray,
+                 start: int) -> np.ndarray:
+    """Return the two-character skater stat starting at column start of each
+    row of chars, or 0 for rows that are goalies.
+    """
+
+    return np.where(goalies, 0, _padded_number(chars[:, start:start + 2]))
+
+
+def parse_players(players: list[str]) -> PlayerColumns:
+    """Return the stats of every player string in players as PlayerColumns.
+
+    Precondition: each string in players is a non-empty string of player
+    stats as seen in players.txt.
+
+    >>> columns = parse_players(['MGO_PD_G0-_A14_DC43_H70_Pr5-',
+    ...                          'CLA_PG_GAA2.23_SV0.910_Pr20'])
+    >>> columns.positions.tolist()
+    ['D', 'G']
+    >>> columns.prices.tolist()
+    [5, 20]
+    >>> columns.hits.tolist()
+    [70, 0]
+    >>> columns.gaa.tolist()
+    [0.0, 2.23]
+    """
+
+    raw = ''.join(p.ljust(RECORD_WIDTH) for p in players).encode('ascii')
+    return parse_records(raw)
+
+
+def parse_records(records: bytes | memoryview) -> PlayerColumns:
+    """Return the stats of the players in records, which holds consecutive
+    player stat strings each padded with spaces to RECORD_WIDTH bytes, as
+    returned by player_loader.load_records.
+    """
+
+    chars = np.frombuffer(records, dtype=np.uint8).reshape(-1, RECORD_WIDTH)
+    positions = chars[:, 5].copy().view('S1').astype('U1')
+    goalies = positions == constants.GOALIE
+
+    # Skater prices end at the last column, goalie prices one column earlier
+    prices = np.where(goalies, _padded_number(chars[:, 25:27]),
+                      _padded_number(chars[:, 26:28]))
+
+    # Dividing the exact digit value keeps results identical to float('2.23')
+    gaa_digits = _digits(chars[:, [10, 12, 13]])
+    sv_digits = _digits(chars[:, [17, 19, 20, 21]])
+
+    return PlayerColumns(
+        ids=chars[:, :3].copy().view('S3').ravel().astype('U3'),
+        positions=positions,
+        goals=_skater_stat(chars, goalies, 8),
+        assists=_skater_stat(chars, goalies, 12),
+        dcs=_skater_stat(chars, goalies, 17),
+        hits=_skater_stat(chars, goalies, 21),
+        gaa=np.where(goalies, gaa_digits / 100, 0.0),
+        sv=np.where(goalies, sv_digits / 1000, 0.0),
+        prices=prices,
+    )
+
+
+def compute_fantasy_scores(columns: PlayerColumns) -> np.ndarray:
+    """Return the fantasy score of every player in columns, matching
+    compute_fantasy_score in fantasy_draft_functions.py player by player.
+
+    >>> columns = parse_players(['MGO_PD_G0-_A14_DC43_H70_Pr5-',
+    ...                          'CLA_PG_GAA2.23_SV0.910_Pr20',
+    ...                          'AMP_PF_G10_A10_DC51_H30_Pr10'])
+    >>> compute_fantasy_scores(columns).tolist()
+    [53.5, 68.7, 72.5]
+    """
+
+    positions = columns.positions
+    dcs_per_point = np.where(positions == constants.DEFENCEMEN,
+                             constants.D_DCS_PER_POINT,
+                             constants.F_DCS_PER_POINT)
+    skater_scores = (columns.goals * constants.POINTS_PER_GOAL
+                     + columns.assists * constants.POINTS_PER_ASSIST
+                     + columns.hits * constants.POINTS_PER_HIT
+                     + columns.dcs // dcs_per_point)
+    goalie_scores = (constants.SV_VALUE * columns.sv
+                     - constants.GAA_VALUE * columns.gaa)
+    return np.where(positions == constants.GOALIE, goalie_scores,
+                    skater_scores).astype(np.float64)
+
+
+def score_players(players: list[str]) -> tuple[np.ndarray, np.ndarray,
+                                               np.ndarray]:
+    """Return the fantasy scores, prices and positions of every player string
+    in players as three NumPy arrays in the same order as players.
+
+    >>> scores, prices, positions = score_players(
+    ...     ['NSH_PF_G7-_A14_DC20_H73_Pr10', 'GMC_PG_GAA2.57_SV0.902_Pr15'])
+    >>> scores.tolist()
+    [76.25, 64.5]
+    >>> prices.tolist()
+    [10, 15]
+    >>> positions.tolist()
+    ['F', 'G']
+    """
+
+    if not players:
+        return (np.zeros(0, dtype=np.float64), np.zeros(0, dtype=np.int64),
+                np.zeros(0, dtype='U1'))
+    columns = parse_players(players)
+    return (compute_fantasy_scores(columns), columns.prices,
+            columns.positions)
+
+
+def score_players_file(filename: str) -> tuple[np.ndarray, np.ndarray,
+                                               np.ndarray]:
+    """Return the fantasy scores, prices and positions of every player in the
+    players file filename, as returned by score_players.
+    """
+
+    columns = parse_records(load_records(filename))
+    return (compute_fantasy_scores(columns), columns.prices,
+            columns.positions)
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
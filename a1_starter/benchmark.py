@@ -0,0 +1,216 @@
+"""Benchmarks for the hot paths of the fantasy draft.
+
+Times the functions in fantasy_draft_functions.py that drafts and
+simulations call most, the team feasibility check, and a full headless
+draft, on synthetic player pools of several sizes. Results are written as
+JSON so runs from different commits can be compared.
+
+Usage:
+    python benchmark.py --output before.json
+    python benchmark.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from typing import Callable
+
+import fantasy_draft_functions as df
+from draft_simulator import RandomStrategy, run_draft
+from fantasy_draft import can_create_team, init_player
+from price_index import PriceIndex
+
+POOL_SIZES = (26, 10_000, 1_000_000)
+
+# Each benchmark is repeated until it has run for at least this many seconds
+# (and at least once), and the fastest repeat is reported
+MIN_SECONDS = 0.5
+
+# Number of players each per-player benchmark calls its function on
+CALLS = 10_000
+
+_ID_CHARACTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+
+def _padded(value: int) -> str:
+    """Return value as a two character stat, e.g. '5-' for 5."""
+
+    return str(value).ljust(2, "-")
+
+
+def make_pool(size: int, seed: int = 0) -> list[str]:
+    """Return size random player stat strings, about one in five a goalie.
+
+    Player ids are unique while there are enough three character ids and
+    repeat after that.
+    """
+
+    rng = random.Random(seed)
+    players = []
+    for i in range(size):
+        player_id, number = "", i
+        for _ in range(3):
+            number, digit = divmod(number, len(_ID_CHARACTERS))
+            player_id = _ID_CHARACTERS[digit] + player_id
+        price = _padded(rng.randrange(5, 45, 5))
+        if rng.random() < 0.2:
+            players.append(
+                f"{player_id}_PG_GAA{rng.randint(150, 450) / 100:.2f}"
+                f"_SV{rng.randint(850, 930) / 1000:.3f}_Pr{price}"
+            )
+        else:
+            players.append(
+                f"{player_id}_P{rng.choice('FD')}_G{_padded(rng.randint(0, 60))}"
+                f"_A{_padded(rng.randint(0, 90))}"
+                f"_DC{_padded(rng.randint(0, 99))}"
+                f"_H{_padded(rng.randint(0, 99))}_Pr{price}"
+            )
+    return players
+
+
+def _time(function: Callable[[], object], calls: int) -> dict:
+    """Return the time per call of function, which makes calls calls each
+    time it runs, as a benchmark result.
+    """
+
+    timings = []
+    start = time.perf_counter()
+    while not timings or time.perf_counter() - start < MIN_SECONDS:
+        before = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - before)
+    best = min(timings)
+    return {
+        "seconds_per_call": best / calls,
+        "calls": calls,
+        "repeats": len(timings),
+    }
+
+
+def _per_player(function: Callable[[str], object],
+                players: list[str]) -> Callable[[], None]:
+    """Return a benchmark body calling function on every player in players.
+    """
+
+    def run() -> None:
+        for player in players:
+            function(player)
+
+    return run
+
+
+def _cold_parse(players: list[str]) -> Callable[[], None]:
+    """Return a benchmark body parsing every player in players with an
+    empty parse cache. The players must be distinct, or the repeats are
+    cache hits.
+    """
+
+    def run() -> None:
+        df.parse_player.cache_clear()
+        for player in players:
+            df.parse_player(player)
+
+    return run
+
+
+def run_benchmarks(sizes: tuple[int, ...], drafts: bool = True) -> dict:
+    """Return the results of every benchmark for pools of each size in
+    sizes, keyed by benchmark name and then pool size.
+    """
+
+    results = {}
+
+    def record(name: str, size: int, result: dict) -> None:
+        results.setdefault(name, {})[str(size)] = result
+        print(f"{name:<24} {size:>9} "
+              f"{result['seconds_per_call'] * 1e6:>12.3f} us/call",
+              flush=True)
+
+    for size in sizes:
+        pool = make_pool(size)
+        sample = [pool[i % size] for i in range(CALLS)]
+        pool_ids = "".join(df.get_player_id(p) + "_" for p in pool)
+        gm = init_player()
+
+        # Parsing does not depend on the pool, and the pool may have fewer
+        # than CALLS distinct players
+        record("parse_player_cold", size, _time(
+            _cold_parse(make_pool(CALLS, seed=size)), CALLS))
+        record("get_price", size, _time(_per_player(df.get_price, sample),
+                                        CALLS))
+        record("can_select", size, _time(
+            _per_player(lambda p: df.can_select(p, 2, 1, 0), sample), CALLS))
+        record("compute_fantasy_score", size, _time(
+            _per_player(df.compute_fantasy_score, sample), CALLS))
+        record("remove_player", size, _time(
+            lambda: df.remove_player(pool_ids, len(pool_ids) // 8 * 4 + 3),
+            1))
+        record("can_create_team", size, _time(
+            lambda: can_create_team(gm, pool), 1))
+        price_index = PriceIndex(pool)
+        record("can_create_team_indexed", size, _time(
+            lambda: can_create_team(gm, pool, price_index), 1))
+        if drafts:
+            record("headless_draft", size, _time(
+                lambda: run_draft(pool, (RandomStrategy, RandomStrategy),
+                                  random.Random(0)), 1))
+    return results
+
+
+def _commit() -> str:
+    """Return the current git commit, or the empty string outside git."""
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """Print how each benchmark in results changed relative to baseline."""
+
+    print(f"\nCompared with {baseline.get('commit', '')[:12] or 'baseline'}:")
+    for name, by_size in results.items():
+        for size, result in by_size.items():
+            before = baseline["results"].get(name, {}).get(size)
+            if before is None:
+                continue
+            ratio = result["seconds_per_call"] / before["seconds_per_call"]
+            print(f"{name:<24} {size:>9} {ratio:>8.2f}x")
+
+
+def main() -> None:
+    """Run the benchmarks from the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=POOL_SIZES)
+    parser.add_argument("--no-drafts", action="store_true",
+                        help="skip the full headless draft benchmark")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", metavar="JSON",
+                        help="results of an earlier run to compare with")
+    args = parser.parse_args()
+
+    report = {
+        "commit": _commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": run_benchmarks(tuple(args.sizes), not args.no_drafts),
+    }
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline:
+            compare(report["results"], json.load(baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,161 @@
 """Runner for assignment sanity checkers, including PyTA."""
 
+import json
+import multiprocessing
+import os
 import sys
+import time
+from multiprocessing.connection import wait
+from typing import Callable, TextIO
+
+PYTA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pyta")
+
+
+def _import_pyta() -> None:
+    """Make the bundled copy of PyTA importable."""
+
+    if PYTA_DIR not in sys.path:
+        sys.path.insert(0, PYTA_DIR)
 
 
 def run_pyta(filename: str, config_file: str) -> None:
     """Run PYTA with configuration config_file on the file named filename."""
 
-    sys.path.insert(0, "pyta")
+    _import_pyta()
     import python_ta
 
     python_ta.check_all(filename, config=config_file)
 
 
+def pyta_messages(filename: str, config_file: str) -> list[dict]:
+    """Run PYTA with configuration config_file on the file named filename,
+    without printing a report, and return the messages it found.
+
+    Raise ValueError if PyTA could not check the file, e.g. because of a
+    syntax error, so that it is not mistaken for a file with no messages.
+    """
+
+    _import_pyta()
+    import python_ta
+
+    reporter = python_ta.check_all(filename, config=config_file,
+                                   output=os.devnull)
+    checked = {os.path.abspath(path) for path in reporter.messages}
+    if os.path.abspath(filename) not in checked:
+        raise ValueError(f"PyTA could not check {filename}")
+
+    messages = []
+    for msgs in reporter.messages.values():
+        for msg in msgs:
+            messages.append({
+                "msg_id": msg.msg_id,
+                "symbol": msg.symbol,
+                "line": msg.line,
+                "msg": msg.msg,
+            })
+    return messages
+
+
+def warm_up_pyta() -> None:
+    """Import PyTA and build the astroid tree of builtins, so that processes
+    forked afterwards start with them already loaded.
+    """
+
+    _import_pyta()
+    import python_ta
+    from astroid import MANAGER
+
+    MANAGER.ast_from_module_name("builtins")
+
+
+def find_submissions(directory: str, filename: str) -> list[str]:
+    """Return the sorted paths of the subdirectories of directory that
+    contain a file named filename.
+    """
+
+    return sorted(
+        entry.path for entry in os.scandir(directory)
+        if entry.is_dir() and os.path.isfile(os.path.join(entry.path, filename))
+    )
+
+
+def _run_check(check: Callable[[str], dict], submission: str,
+               connection: multiprocessing.connection.Connection) -> None:
+    """Send the result of check(submission) through connection, silencing
+    anything the check prints.
+    """
+
+    sys.stdout = sys.stderr = open(os.devnull, "w", encoding="utf-8")
+    try:
+        record = {"status": "ok", **check(submission)}
+    except Exception as exn:
+        record = {"status": "error", "error": repr(exn)}
+    connection.send(record)
+    connection.close()
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    """Return the multiprocessing context for check processes: fork where
+    available, so each check starts from the warmed-up parent.
+    """
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def run_batch(submissions: list[str], check: Callable[[str], dict],
+              output: TextIO, jobs: int = 0, timeout: float = 60) -> None:
+    """Run check on each submission in submissions, each in its own process
+    with up to jobs processes at a time (one per CPU if jobs is 0), and
+    write one JSON record per submission to output as each one finishes.
+
+    A check that runs for longer than timeout seconds is killed and recorded
+    with status "timeout"; one that raises is recorded with status "error".
+    """
+
+    context = _process_context()
+    jobs = jobs or os.cpu_count() or 1
+    pending = list(reversed(submissions))
+    running = {}
+
+    def finish(submission: str, started: float, record: dict) -> None:
+        record = {"submission": submission, **record,
+                  "seconds": round(time.monotonic() - started, 3)}
+        output.write(json.dumps(record) + "\n")
+        output.flush()
+
+    while pending or running:
+        while pending and len(running) < jobs:
+            submission = pending.pop()
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(target=_run_check,
+                                      args=(check, submission, sender))
+            process.start()
+            sender.close()
+            running[receiver] = (process, submission, time.monotonic())
+
+        for receiver in wait(list(running), timeout=0.1):
+            process, submission, started = running.pop(receiver)
+            # Receive before joining: a record larger than the pipe buffer
+            # keeps the sender blocked, so it would never exit.
+            try:
+                record = receiver.recv()
+            except EOFError:
+                record = None
+            process.join()
+            if record is None:
+                record = {"status": "crashed", "exitcode": process.exitcode}
+            finish(submission, started, record)
+
+        for receiver, (process, submission, started) in list(running.items()):
+            if time.monotonic() - started > timeout:
+                process.kill()
+                process.join()
+                del running[receiver]
+                finish(submission, started, {"status": "timeout"})
+
+
 def check(func: callable, args: list, expected: type) -> tuple[bool, object]:
     """Check if func(args) returns a result of type expected.
 
@@ -0,0 +1,318 @@
+"""A headless draft simulator.
+
+begin_draft in fantasy_draft.py plays one draft through input() and print().
+This module plays drafts with the same rules between two general manager
+strategies without any I/O, and runs many of them across a process pool,
+reporting the win rates and score distributions of both general managers as
+the drafts complete.
+
+Usage:
+    python draft_simulator.py --drafts 100000 --gm1 random --gm2 optimal
+"""
+
+import argparse
+import math
+import random
+from collections import Counter
+from multiprocessing import Pool
+from typing import Iterator
+
+import fantasy_draft_functions as df
+from draft_solver import DraftSolver
+from fantasy_draft import (
+    init_player,
+    players_selected,
+    compute_gm_score,
+    can_create_team,
+    can_draft,
+    draft_player,
+)
+from player_loader import load_players
+from price_index import PriceIndex
+
+from constants import PLAYERS_TO_SELECT
+
+# Width of the score ranges counted in a DraftSummary histogram
+HISTOGRAM_BIN = 10
+
+# Number of drafts each worker task plays
+CHUNK_SIZE = 1000
+
+
+class RandomStrategy:
+    """Drafts a random player among those that can legally be drafted."""
+
+    def __init__(self, players: list[str]) -> None:
+        """Initialize a strategy for a draft over the player pool players."""
+
+    def pick(self, gm: dict, players: list[str], price_index: PriceIndex,
+             rng: random.Random) -> str:
+        """Return the player from players that gm drafts next, or the empty
+        string if gm cannot legally draft any player.
+        """
+
+        legal = [p for p in players if can_draft(gm, p, price_index)]
+        if not legal:
+            return ""
+        return rng.choice(legal)
+
+
+class GreedyStrategy:
+    """Drafts the highest scoring player that can legally be drafted."""
+
+    def __init__(self, players: list[str]) -> None:
+        """Initialize a strategy for a draft over the player pool players."""
+
+    def pick(self, gm: dict, players: list[str], price_index: PriceIndex,
+             rng: random.Random) -> str:
+        """Return the player from players that gm drafts next, or the empty
+        string if gm cannot legally draft any player.
+        """
+
+        legal = [p for p in players if can_draft(gm, p, price_index)]
+        if not legal:
+            return ""
+        return max(legal, key=df.compute_fantasy_score)
+
+
+class OptimalStrategy:
+    """Drafts towards the highest scoring team gm can still complete, using
+    a DraftSolver.
+
+    The solver of each draft is copied from one built for the most recent
+    player pool, so drafts over the same pool build its tables only once.
+    """
+
+    # The most recent player pool, as a tuple, and the solver built for it
+    _pool = None
+    _solver = None
+
+    def __init__(self, players: list[str]) -> None:
+        """Initialize a strategy for a draft over the player pool players."""
+
+        pool = tuple(players)
+        if pool != OptimalStrategy._pool:
+            OptimalStrategy._pool = pool
+            OptimalStrategy._solver = DraftSolver(players)
+        self.solver = OptimalStrategy._solver.copy()
+        self.fallback = GreedyStrategy(players)
+
+    def pick(self, gm: dict, players: list[str], price_index: PriceIndex,
+             rng: random.Random) -> str:
+        """Return the player from players that gm drafts next, or the empty
+        string if gm cannot legally draft any player.
+        """
+
+        player = self.solver.best_pick(gm, players)
+        if player == "":
+            return self.fallback.pick(gm, players, price_index, rng)
+        return player
+
+
+STRATEGIES = {
+    "random": RandomStrategy,
+    "greedy": GreedyStrategy,
+    "optimal": OptimalStrategy,
+}
+
+
+def run_draft(players: list[str], strategies: tuple[type, type],
+              rng: random.Random) -> tuple[float, float]:
+    """Play one draft over the player pool players, with GM 1 and GM 2
+    drafting with strategies[0] and strategies[1]. Return the fantasy scores
+    of GM 1 and GM 2.
+
+    As in begin_draft, the general managers take turns and a general manager
+    stops drafting when their team is full or can no longer be completed.
+    """
+
+    pool = list(players)
+    price_index = PriceIndex(pool)
+    gms = [init_player(), init_player()]
+    pickers = [strategy(pool) for strategy in strategies]
+    selecting = [True, True]
+
+    while selecting[0] or selecting[1]:
+        for i, gm in enumerate(gms):
+            if not selecting[i]:
+                continue
+            player = ""
+            if can_create_team(gm, pool, price_index):
+                player = pickers[i].pick(gm, pool, price_index, rng)
+            if player == "":
+                selecting[i] = False
+                continue
+            if not can_draft(gm, player, price_index):
+                raise ValueError(
+                    f"{type(pickers[i]).__name__} picked {player}, "
+                    f"which GM {i + 1} cannot draft"
+                )
+            pool.remove(player)
+            price_index.remove(player)
+            draft_player(gm, player)
+            selecting[i] = players_selected(gm) != PLAYERS_TO_SELECT
+
+    return compute_gm_score(gms[0]), compute_gm_score(gms[1])
+
+
+class DraftSummary:
+    """Win counts and score distributions over a number of drafts.
+
+    As in begin_draft, GM 1 only wins with a strictly higher score; equal
+    scores are counted as ties.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a summary of no drafts."""
+
+        self.drafts = 0
+        self.wins = [0, 0]
+        self.ties = 0
+        self.score_sums = [0.0, 0.0]
+        self.score_squares = [0.0, 0.0]
+        self.histograms = [Counter(), Counter()]
+
+    def add(self, scores: tuple[float, float]) -> None:
+        """Add a draft where GM 1 and GM 2 scored scores."""
+
+        self.drafts += 1
+        if scores[0] > scores[1]:
+            self.wins[0] += 1
+        elif scores[1] > scores[0]:
+            self.wins[1] += 1
+        else:
+            self.ties += 1
+        for i, score in enumerate(scores):
+            self.score_sums[i] += score
+            self.score_squares[i] += score * score
+            self.histograms[i][int(score // HISTOGRAM_BIN) * HISTOGRAM_BIN] += 1
+
+    def merge(self, other: "DraftSummary") -> None:
+        """Add every draft in other to this summary."""
+
+        self.drafts += other.drafts
+        self.ties += other.ties
+        for i in range(2):
+            self.wins[i] += other.wins[i]
+            self.score_sums[i] += other.score_sums[i]
+            self.score_squares[i] += other.score_squares[i]
+            self.histograms[i].update(other.histograms[i])
+
+    def win_rate(self, gm: int) -> float:
+        """Return the fraction of drafts won by GM gm + 1."""
+
+        return self.wins[gm] / self.drafts if self.drafts else 0.0
+
+    def mean(self, gm: int) -> float:
+        """Return the mean fantasy score of GM gm + 1."""
+
+        return self.score_sums[gm] / self.drafts if self.drafts else 0.0
+
+    def stdev(self, gm: int) -> float:
+        """Return the standard deviation of the fantasy score of GM gm + 1."""
+
+        if not self.drafts:
+            return 0.0
+        variance = self.score_squares[gm] / self.drafts - self.mean(gm) ** 2
+        return math.sqrt(max(variance, 0.0))
+
+
+# The players and strategies of the drafts played by this worker process
+_worker_state = {}
+
+
+def _init_worker(players: list[str], strategies: tuple[type, type]) -> None:
+    """Store the draft setup in this worker so tasks do not resend it."""
+
+    _worker_state["players"] = players
+    _worker_state["strategies"] = strategies
+
+
+def _run_chunk(task: tuple[int, int]) -> DraftSummary:
+    """Play task[1] drafts with a random generator seeded with task[0] and
+    return their summary.
+    """
+
+    seed, drafts = task
+    rng = random.Random(seed)
+    summary = DraftSummary()
+    for _ in range(drafts):
+        summary.add(run_draft(_worker_state["players"],
+                              _worker_state["strategies"], rng))
+    return summary
+
+
+def simulate(players: list[str], strategies: tuple[type, type], drafts: int,
+             processes: int | None = None, seed: int = 0,
+             chunk_size: int = CHUNK_SIZE) -> Iterator[DraftSummary]:
+    """Play drafts drafts over players with strategies across processes
+    worker processes (all cores if None), yielding the running summary each
+    time a chunk of chunk_size drafts completes.
+
+    Every chunk has its own random generator, seeded from seed and the chunk
+    number, so the final summary only depends on seed and chunk_size, not on
+    how chunks are scheduled across workers.
+    """
+
+    tasks = []
+    for chunk, start in enumerate(range(0, drafts, chunk_size)):
+        tasks.append((seed * 1_000_003 + chunk,
+                      min(chunk_size, drafts - start)))
+
+    total = DraftSummary()
+    if processes == 1:
+        _init_worker(players, strategies)
+        for task in tasks:
+            total.merge(_run_chunk(task))
+            yield total
+        return
+
+    with Pool(processes, initializer=_init_worker,
+              initargs=(players, strategies)) as pool:
+        for summary in pool.imap_unordered(_run_chunk, tasks):
+            total.merge(summary)
+            yield total
+
+
+def _format_summary(summary: DraftSummary) -> str:
+    """Return a one line report of summary."""
+
+    return (
+        f"drafts={summary.drafts} "
+        f"gm1_win_rate={summary.win_rate(0):.4f} "
+        f"gm2_win_rate={summary.win_rate(1):.4f} "
+        f"ties={summary.ties} "
+        f"gm1_score={summary.mean(0):.2f}+/-{summary.stdev(0):.2f} "
+        f"gm2_score={summary.mean(1):.2f}+/-{summary.stdev(1):.2f}"
+    )
+
+
+def main() -> None:
+    """Run the simulator from the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", default="players.txt")
+    parser.add_argument("--drafts", type=int, default=10000)
+    parser.add_argument("--gm1", choices=STRATEGIES, default="random")
+    parser.add_argument("--gm2", choices=STRATEGIES, default="random")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    strategies = (STRATEGIES[args.gm1], STRATEGIES[args.gm2])
+    summary = DraftSummary()
+    players, _ = load_players(args.players)
+    for summary in simulate(players, strategies,
+                            args.drafts, args.processes, args.seed,
+                            args.chunk_size):
+        print(_format_summary(summary), flush=True)
+
+    for i in range(2):
+        print(f"GM {i + 1} score distribution:")
+        for low, count in sorted(summary.histograms[i].items()):
+            print(f"  {low:>5}-{low + HISTOGRAM_BIN:<5} {count}")
+
+
+if __name__ == "__main__":
+    main()
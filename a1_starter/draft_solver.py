@@ -0,0 +1,205 @@
+"""An optimizing computer general manager.
+
+DraftSolver finds the highest scoring team a general manager can still
+complete from the players that are left, and picks one of its players. This
+is a knapsack problem with a budget and a required number of players per
+position, solved with dynamic programming.
+
+The dynamic programming table is kept per position and per player, in order
+of increasing fantasy score. When a player is drafted, only the rows from
+that player onwards are recomputed on the next pick, and since strong players
+are drafted first those rows are usually few.
+"""
+
+import copy
+from math import gcd
+
+import fantasy_draft_functions as df
+from price_index import POSITIONS_NEEDED, GM_POSITION_KEYS
+
+from constants import (
+    BUDGET,
+    FORWARD,
+    DEFENCEMEN,
+    GOALIE
+)
+
+# Score of a team that cannot be completed
+IMPOSSIBLE = float("-inf")
+
+
+class _PositionTable:
+    """The dynamic programming table for the players of one position.
+
+    rows[i][k][b] is the best total fantasy score of exactly k players chosen
+    from the first i players, costing at most b budget units, or IMPOSSIBLE.
+    Rows past len(rows) - 1 are stale and rebuilt by refresh.
+    """
+
+    def __init__(self, players: list[str], max_count: int, units: int,
+                 unit: int) -> None:
+        """Initialize a table for players, choosing up to max_count of them
+        with up to units budget units of size unit.
+        """
+
+        self.players = sorted(players, key=df.compute_fantasy_score)
+        self.max_count = max_count
+        self.units = units
+        self.unit = unit
+        first = [[0.0] * (units + 1)]
+        first.extend([IMPOSSIBLE] * (units + 1) for _ in range(max_count))
+        self.rows = [first]
+
+    def copy(self) -> "_PositionTable":
+        """Return a copy of this table that players can be removed from
+        independently. Rows are never changed once built, so they are shared.
+        """
+
+        table = copy.copy(self)
+        table.players = self.players[:]
+        table.rows = self.rows[:]
+        return table
+
+    def remove(self, player: str) -> None:
+        """Remove player from this table, marking the rows after it stale."""
+
+        index = self.players.index(player)
+        del self.players[index]
+        del self.rows[index + 1:]
+
+    def refresh(self) -> None:
+        """Rebuild the stale rows of this table."""
+
+        for i in range(len(self.rows) - 1, len(self.players)):
+            record = df.parse_player(self.players[i])
+            score = df.compute_fantasy_score(record)
+            cost = record.price // self.unit
+            previous = self.rows[i]
+            row = [previous[0][:]]
+            for k in range(1, self.max_count + 1):
+                taken = previous[k - 1]
+                counts = previous[k][:]
+                for b in range(cost, self.units + 1):
+                    candidate = taken[b - cost] + score
+                    if candidate > counts[b]:
+                        counts[b] = candidate
+                row.append(counts)
+            self.rows.append(row)
+
+    def best(self, count: int) -> list[float]:
+        """Return the best score of count players for each budget unit."""
+
+        return self.rows[-1][count]
+
+    def choose(self, count: int, units: int) -> list[str]:
+        """Return the players that make up best(count)[units]."""
+
+        chosen = []
+        for i in range(len(self.players), 0, -1):
+            if count == 0:
+                break
+            if self.rows[i][count][units] != self.rows[i - 1][count][units]:
+                chosen.append(self.players[i - 1])
+                count -= 1
+                units -= df.get_price(self.players[i - 1]) // self.unit
+        return chosen
+
+
+class DraftSolver:
+    """Picks the player that leads to the highest scoring legal team.
+
+    The solver follows the pool of available players passed to best_pick, so
+    it can be shared by any number of general managers in the same draft.
+    """
+
+    def __init__(self, players: list[str]) -> None:
+        """Initialize a solver for a draft over the player pool players."""
+
+        self.unit = BUDGET
+        for player in players:
+            self.unit = gcd(self.unit, df.get_price(player))
+        self.unit = max(self.unit, 1)
+        units = BUDGET // self.unit
+
+        self.available = set(players)
+        self.tables = {}
+        for position, needed in POSITIONS_NEEDED.items():
+            position_players = [p for p in players
+                                if df.get_position(p) == position]
+            self.tables[position] = _PositionTable(position_players, needed,
+                                                   units, self.unit)
+
+    def copy(self) -> "DraftSolver":
+        """Return a solver for a new draft over the players this solver has
+        left. The tables are built once, here, and shared with the copy, so
+        copying a solver is much faster than initializing one.
+        """
+
+        solver = copy.copy(self)
+        solver.available = set(self.available)
+        solver.tables = {}
+        for position, table in self.tables.items():
+            table.refresh()
+            solver.tables[position] = table.copy()
+        return solver
+
+    def _sync(self, players: list[str]) -> None:
+        """Remove every player that is no longer in players from the tables.
+        """
+
+        if len(players) == len(self.available):
+            return
+        remaining = set(players)
+        for player in self.available - remaining:
+            self.tables[df.get_position(player)].remove(player)
+        self.available = remaining
+
+    def best_team(self, gm: dict, players: list[str]) -> list[str]:
+        """Return the highest scoring players from players that gm can still
+        draft to complete their team, or [] if gm cannot complete a team.
+        """
+
+        self._sync(players)
+        units = min(gm["budget"], BUDGET) // self.unit
+        if units < 0:
+            return []
+
+        needed = {}
+        for position, table in self.tables.items():
+            table.refresh()
+            needed[position] = (POSITIONS_NEEDED[position]
+                                - gm[GM_POSITION_KEYS[position]])
+
+        forwards = self.tables[FORWARD].best(needed[FORWARD])
+        defence = self.tables[DEFENCEMEN].best(needed[DEFENCEMEN])
+        goalies = self.tables[GOALIE].best(needed[GOALIE])
+
+        best_score, split = IMPOSSIBLE, None
+        for forward_units in range(units + 1):
+            for defence_units in range(units - forward_units + 1):
+                goalie_units = units - forward_units - defence_units
+                score = (forwards[forward_units] + defence[defence_units]
+                         + goalies[goalie_units])
+                if score > best_score:
+                    best_score = score
+                    split = (forward_units, defence_units, goalie_units)
+
+        if split is None:
+            return []
+        team = []
+        for position, position_units in zip((FORWARD, DEFENCEMEN, GOALIE),
+                                            split):
+            team.extend(self.tables[position].choose(needed[position],
+                                                     position_units))
+        return team
+
+    def best_pick(self, gm: dict, players: list[str]) -> str:
+        """Return the player from players that gm should draft next: the
+        highest scoring player of best_team. Return the empty string if gm
+        cannot complete a team.
+        """
+
+        team = self.best_team(gm, players)
+        if not team:
+            return ""
+        return max(team, key=df.compute_fantasy_score)
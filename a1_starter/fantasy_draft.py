@@ -1,5 +1,7 @@
-import random
 import fantasy_draft_functions as df
+from availability import AvailablePlayers, available_from_string
+from draft_solver import DraftSolver
+from price_index import PriceIndex
 
 from constants import (
     POINTS_PER_GOAL,
@@ -68,27 +70,58 @@ def compute_gm_score(gm_info: dict) -> float:
     return score
 
 
-def can_create_team(gm: dict, players: list[str]) -> bool:
+def can_create_team(
+    gm: dict, players: list[str], price_index: PriceIndex | None = None
+) -> bool:
     """Return True if and only if the user can select a future player 
     without exceeding the maxmimum per position.
+
+    If price_index is given, it must index exactly the players in players
+    and is used instead of sorting players.
     """
 
-    forward_prices = [df.get_price(p) for p in players]
-    defence_prices = [df.get_price(p) for p in players if df.get_position(p) == DEFENCEMEN]
-    goalie_prices = [df.get_price(p) for p in players if df.get_position(p) == GOALIE]
+    if price_index is None:
+        price_index = PriceIndex(players)
+    return price_index.can_complete(gm)
+
 
-    forward_prices = sorted(forward_prices)
-    defence_prices = sorted(defence_prices)
-    goalie_prices = sorted(goalie_prices)
+def can_draft(gm: dict, player: str, price_index: PriceIndex) -> bool:
+    """Return True if and only if gm can draft player: gm has room for
+    player's position, can afford player, and can still complete a team
+    afterwards from the players in price_index.
+    """
 
     return (
-        sum(forward_prices[: FORWARDS_NEEDED - gm["num_forwards"]])
-        + sum(defence_prices[: DEFENCEMEN_NEEDED - gm["num_defence"]])
-        + sum(goalie_prices[: GOALIES_NEEDED - gm["num_goalies"]])
-        <= gm["budget"]
+        df.can_select(
+            player,
+            gm["num_forwards"],
+            gm["num_defence"],
+            gm["num_goalies"],
+        )
+        and df.can_afford(gm["budget"], player)
+        and price_index.can_complete(gm, pick=player)
     )
 
 
+def draft_player(gm: dict, player: str) -> None:
+    """Add player to the team of gm and update gm's budget and
+    position counts.
+    """
+
+    gm["team"] = df.add_to_team(player, gm["team"])
+
+    gm["budget"] = df.update_budget(gm["budget"], player)
+    position = df.get_position(player)
+    if position == FORWARD:
+        gm["num_forwards"] += 1
+    elif position == DEFENCEMEN:
+        gm["num_defence"] += 1
+    else:
+        gm["num_goalies"] += 1
+
+    gm["players"].append(player)
+
+
 def interactive_select_player(
     gm: dict,
     player_ids: list[str],
@@ -97,64 +130,62 @@ def interactive_select_player(
     computer: bool = False,
 ) -> str:
     """Prompt the user to select a player. Return the updated all_players.
+
+    The selected player is also removed from player_ids and players. This
+    is select_player for the '_' separated string form of the available
+    players.
     """
+    available = available_from_string(players, all_players)
+    selected_player = select_player(gm, available, computer)
+    players.remove(gm["players"][-1])
+    player_ids.remove(selected_player)
+    return df.remove_player(all_players, all_players.index(selected_player) + 3)
+
+
+def select_player(
+    gm: dict,
+    available: AvailablePlayers,
+    computer: bool = False,
+    solver: DraftSolver | None = None,
+    price_index: PriceIndex | None = None,
+) -> str:
+    """Prompt the user to select a player from available, draft them for gm
+    and remove them from available. Return the id of the selected player.
+
+    If computer is True, the computer selects instead: the pick of solver if
+    one is given and it can complete a team, otherwise a random player.
+    If price_index is given, it must index exactly the players in available,
+    and the selected player is removed from it.
+    """
+    if price_index is None:
+        price_index = PriceIndex(available.players())
     has_selected = False
     while not has_selected:
         if not computer:
             selected_player = input("Player or Command: ")
             if selected_player == "available_players":
-                for p in players:
+                for p in available.players():
                     print("=" * 50)
                     print(f"Player: {p}")
                 continue
         else:
-            selected_player = player_ids[random.randint(0, len(player_ids) - 1)]
-
-        if df.is_player_available(selected_player, players_available=all_players):
-            index = player_ids.index(selected_player)
-            player_info = players[index]
-
-            players_copy = players.copy()
-            gm_copy = gm.copy()
-            players_copy.remove(player_info)
-            position = df.get_position(player_info)
-            if position == FORWARD:
-                gm_copy["num_forwards"] += 1
-            elif position == DEFENCEMEN:
-                gm_copy["num_defence"] += 1
-            else:
-                gm_copy["num_goalies"] += 1
-            gm_copy["budget"] = df.update_budget(gm_copy["budget"], player_info)
-
-            if (
-                df.can_select(
-                    player_info,
-                    gm["num_forwards"],
-                    gm["num_defence"],
-                    gm["num_goalies"],
+            selected_player = ""
+            if solver is not None:
+                selected_player = df.get_player_id(
+                    solver.best_pick(gm, available.players())
                 )
-                and df.can_afford(gm["budget"], player_info)
-                and can_create_team(gm_copy, players_copy)
-            ):
+            if selected_player == "":
+                selected_player = available.random_id()
+
+        if selected_player in available:
+            player_info = available.player(selected_player)
+
+            if can_draft(gm, player_info, price_index):
 
                 has_selected = True
-                players.remove(player_info)
-                player_ids.remove(selected_player)
-                all_players = df.remove_player(
-                    all_players, all_players.index(selected_player) + 3
-                )
-                gm["team"] = df.add_to_team(player_info, gm["team"])
-
-                gm["budget"] = df.update_budget(gm["budget"], player_info)
-                position = df.get_position(player_info)
-                if position == FORWARD:
-                    gm["num_forwards"] += 1
-                elif position == DEFENCEMEN:
-                    gm["num_defence"] += 1
-                else:
-                    gm["num_goalies"] += 1
-
-                gm["players"].append(player_info)
+                available.remove(selected_player)
+                price_index.remove(player_info)
+                draft_player(gm, player_info)
             else:
                 if not computer:
                     print(
@@ -172,11 +203,14 @@ def interactive_select_player(
     if computer:
         print(f"Computer has selected {selected_player}")
 
-    return all_players
+    return selected_player
 
 
 def begin_draft(players: list[str], all_players: str) -> None:
     """ Play the Game!
+
+    players holds the stat strings of every player, and all_players the
+    '_' separated ids of the players that are available to draft.
     """
 
     print("=" * 50)
@@ -185,16 +219,20 @@ def begin_draft(players: list[str], all_players: str) -> None:
     print("Please select a mode:")
     print("0 : Computer")
     print("1 : Multiplayer")
+    print("2 : Computer (optimal)")
 
     correct_mode = False
     while not correct_mode:
         mode = input("Mode: ")
-        if mode not in ["0", "1"]:
-            print("Incorrect mode. Please select either 0 or 1")
+        if mode not in ["0", "1", "2"]:
+            print("Incorrect mode. Please select either 0, 1 or 2")
         else:
             correct_mode = True
 
-    player_ids = [df.get_player_id(p) for p in players]
+    available = available_from_string(players, all_players)
+    players = available.players()
+    solver = DraftSolver(players) if mode == "2" else None
+    price_index = PriceIndex(players)
 
     gm1 = init_player()
     gm2 = init_player()
@@ -207,10 +245,8 @@ def begin_draft(players: list[str], all_players: str) -> None:
         gm1_score = compute_gm_score(gm1)
         display_move_prompt("GM 1", player_score=gm1_score, gm=gm1)
 
-        if can_create_team(gm1, players):
-            all_players = interactive_select_player(
-                gm1, player_ids, players, all_players
-            )
+        if price_index.can_complete(gm1):
+            select_player(gm1, available, price_index=price_index)
         else:
             print("You blew your budget....")
             print("You will be playing shorthanded!")
@@ -219,9 +255,9 @@ def begin_draft(players: list[str], all_players: str) -> None:
         if mode == "1":
             gm2_score = compute_gm_score(gm2)
             display_move_prompt("GM 2", player_score=gm2_score, gm=gm2)
-            if can_create_team(gm2, players):
-                all_players = interactive_select_player(
-                    gm2, player_ids, players, all_players
+            if price_index.can_complete(gm2):
+                select_player(
+                    gm2, available, price_index=price_index
                 )
             else:
                 print("You blew your budget....")
@@ -230,9 +266,10 @@ def begin_draft(players: list[str], all_players: str) -> None:
         else:
             gm2_score = compute_gm_score(gm2)
             display_move_prompt("Computer", player_score=gm2_score, gm=gm2)
-            if can_create_team(gm2, players):
-                all_players = interactive_select_player(
-                    gm2, player_ids, players, all_players, computer=True
+            if price_index.can_complete(gm2):
+                select_player(
+                    gm2, available, computer=True, solver=solver,
+                    price_index=price_index
                 )
             else:
                 print("You blew your budget....")
@@ -278,23 +315,10 @@ if __name__ == "__main__":
     import doctest
 
     doctest.testmod()
-    import os
+    from player_loader import load_players
 
     DATA_FILE = "players.txt"
 
-    PLAYERS = []
-    ALL_PLAYERS_STRING = ""
-    with open(DATA_FILE, encoding="utf-8") as data_file:
-        for line in data_file:
-            if line == "\n":
-                continue
-            player_name, player_info = line.split(":")
-            player_name, player_info = player_name.strip(), player_info.strip()
-
-            ids = player_info.split("_")
-            player_id = ids[0]
-            ALL_PLAYERS_STRING = ALL_PLAYERS_STRING + player_id + "_"
-            PLAYERS.append(player_info)
+    PLAYERS, ALL_PLAYERS_STRING = load_players(DATA_FILE)
 
     begin_draft(PLAYERS, ALL_PLAYERS_STRING)
-
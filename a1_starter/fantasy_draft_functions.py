@@ -12,6 +12,9 @@ Diane Horton, Michael Liut, Jacqueline Smith, and Anya Tafliovich.
 
 """
 
+from functools import lru_cache
+from typing import NamedTuple
+
 from constants import (
     POINTS_PER_GOAL,
     POINTS_PER_ASSIST,
@@ -31,8 +34,90 @@ from constants import (
 )
 
 
+class PlayerRecord(NamedTuple):
+    """A player stat string from players.txt, parsed once.
+
+    Skaters have goals, assists, dcs and hits; goalies have gaa and sv.
+    The stats that do not apply to a position are 0.
+
+    >>> record = PlayerRecord('MGO', 'D', 0, 14, 43, 70, 0.0, 0.0, 5)
+    >>> record.position
+    'D'
+    >>> record.price
+    5
+    """
+
+    player_id: str
+    position: str
+    goals: int
+    assists: int
+    dcs: int
+    hits: int
+    gaa: float
+    sv: float
+    price: int
+
+
+EMPTY_PLAYER = PlayerRecord('', '', 0, 0, 0, 0, 0.0, 0.0, 0)
+
+# Number of most recently used player strings whose records parse_player
+# keeps, so that huge player pools do not stay in memory
+PARSE_CACHE_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_player(player: str) -> PlayerRecord:
+    """Return the PlayerRecord for the player string player.
+
+    The records of the PARSE_CACHE_SIZE most recently used player strings
+    are kept, and later calls with those strings return the same record.
+
+    Precondition: player is the string of player stats as
+    seen in players.txt or the empty string
+
+    >>> parse_player('MGO_PD_G0-_A14_DC43_H70_Pr5-').assists
+    14
+    >>> parse_player('CLA_PG_GAA2.23_SV0.910_Pr20').sv
+    0.91
+    >>> parse_player('') is EMPTY_PLAYER
+    True
+
+    """
+    if player == '':
+        return EMPTY_PLAYER
+
+    position = player[5]
+    price = int(player[-2:].strip("-"))
+    if position == GOALIE:
+        record = PlayerRecord(player[:3], position, 0, 0, 0, 0,
+                              float(player[10:14]), float(player[17:22]),
+                              price)
+    else:
+        record = PlayerRecord(player[:3], position,
+                              int(player[8:10].strip("-")),
+                              int(player[12:14].strip("-")),
+                              int(player[17:19].strip("-")),
+                              int(player[21:23].strip("-")),
+                              0.0, 0.0, price)
+    return record
+
+
+def as_record(player: str | PlayerRecord) -> PlayerRecord:
+    """Return player as a PlayerRecord, parsing it if it is a player string.
+
+    >>> as_record('MGO_PD_G0-_A14_DC43_H70_Pr5-').player_id
+    'MGO'
+    >>> as_record(EMPTY_PLAYER) is EMPTY_PLAYER
+    True
+
+    """
+    if isinstance(player, PlayerRecord):
+        return player
+    return parse_player(player)
+
+
 # provided
-def get_player_id(player: str) -> str:
+def get_player_id(player: str | PlayerRecord) -> str:
     """Return the id of player if the string is non-empty;
     otherwise return the empty string.
 
@@ -45,9 +130,13 @@ def get_player_id(player: str) -> str:
     'NSH'
     >>> get_player_id('')
     ''
+    >>> get_player_id(parse_player('CLA_PG_GAA2.23_SV0.910_Pr20'))
+    'CLA'
 
     """
 
+    if isinstance(player, PlayerRecord):
+        return player.player_id
     return player[:3]
 
 
@@ -76,7 +165,7 @@ def is_player_available(player: str, players_available: str) -> bool:
 
 
 # provided
-def get_position(player: str) -> str:
+def get_position(player: str | PlayerRecord) -> str:
     """Return the position of player if player is non-empty;
     otherwise return the empty string.
 
@@ -91,15 +180,19 @@ def get_position(player: str) -> str:
     'G'
     >>> get_position('')
     ''
+    >>> get_position(parse_player('CLA_PG_GAA2.23_SV0.910_Pr20'))
+    'G'
 
     """
 
+    if isinstance(player, PlayerRecord):
+        return player.position
     if len(player) == 0:
         return ""
     return player[5]
 
 
-def get_price(player: str) -> int:
+def get_price(player: str | PlayerRecord) -> int:
     """Returns the price of player if player is non empty;
       Otherwise return 0.
 
@@ -111,12 +204,11 @@ def get_price(player: str) -> int:
     0
 
     """
-    if player == '':
-        return 0
-    return int(player[-2:].strip("-"))
+    return as_record(player).price
 
 
-def can_select(player: str, forwards_drafted: int, defence_drafted: int, goalies_drafted: int) -> bool:
+def can_select(player: str | PlayerRecord, forwards_drafted: int,
+               defence_drafted: int, goalies_drafted: int) -> bool:
     """Return True if player can be selected without 
     exceeding the maximum amount of forwards_drafted,
     defence_drafted, and goalies_drafted, 
@@ -131,18 +223,19 @@ def can_select(player: str, forwards_drafted: int, defence_drafted: int, goalies
     True
 
     """
-    if player == '':
-        return True
-    if get_position(player) == FORWARD and forwards_drafted < FORWARDS_NEEDED:
-        return True
-    if get_position(player) == DEFENCEMEN and defence_drafted < DEFENCEMEN_NEEDED:
-        return True
-    if get_position(player) == GOALIE and goalies_drafted < GOALIES_NEEDED:
+    position = get_position(player)
+    if position == '':
         return True
+    if position == FORWARD:
+        return forwards_drafted < FORWARDS_NEEDED
+    if position == DEFENCEMEN:
+        return defence_drafted < DEFENCEMEN_NEEDED
+    if position == GOALIE:
+        return goalies_drafted < GOALIES_NEEDED
     return False
 
 
-def can_afford(budget: int, player: str) -> bool:
+def can_afford(budget: int, player: str | PlayerRecord) -> bool:
     """Return True if the player can be afforded with the current budget;
     otherwise return False.
 
@@ -155,7 +248,7 @@ def can_afford(budget: int, player: str) -> bool:
     return (budget - get_price(player)) >= 0
 
 
-def update_budget(budget: int, player: str) -> int:
+def update_budget(budget: int, player: str | PlayerRecord) -> int:
     """Return the budget after drafting a player.
 
     >>> update_budget(50,"CLA_PG_GAA2.23_SV0.910_Pr20")
@@ -195,14 +288,16 @@ def remove_player(players: str, index: int) -> str:
     'DOL_NCA_MGO_AHS_'
     >>> remove_player('DOL_NCA_MGO_AHS_', 20)
     'DOL_NCA_MGO_AHS_'
+    >>> remove_player('DOL_NCA_MGO_AHS_', 3)
+    'NCA_MGO_AHS_'
 
     """
-    if 0 <= index <= len(players) and players[index] == "_":
-        return players.replace(players[index - 4:index], '')
+    if 3 <= index < len(players) and players[index] == "_":
+        return players[:index - 3] + players[index + 1:]
     return players
 
 
-def compute_dc_points(player: str) -> int:
+def compute_dc_points(player: str | PlayerRecord) -> int:
     """Return defensive contribution (DC) points of 
     the player in player string if player is non-empty and a skater;
     otherwise return 0.
@@ -217,14 +312,15 @@ def compute_dc_points(player: str) -> int:
     0
 
     """
-    if get_position(player) == DEFENCEMEN:
-        return int(player[17:19].strip("-")) // D_DCS_PER_POINT
-    if get_position(player) == FORWARD:
-        return int(player[17:19].strip("-")) // F_DCS_PER_POINT
+    record = as_record(player)
+    if record.position == DEFENCEMEN:
+        return record.dcs // D_DCS_PER_POINT
+    if record.position == FORWARD:
+        return record.dcs // F_DCS_PER_POINT
     return 0
 
 
-def compute_goal_points(player: str) -> int:
+def compute_goal_points(player: str | PlayerRecord) -> int:
     """Return goal points of the player in player string 
     if player is non-empty and a skater;
     otherwise return 0.
@@ -239,12 +335,13 @@ def compute_goal_points(player: str) -> int:
     0
 
     """
-    if get_position(player) == DEFENCEMEN or get_position(player) == FORWARD:
-        return int(player[8:10].strip("-")) * POINTS_PER_GOAL
+    record = as_record(player)
+    if record.position in (DEFENCEMEN, FORWARD):
+        return record.goals * POINTS_PER_GOAL
     return 0
 
 
-def compute_assist_points(player: str) -> int:
+def compute_assist_points(player: str | PlayerRecord) -> int:
     """Return assist points of the player in player string 
     if player is non-empty and a skater;
     otherwise return 0.
@@ -259,12 +356,13 @@ def compute_assist_points(player: str) -> int:
     0
 
     """
-    if get_position(player) == DEFENCEMEN or get_position(player) == FORWARD:
-        return int(player[12:14].strip("-")) * POINTS_PER_ASSIST
+    record = as_record(player)
+    if record.position in (DEFENCEMEN, FORWARD):
+        return record.assists * POINTS_PER_ASSIST
     return 0
 
 
-def compute_hit_points(player: str) -> float:
+def compute_hit_points(player: str | PlayerRecord) -> float:
     """Return hit points of the player in player string 
     if player is non-empty and a skater;
     otherwise return 0.
@@ -279,12 +377,13 @@ def compute_hit_points(player: str) -> float:
     0
 
     """
-    if get_position(player) == DEFENCEMEN or get_position(player) == FORWARD:
-        return int(player[21:23].strip("-")) * POINTS_PER_HIT
+    record = as_record(player)
+    if record.position in (DEFENCEMEN, FORWARD):
+        return record.hits * POINTS_PER_HIT
     return 0
 
 
-def compute_fantasy_score(player: str) -> float:
+def compute_fantasy_score(player: str | PlayerRecord) -> float:
     """Return the fantasy score of the player in player string 
     if player is non-empty;
     otherwise return 0.
@@ -297,15 +396,15 @@ def compute_fantasy_score(player: str) -> float:
     72.5
     >>> compute_fantasy_score('')
     0
+    >>> compute_fantasy_score(parse_player('AMP_PF_G10_A10_DC51_H30_Pr10'))
+    72.5
 
     """
-    if get_position(player) != GOALIE:
-        return compute_goal_points(player) + compute_assist_points(player) + compute_hit_points(player) + compute_dc_points(player)
-    if get_position(player) == GOALIE:
-        sv = float(player[17:22])
-        gaa = float(player[10:14])
-        return SV_VALUE * sv - GAA_VALUE * gaa
-    return 0
+    record = as_record(player)
+    if record.position == GOALIE:
+        return SV_VALUE * record.sv - GAA_VALUE * record.gaa
+    return (compute_goal_points(record) + compute_assist_points(record)
+            + compute_hit_points(record) + compute_dc_points(record))
 
 
 if __name__ == "__main__":
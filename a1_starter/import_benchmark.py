@@ -0,0 +1,182 @@
+"""Benchmark of the import time of the bundled PyTA.
+
+Imports python_ta in fresh interpreters with -X importtime, and reports the
+fastest cumulative import time of python_ta and of the modules it imports
+that take longest, along with the wall time of `python -m python_ta
+--version`. Results are written as JSON so runs from different commits can
+be compared.
+
+Importing python_ta must not import the modules in DEFERRED, which are only
+imported once they are needed. The benchmark fails if any of them is
+imported, or if python_ta takes more than --tolerance longer to import than
+in the results compared with.
+
+Usage:
+    python import_benchmark.py --output before.json
+    python import_benchmark.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from checker_generic import PYTA_DIR
+
+# Number of fresh interpreters each measurement is repeated in; the fastest
+# repeat is reported
+REPEATS = 5
+
+# Number of modules with the longest import times to report
+TOP_MODULES = 15
+
+# Modules that importing python_ta must leave for the code using them to
+# import
+DEFERRED = (
+    "dill",
+    "doctest",
+    "graphviz",
+    "isort",
+    "jinja2",
+    "pycodestyle",
+    "pygments.lexers",
+    "python_ta.contracts",
+    "python_ta.upload",
+    "requests",
+    "subprocess",
+    "tomlkit",
+    "typeguard",
+    "webbrowser",
+    "z3",
+)
+
+_LIST_DEFERRED = (
+    "import json, sys, python_ta; "
+    f"print(json.dumps([m for m in {DEFERRED!r} if m in sys.modules]))"
+)
+
+
+def _run(args: list[str]) -> subprocess.CompletedProcess:
+    """Return the result of running python with args, with PyTA importable.
+    """
+
+    env = dict(os.environ, PYTHONPATH=PYTA_DIR)
+    return subprocess.run([sys.executable, *args], env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def _commit() -> str:
+    """Return the current git commit, or the empty string outside git."""
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _import_times() -> dict[str, int]:
+    """Return the cumulative import time of each module imported by
+    python_ta, in microseconds, as reported by -X importtime.
+    """
+
+    stderr = _run(["-X", "importtime", "-c", "import python_ta"]).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def run_benchmark() -> dict:
+    """Return the import times of python_ta and its slowest modules, the
+    wall time of `python -m python_ta --version`, and the DEFERRED modules
+    imported by python_ta.
+    """
+
+    best = {}
+    for _ in range(REPEATS):
+        for module, micros in _import_times().items():
+            best[module] = min(micros, best.get(module, micros))
+
+    version_times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        _run(["-m", "python_ta", "--version"])
+        version_times.append(time.perf_counter() - start)
+
+    top = sorted((module for module in best if module != "python_ta"),
+                 key=best.get, reverse=True)[:TOP_MODULES]
+    results = {
+        "python_ta_import_us": best["python_ta"],
+        "version_seconds": min(version_times),
+        "slowest_modules_us": {module: best[module] for module in top},
+        "deferred_imported": json.loads(
+            _run(["-c", _LIST_DEFERRED]).stdout),
+    }
+
+    print(f"{'import python_ta':<40} {best['python_ta'] / 1000:>9.1f} ms")
+    print(f"{'python -m python_ta --version':<40} "
+          f"{results['version_seconds'] * 1000:>9.1f} ms")
+    for module in top:
+        print(f"  {module:<38} {best[module] / 1000:>9.1f} ms")
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> bool:
+    """Print how the import time in results changed relative to baseline,
+    and return whether it is at most tolerance slower.
+    """
+
+    before = baseline["results"]["python_ta_import_us"]
+    ratio = results["python_ta_import_us"] / before
+    print(f"\nCompared with {baseline.get('commit', '')[:12] or 'baseline'}:"
+          f" {ratio:.2f}x")
+    return ratio <= 1 + tolerance
+
+
+def main() -> None:
+    """Run the benchmark from the command line, exiting with status 1 if it
+    finds a regression.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="import_results.json")
+    parser.add_argument("--compare", metavar="JSON",
+                        help="results of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="fraction by which the import time may exceed "
+                             "that of the compared results")
+    args = parser.parse_args()
+
+    report = {
+        "commit": _commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": run_benchmark(),
+    }
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+
+    passed = True
+    if report["results"]["deferred_imported"]:
+        print("\nImported by python_ta: "
+              + ", ".join(report["results"]["deferred_imported"]))
+        passed = False
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline:
+            passed = compare(report["results"], json.load(baseline),
+                             args.tolerance) and passed
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""Loading players files such as players.txt.
+
+Each line of a players file is a player name, a ':' and the player's stat
+string, for example 'Matt Gologow: MGO_PD_G0-_A14_DC43_H70_Pr5-'. Stat
+strings have a fixed width, so after a file has been read and validated
+once, its stat strings are saved to a binary sidecar cache next to it as
+fixed-width records. Later loads map the cache into memory instead of
+parsing the file again, as long as the file has not changed.
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import struct
+
+# Width of a skater stat string; goalie stat strings are padded with a
+# space to the same width in the cache
+RECORD_WIDTH = 28
+
+CACHE_SUFFIX = ".cache"
+CACHE_MAGIC = b"PLYR"
+CACHE_VERSION = 1
+
+# magic, version, record width, record count, source mtime in nanoseconds,
+# source size, source SHA-256
+_HEADER = struct.Struct("<4sHHQqQ32s")
+
+SKATER_PATTERN = re.compile(
+    rb"[A-Za-z0-9]{3}_P[FD]_G\d[\d-]_A\d[\d-]_DC\d[\d-]_H\d[\d-]_Pr\d[\d-]"
+)
+GOALIE_PATTERN = re.compile(
+    rb"[A-Za-z0-9]{3}_PG_GAA\d\.\d\d_SV\d\.\d{3}_Pr\d[\d-]"
+)
+
+
+class PlayerFileError(ValueError):
+    """A line of a players file is not a valid player."""
+
+
+def _file_hash(filename: str) -> bytes:
+    """Return the SHA-256 digest of the contents of filename."""
+
+    digest = hashlib.sha256()
+    with open(filename, "rb") as source:
+        for block in iter(lambda: source.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def _parse_records(filename: str) -> bytes:
+    """Return the stat strings of the players file filename as fixed-width
+    records, raising PlayerFileError on the first invalid line.
+    """
+
+    records = []
+    with open(filename, "rb") as source:
+        if os.fstat(source.fileno()).st_size == 0:
+            return b""
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for line_number, line in enumerate(iter(data.readline, b""), 1):
+                if line.strip() == b"":
+                    continue
+                _, _, stats = line.rpartition(b":")
+                stats = stats.strip()
+                if not (SKATER_PATTERN.fullmatch(stats)
+                        or GOALIE_PATTERN.fullmatch(stats)):
+                    raise PlayerFileError(
+                        f"{filename}, line {line_number}: invalid player "
+                        f"{stats.decode('utf-8', 'replace')!r}"
+                    )
+                records.append(stats.ljust(RECORD_WIDTH))
+    return b"".join(records)
+
+
+def _cache_header(filename: str, count: int, digest: bytes) -> bytes:
+    """Return the cache header for count records of filename."""
+
+    status = os.stat(filename)
+    return _HEADER.pack(CACHE_MAGIC, CACHE_VERSION, RECORD_WIDTH, count,
+                        status.st_mtime_ns, status.st_size, digest)
+
+
+def _write_cache(filename: str, records: bytes) -> None:
+    """Save records as the cache of the players file filename. The cache is
+    replaced atomically, so readers never see a partly written cache.
+    """
+
+    cache_name = filename + CACHE_SUFFIX
+    temporary_name = f"{cache_name}.{os.getpid()}.tmp"
+    header = _cache_header(filename, len(records) // RECORD_WIDTH,
+                           _file_hash(filename))
+    try:
+        with open(temporary_name, "wb") as cache:
+            cache.write(header)
+            cache.write(records)
+        os.replace(temporary_name, cache_name)
+    except OSError:
+        # The cache is only an optimization, e.g. the directory may be
+        # read-only
+        if os.path.exists(temporary_name):
+            os.remove(temporary_name)
+
+
+def _refresh_cache_header(filename: str, count: int, digest: bytes) -> None:
+    """Update the header of the cache of the players file filename, which
+    holds count records of the contents with digest, to the file's current
+    timestamp.
+    """
+
+    try:
+        with open(filename + CACHE_SUFFIX, "r+b") as cache:
+            cache.write(_cache_header(filename, count, digest))
+    except OSError:
+        # Later loads hash the file again to check the cache
+        pass
+
+
+def _is_cache_current(filename: str, data: mmap.mmap) -> bool:
+    """Return True if and only if data is a well formed cache of the
+    current contents of the players file filename.
+    """
+
+    if len(data) < _HEADER.size:
+        return False
+    (magic, version, width, count, mtime_ns, size,
+     digest) = _HEADER.unpack_from(data)
+    if (magic, version, width) != (CACHE_MAGIC, CACHE_VERSION, RECORD_WIDTH):
+        return False
+    if len(data) != _HEADER.size + count * RECORD_WIDTH:
+        return False
+
+    status = os.stat(filename)
+    if size != status.st_size:
+        return False
+    if mtime_ns == status.st_mtime_ns:
+        return True
+    # A file with only a new timestamp, e.g. after a checkout, keeps its cache
+    if digest != _file_hash(filename):
+        return False
+    _refresh_cache_header(filename, count, digest)
+    return True
+
+
+def _read_cache(filename: str) -> memoryview | None:
+    """Return the records in the cache of the players file filename, mapped
+    into memory, or None if there is no up to date cache.
+    """
+
+    cache_name = filename + CACHE_SUFFIX
+    try:
+        with open(cache_name, "rb") as cache:
+            data = mmap.mmap(cache.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if not _is_cache_current(filename, data):
+        data.close()
+        return None
+    return memoryview(data)[_HEADER.size:]
+
+
+def load_records(filename: str, use_cache: bool = True) -> memoryview:
+    """Return the stat strings of every player in the players file filename
+    as consecutive RECORD_WIDTH byte records, in file order.
+
+    If use_cache is True, the records come from the cache of filename when
+    it is up to date, and the cache is written otherwise.
+    """
+
+    if use_cache:
+        records = _read_cache(filename)
+        if records is not None:
+            return records
+    records = _parse_records(filename)
+    if use_cache:
+        _write_cache(filename, records)
+    return memoryview(records)
+
+
+def load_players(filename: str, use_cache: bool = True) -> tuple[list[str],
+                                                                 str]:
+    """Return the stat strings of every player in the players file filename
+    in file order, and the '_' separated string of their ids.
+    """
+
+    records = load_records(filename, use_cache)
+    text = records.tobytes().decode("ascii")
+    players = [text[i:i + RECORD_WIDTH].rstrip()
+               for i in range(0, len(text), RECORD_WIDTH)]
+    all_players = "".join([player[:3] + "_" for player in players])
+    return players, all_players
@@ -0,0 +1,95 @@
+"""An index of the cheapest available players in each position.
+
+Checking whether a general manager can still complete a team only needs the
+few cheapest prices per position. PriceIndex keeps the prices of each
+position sorted and is updated as players are drafted, so that check no
+longer sorts the whole player pool every time.
+"""
+
+from bisect import bisect_left, insort
+
+import fantasy_draft_functions as df
+
+from constants import (
+    FORWARDS_NEEDED,
+    DEFENCEMEN_NEEDED,
+    GOALIES_NEEDED,
+    FORWARD,
+    DEFENCEMEN,
+    GOALIE
+)
+
+POSITIONS_NEEDED = {
+    FORWARD: FORWARDS_NEEDED,
+    DEFENCEMEN: DEFENCEMEN_NEEDED,
+    GOALIE: GOALIES_NEEDED,
+}
+
+GM_POSITION_KEYS = {
+    FORWARD: "num_forwards",
+    DEFENCEMEN: "num_defence",
+    GOALIE: "num_goalies",
+}
+
+
+class PriceIndex:
+    """The sorted prices of the available players in each position."""
+
+    def __init__(self, players: list[str]) -> None:
+        """Initialize an index of the players in players."""
+
+        self.prices = {position: [] for position in POSITIONS_NEEDED}
+        for player in players:
+            self.prices[df.get_position(player)].append(df.get_price(player))
+        for prices in self.prices.values():
+            prices.sort()
+
+    def add(self, player: str) -> None:
+        """Add player to this index."""
+
+        insort(self.prices[df.get_position(player)], df.get_price(player))
+
+    def remove(self, player: str) -> None:
+        """Remove player from this index.
+
+        Precondition: player was added to this index and not yet removed.
+        """
+
+        prices = self.prices[df.get_position(player)]
+        del prices[bisect_left(prices, df.get_price(player))]
+
+    def cheapest(self, position: str, count: int, excluding: str = "") -> int:
+        """Return the total price of the count cheapest players in position,
+        or of all of them if there are fewer than count. If excluding is a
+        player in this index, leave that player out.
+        """
+
+        if count <= 0:
+            return 0
+        prices = self.prices[position]
+        if excluding == "" or df.get_position(excluding) != position:
+            return sum(prices[:count])
+
+        excluded_price = df.get_price(excluding)
+        cheapest = prices[:count + 1]
+        if excluded_price in cheapest:
+            cheapest.remove(excluded_price)
+        return sum(cheapest[:count])
+
+    def can_complete(self, gm: dict, pick: str = "") -> bool:
+        """Return True if and only if gm can afford the cheapest players
+        needed to fill every position, after drafting pick if it is not the
+        empty string.
+
+        Precondition: if pick is not the empty string, it is in this index.
+        """
+
+        budget = df.update_budget(gm["budget"], pick)
+        pick_position = df.get_position(pick)
+        total = 0
+        for position, needed in POSITIONS_NEEDED.items():
+            count = needed - gm[GM_POSITION_KEYS[position]]
+            if position == pick_position:
+                count -= 1
+            total += self.cheapest(position, count, pick)
+        return total <= budget
@@ -10,6 +10,7 @@ from various source and using a cache of built modules)
 from __future__ import annotations
 
 import collections
+import copy
 import os
 import types
 import zipimport
@@ -314,9 +315,11 @@ class AstroidManager:
     def file_from_module_name(
         self, modname: str, contextfile: str | None
     ) -> spec.ModuleSpec:
-        try:
-            value = self._mod_file_cache[(modname, contextfile)]
-        except KeyError:
+        # The exceptions cached are raised outside of any except clause, and raised as
+        # copies, so that no traceback is cached with them: tracebacks would keep the
+        # frames of the callers alive, along with the modules they were inferring
+        value = self._mod_file_cache.get((modname, contextfile))
+        if value is None:
             try:
                 value = file_info_from_modpath(
                     modname.split("."), context_file=contextfile
@@ -330,8 +333,7 @@ class AstroidManager:
                 )
             self._mod_file_cache[(modname, contextfile)] = value
         if isinstance(value, AstroidBuildingError):
-            # we remove the traceback here to save on memory usage (since these exceptions are cached)
-            raise value.with_traceback(None)  # pylint: disable=no-member
+            raise copy.copy(value)
         return value
 
     def ast_from_module(
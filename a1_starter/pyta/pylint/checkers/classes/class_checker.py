@@ -858,6 +858,10 @@ a metaclass class method.",
         py_version = self.linter.config.py_version
         self._py38_plus = py_version >= (3, 8)
 
+    def leave_module(self, _: nodes.Module) -> None:
+        """Forget the attributes accessed in the module, so that its nodes can be freed."""
+        self._accessed = ScopeAccessMap()
+
     @cached_property
     def _dummy_rgx(self) -> Pattern[str]:
         return self.linter.config.dummy_variables_rgx  # type: ignore[no-any-return]
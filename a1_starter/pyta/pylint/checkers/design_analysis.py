@@ -446,6 +446,10 @@ class MisdesignChecker(BaseChecker):
         for i, _ in enumerate(self._stmts):
             self._stmts[i] += amount
 
+    def leave_module(self, _: nodes.Module) -> None:
+        """Forget the branches counted in the module, so that its nodes can be freed."""
+        self._branches.clear()
+
     @only_required_for_messages(
         "too-many-ancestors",
         "too-many-instance-attributes",
@@ -639,6 +643,7 @@ class MisdesignChecker(BaseChecker):
             return  # return outside function, reported by the base checker
         self._returns[-1] += 1
 
+    @only_required_for_messages("too-many-statements")
     def visit_default(self, node: nodes.NodeNG) -> None:
         """Default visit method -> increments the statements counter if
         necessary.
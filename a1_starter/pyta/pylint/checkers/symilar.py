@@ -13,9 +13,11 @@ Then each index of the stripped lines collection is associated with the hash of
 successive entries of the stripped lines starting at the current index (n is the
 minimum common lines option).
 
-The common hashes between both linesets are then looked for. If there are matches, then
-the match indices in both linesets are stored and associated with the corresponding
-couples (start line number/end line number) in both files.
+The linesets are indexed by their hashes, so that only the pairs of linesets with hashes
+in common are compared. The common hashes between both linesets of such a pair are then
+looked for. If there are matches, then the match indices in both linesets are stored and
+associated with the corresponding couples (start line number/end line number) in both
+files.
 
 This association is then post-processed to handle the case of successive matches. For
 example if the minimum common lines setting is set to four, then the hashes are
@@ -30,7 +32,7 @@ start and end lines numbers of common lines in both files.
 from __future__ import annotations
 
 import argparse
-import copy
+import bisect
 import functools
 import itertools
 import operator
@@ -398,6 +400,8 @@ class Symilar:
     def _compute_sims(self) -> list[tuple[int, set[LinesChunkLimits_T]]]:
         """Compute similarities in appended files."""
         no_duplicates: dict[int, list[set[LinesChunkLimits_T]]] = defaultdict(list)
+        # The chunks of lines in the couples of no_duplicates, by number of lines
+        seen: defaultdict[int, set[LinesChunkLimits_T]] = defaultdict(set)
 
         for commonality in self._iter_sims():
             num = commonality.cmn_lines_nb
@@ -408,22 +412,11 @@ class Symilar:
             start_line_2 = commonality.snd_file_start
             end_line_2 = commonality.snd_file_end
 
-            duplicate = no_duplicates[num]
-            couples: set[LinesChunkLimits_T]
-            for couples in duplicate:
-                if (lineset1, start_line_1, end_line_1) in couples or (
-                    lineset2,
-                    start_line_2,
-                    end_line_2,
-                ) in couples:
-                    break
-            else:
-                duplicate.append(
-                    {
-                        (lineset1, start_line_1, end_line_1),
-                        (lineset2, start_line_2, end_line_2),
-                    }
-                )
+            chunk_1 = (lineset1, start_line_1, end_line_1)
+            chunk_2 = (lineset2, start_line_2, end_line_2)
+            if chunk_1 not in seen[num] and chunk_2 not in seen[num]:
+                no_duplicates[num].append({chunk_1, chunk_2})
+                seen[num].update((chunk_1, chunk_2))
         sims: list[tuple[int, set[LinesChunkLimits_T]]] = []
         ensembles: list[set[LinesChunkLimits_T]]
         for num, ensembles in no_duplicates.items():
@@ -445,29 +438,33 @@ class Symilar:
         self, similarities: list[tuple[int, set[LinesChunkLimits_T]]]
     ) -> str:
         """Create a report from similarities."""
-        report: str = ""
+        report: list[str] = []
         duplicated_line_number: int = 0
         for number, couples in similarities:
-            report += f"\n{number} similar lines in {len(couples)} files\n"
+            report.append(f"\n{number} similar lines in {len(couples)} files\n")
             couples_l = sorted(couples)
             line_set = start_line = end_line = None
             for line_set, start_line, end_line in couples_l:
-                report += f"=={line_set.name}:[{start_line}:{end_line}]\n"
+                report.append(f"=={line_set.name}:[{start_line}:{end_line}]\n")
             if line_set:
                 for line in line_set._real_lines[start_line:end_line]:
-                    report += f"   {line.rstrip()}\n" if line.rstrip() else "\n"
+                    report.append(f"   {line.rstrip()}\n" if line.rstrip() else "\n")
             duplicated_line_number += number * (len(couples_l) - 1)
         total_line_number: int = sum(len(lineset) for lineset in self.linesets)
-        report += (
+        report.append(
             f"TOTAL lines={total_line_number} "
             f"duplicates={duplicated_line_number} "
             f"percent={duplicated_line_number * 100.0 / total_line_number:.2f}\n"
         )
-        return report
+        return "".join(report)
 
     # pylint: disable = too-many-locals
     def _find_common(
-        self, lineset1: LineSet, lineset2: LineSet
+        self,
+        lineset1: LineSet,
+        lineset2: LineSet,
+        hashed_1: tuple[HashToIndex_T, IndexToLines_T] | None = None,
+        hashed_2: tuple[HashToIndex_T, IndexToLines_T] | None = None,
     ) -> Generator[Commonality]:
         """Find similarities in the two given linesets.
 
@@ -480,15 +477,18 @@ class Symilar:
         Last regroups all successive couples in a bigger one. It allows to take into
         account common chunk of lines that have more than the minimal number of
         successive lines required.
+
+        The hashes of the linesets are computed unless given, as returned by
+        hash_lineset.
         """
         hash_to_index_1: HashToIndex_T
         hash_to_index_2: HashToIndex_T
         index_to_lines_1: IndexToLines_T
         index_to_lines_2: IndexToLines_T
-        hash_to_index_1, index_to_lines_1 = hash_lineset(
+        hash_to_index_1, index_to_lines_1 = hashed_1 or hash_lineset(
             lineset1, self.namespace.min_similarity_lines
         )
-        hash_to_index_2, index_to_lines_2 = hash_lineset(
+        hash_to_index_2, index_to_lines_2 = hashed_2 or hash_lineset(
             lineset2, self.namespace.min_similarity_lines
         )
 
@@ -509,10 +509,13 @@ class Symilar:
             ):
                 index_1 = indices_in_linesets[0]
                 index_2 = indices_in_linesets[1]
+                # Copies, since remove_successive updates their ends
+                lines_1 = index_to_lines_1[index_1]
+                lines_2 = index_to_lines_2[index_2]
                 all_couples[LineSetStartCouple(index_1, index_2)] = (
                     CplSuccessiveLinesLimits(
-                        copy.copy(index_to_lines_1[index_1]),
-                        copy.copy(index_to_lines_2[index_2]),
+                        SuccessiveLinesLimits(lines_1.start, lines_1.end),
+                        SuccessiveLinesLimits(lines_2.start, lines_2.end),
                         effective_cmn_lines_nb=self.namespace.min_similarity_lines,
                     )
                 )
@@ -542,12 +545,31 @@ class Symilar:
                 yield com
 
     def _iter_sims(self) -> Generator[Commonality]:
-        """Iterate on similarities among all files, by making a Cartesian
-        product.
+        """Iterate on similarities among all files, in the order of their
+        Cartesian product.
+
+        Only files with a hash of successive lines in common can be similar, so
+        the files are indexed by their hashes and only those pairs are compared.
         """
+        hashed = [
+            hash_lineset(lineset, self.namespace.min_similarity_lines)
+            for lineset in self.linesets
+        ]
+        # The indices of the linesets in which each hash is found, in order
+        index: defaultdict[LinesChunk, list[int]] = defaultdict(list)
+        for idx, (hash_to_index, _) in enumerate(hashed):
+            for chunk in hash_to_index:
+                index[chunk].append(idx)
+
         for idx, lineset in enumerate(self.linesets[:-1]):
-            for lineset2 in self.linesets[idx + 1 :]:
-                yield from self._find_common(lineset, lineset2)
+            others: set[int] = set()
+            for chunk in hashed[idx][0]:
+                indices = index[chunk]
+                others.update(indices[bisect.bisect_right(indices, idx) :])
+            for idx2 in sorted(others):
+                yield from self._find_common(
+                    lineset, self.linesets[idx2], hashed[idx], hashed[idx2]
+                )
 
     def get_map_data(self) -> list[LineSet]:
         """Returns the data we can use for a map/reduce process.
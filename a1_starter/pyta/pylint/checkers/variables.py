@@ -1393,6 +1393,7 @@ class VariablesChecker(BaseChecker):
         """
         self._to_consume = [NamesConsumer(node, "module")]
         self._postponed_evaluation_enabled = is_postponed_evaluation_enabled(node)
+        self._evaluated_type_checking_scopes = {}
 
         for name, stmts in node.locals.items():
             if utils.is_builtin(name):
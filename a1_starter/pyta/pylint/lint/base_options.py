@@ -415,6 +415,31 @@ def _make_linter_options(linter: PyLinter) -> Options:
                 "Useful if running pylint in a server-like mode.",
             },
         ),
+        (
+            "streaming",
+            {
+                "default": False,
+                "type": "yn",
+                "metavar": "<y or n>",
+                "help": "Parse and lint each file before parsing the next one, "
+                "instead of parsing all files before linting them. "
+                "Messages are then emitted file by file, and fewer "
+                "syntax trees are held in memory at once.",
+            },
+        ),
+        (
+            "evict-checked-modules",
+            {
+                "default": False,
+                "type": "yn",
+                "metavar": "<y or n>",
+                "help": "Remove each checked module from astroid's cache once "
+                "it has been linted, unless a module checked before it "
+                "imports it. Bounds memory use when linting large trees, "
+                "at the cost of parsing again the modules imported later "
+                "on. Implies --streaming.",
+            },
+        ),
         (
             "prefer-stubs",
             {
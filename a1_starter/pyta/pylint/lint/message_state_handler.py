@@ -28,6 +28,7 @@ from pylint.utils.pragma_parser import (
 
 if TYPE_CHECKING:
     from pylint.lint.pylinter import PyLinter
+    from pylint.utils import FileState
 
 
 class _MessageStateHandler:
@@ -62,6 +63,17 @@ class _MessageStateHandler:
         i.e. before all option providers have been fully parsed. Thus, this dict stores
         option_value and msg_id needed to (later) emit the messages keyed on module names.
         """
+        self._enabled_cache: dict[str, tuple[list[str], bool, bool]] = {}
+        """Cache of the msgids of each msgid or symbol, whether they are enabled
+        without a line, and whether their state depends on the line in the current
+        file.
+        """
+        self._enabled_on_line_cache: dict[tuple[str, int], bool] = {}
+        """Cache of whether each msgid or symbol is enabled on a line of the current
+        file, for those whose state depends on the line.
+        """
+        self._enabled_cache_file_state: FileState | None = None
+        self._enabled_cache_msgs_state: dict[str, bool] | None = None
 
     def _set_one_msg_status(
         self, scope: str, msg: MessageDefinition, line: int | None, enable: bool
@@ -71,6 +83,7 @@ class _MessageStateHandler:
             assert isinstance(line, int)  # should always be int inside module scope
 
             self.linter.file_state.set_msg_status(msg, line, enable, scope)
+            self._clear_enabled_cache()
             if not enable and msg.symbol != "locally-disabled":
                 self.linter.add_message(
                     "locally-disabled", line=line, args=(msg.symbol, msg.msgid)
@@ -78,6 +91,7 @@ class _MessageStateHandler:
         else:
             msgs = self._msgs_state
             msgs[msg.msgid] = enable
+            self._clear_enabled_cache()
 
     def _get_messages_to_set(
         self, msgid: str, enable: bool, ignore_unknown: bool = False
@@ -277,11 +291,7 @@ class _MessageStateHandler:
         return None
 
     def _is_one_message_enabled(self, msgid: str, line: int | None) -> bool:
-        """Checks state of a single message for the current file.
-
-        This function can't be cached as it depends on self.file_state which can
-        change.
-        """
+        """Checks state of a single message for the current file."""
         if line is None:
             return self._msgs_state.get(msgid, True)
         try:
@@ -322,10 +332,10 @@ class _MessageStateHandler:
 
         Optionally, is it enabled for this line and confidence level ?
 
-        The current file is implicit and mandatory. As a result this function
-        can't be cached right now as the line is the line of the currently
-        analysed file (self.file_state), if it changes, then the result for
-        the same msg_descr/line might need to change.
+        The current file is implicit and mandatory. The results are cached until
+        the current file (self.file_state) or the state of a message changes. A
+        message whose state is not set by the current file is enabled or not on
+        every line, so its result is cached once for all the lines.
 
         :param msg_descr: Either the msgid or the symbol for a MessageDefinition
         :param line: The line of the currently analysed file
@@ -333,6 +343,31 @@ class _MessageStateHandler:
         """
         if confidence and confidence.name not in self.linter.config.confidence:
             return False
+        if (
+            self._enabled_cache_file_state is not self.linter.file_state
+            or self._enabled_cache_msgs_state is not self._msgs_state
+        ):
+            self._clear_enabled_cache()
+        try:
+            msgids, enabled, line_dependent = self._enabled_cache[msg_descr]
+        except KeyError:
+            msgids, enabled, line_dependent = self._enabled_cache[msg_descr] = (
+                self._get_enabled_state(msg_descr)
+            )
+        if line is None or not line_dependent:
+            return enabled
+
+        enabled_on_line = self._enabled_on_line_cache.get((msg_descr, line))
+        if enabled_on_line is None:
+            enabled_on_line = self._enabled_on_line_cache[(msg_descr, line)] = any(
+                self._is_one_message_enabled(msgid, line) for msgid in msgids
+            )
+        return enabled_on_line
+
+    def _get_enabled_state(self, msg_descr: str) -> tuple[list[str], bool, bool]:
+        """Return the msgids of a msgid or symbol, whether it is enabled without a
+        line, and whether its state depends on the line in the current file.
+        """
         try:
             msgids = self.linter.msgs_store.message_id_store.get_active_msgids(
                 msg_descr
@@ -342,7 +377,25 @@ class _MessageStateHandler:
             # due to version mismatch, just treat them as message IDs
             # for now.
             msgids = [msg_descr]
-        return any(self._is_one_message_enabled(msgid, line) for msgid in msgids)
+        file_state = self.linter.file_state
+        return (
+            msgids,
+            any(self._is_one_message_enabled(msgid, None) for msgid in msgids),
+            any(
+                msgid in file_state._module_msgs_state
+                or msgid in file_state._raw_module_msgs_state
+                for msgid in msgids
+            ),
+        )
+
+    def _clear_enabled_cache(self) -> None:
+        """Clear the cached states of messages, after the current file or the state
+        of a message changed.
+        """
+        self._enabled_cache.clear()
+        self._enabled_on_line_cache.clear()
+        self._enabled_cache_file_state = self.linter.file_state
+        self._enabled_cache_msgs_state = self._msgs_state
 
     def process_tokens(self, tokens: list[tokenize.TokenInfo]) -> None:
         """Process tokens from the current module to search for module/block level
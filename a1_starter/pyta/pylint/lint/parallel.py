@@ -5,98 +5,208 @@
 from __future__ import annotations
 
 import functools
+import os
+import sys
 from collections import defaultdict
 from collections.abc import Iterable, Sequence
-from typing import TYPE_CHECKING, Any
-
-import dill
+from typing import TYPE_CHECKING, Any, Optional
 
 from pylint import reporters
+from pylint.interfaces import Confidence
 from pylint.lint.utils import _augment_sys_path
 from pylint.message import Message
-from pylint.typing import FileItem
-from pylint.utils import LinterStats, merge_stats
+from pylint.typing import FileItem, MessageLocationTuple
+from pylint.utils import LinterStats, merge_stats, merge_stats_into
 
 try:
     import multiprocessing
 except ImportError:
     multiprocessing = None  # type: ignore[assignment]
 
-try:
-    from concurrent.futures import ProcessPoolExecutor
-except ImportError:
-    ProcessPoolExecutor = None  # type: ignore[assignment,misc]
-
 if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
     from pylint.lint import PyLinter
 
+# Number of batches the files are split into per worker: more batches balance the
+# work better across workers, fewer batches cost less to send between processes
+_BATCHES_PER_WORKER = 4
+
+# The fields of a message sent by a worker process, from which the parent process
+# creates the message again
+_PackedMessage = tuple[
+    str,
+    str,
+    str,
+    Confidence,
+    str,
+    str,
+    str,
+    str,
+    int,
+    int,
+    Optional[int],
+    Optional[int],
+]
+
 # PyLinter object used by worker processes when checking files using parallel mode
-# should only be used by the worker processes
+# should only be used by the worker processes, and set by the parent process while
+# it forks them
 _worker_linter: PyLinter | None = None
 
 
 def _worker_initialize(
-    linter: bytes, extra_packages_paths: Sequence[str] | None = None
+    linter: bytes | None, extra_packages_paths: Sequence[str] | None = None
 ) -> None:
     """Function called to initialize a worker for a Process within a concurrent Pool.
 
-    :param linter: A linter-class (PyLinter) instance pickled with dill
+    :param linter: A linter-class (PyLinter) instance pickled with dill, or None if the
+        worker was forked with the linter already set
     :param extra_packages_paths: Extra entries to be added to `sys.path`
     """
     global _worker_linter  # pylint: disable=global-statement
-    _worker_linter = dill.loads(linter)
+    if linter is not None:
+        import dill
+
+        _worker_linter = dill.loads(linter)
     assert _worker_linter
 
     # On the worker process side the messages are just collected and passed back to
-    # parent process as _worker_check_file function's return value
+    # parent process as _worker_check_files function's return value
     _worker_linter.set_reporter(reporters.CollectingReporter())
     _worker_linter.open()
 
-    # Re-register dynamic plugins, since the pool does not have access to the
-    # astroid module that existed when the linter was pickled.
-    _worker_linter.load_plugin_modules(_worker_linter._dynamic_plugins, force=True)
-    _worker_linter.load_plugin_configuration()
+    if linter is not None:
+        # Re-register dynamic plugins, since the pool does not have access to the
+        # astroid module that existed when the linter was pickled.
+        _worker_linter.load_plugin_modules(_worker_linter._dynamic_plugins, force=True)
+        _worker_linter.load_plugin_configuration()
 
     if extra_packages_paths:
         _augment_sys_path(extra_packages_paths)
 
 
-def _worker_check_single_file(
-    file_item: FileItem,
+def _worker_check_files(
+    file_items: list[tuple[int, FileItem]],
 ) -> tuple[
-    int,
-    str,
-    str,
-    str,
-    list[Message],
+    list[tuple[int, str, str, str, list[_PackedMessage], defaultdict[str, list[Any]]]],
     LinterStats,
     int,
-    defaultdict[str, list[Any]],
 ]:
+    """Check a batch of files, given with their positions in the files to check.
+
+    Return the position, module name, path, base name, messages and map/reduce data
+    of each file, along with the stats and message status of the whole batch.
+    """
     if not _worker_linter:
         raise RuntimeError("Worker linter not yet initialised")
-    _worker_linter.open()
-    _worker_linter.check_single_file_item(file_item)
-    mapreduce_data = defaultdict(list)
-    for checker in _worker_linter.get_checkers():
-        data = checker.get_map_data()
-        if data is not None:
-            mapreduce_data[checker.name].append(data)
-    msgs = _worker_linter.reporter.messages
     assert isinstance(_worker_linter.reporter, reporters.CollectingReporter)
-    _worker_linter.reporter.reset()
+    results = []
+    stats = LinterStats()
+    for index, file_item in file_items:
+        _worker_linter.open()
+        # Only count the messages of this file, since the stats of all files are added
+        _worker_linter.stats.by_msg = {}
+        _worker_linter.check_single_file_item(file_item)
+        mapreduce_data = defaultdict(list)
+        for checker in _worker_linter.get_checkers():
+            data = checker.get_map_data()
+            if data is not None:
+                mapreduce_data[checker.name].append(data)
+        msgs = [_pack_message(msg) for msg in _worker_linter.reporter.messages]
+        _worker_linter.reporter.reset()
+        merge_stats_into(stats, _worker_linter.stats)
+        results.append(
+            (
+                index,
+                _worker_linter.current_name,
+                file_item.filepath,
+                _worker_linter.file_state.base_name,
+                msgs,
+                mapreduce_data,
+            )
+        )
+    return results, stats, _worker_linter.msg_status
+
+
+def _pack_message(msg: Message) -> _PackedMessage:
+    """Return the fields of a message, which are cheaper to send between processes
+    than the message.
+    """
     return (
-        id(multiprocessing.current_process()),
-        _worker_linter.current_name,
-        file_item.filepath,
-        _worker_linter.file_state.base_name,
-        msgs,
-        _worker_linter.stats,
-        _worker_linter.msg_status,
-        mapreduce_data,
+        msg.msg_id,
+        msg.symbol,
+        msg.msg,
+        msg.confidence,
+        msg.abspath,
+        msg.path,
+        msg.module,
+        msg.obj,
+        msg.line,
+        msg.column,
+        msg.end_line,
+        msg.end_column,
+    )
+
+
+def _unpack_message(packed: _PackedMessage) -> Message:
+    """Return the message with the fields returned by _pack_message."""
+    msg_id, symbol, msg, confidence, *location = packed
+    return Message(
+        msg_id,
+        symbol,
+        MessageLocationTuple(*location),  # type: ignore[arg-type]
+        msg,
+        confidence,
     )
 
 
+def _batch_files(
+    files: Sequence[FileItem], jobs: int
+) -> list[list[tuple[int, FileItem]]]:
+    """Split the files into batches of similar total size, largest files first.
+
+    Each file is given with its position in files.
+    """
+    sizes = [_file_size(file.filepath) for file in files]
+    target_size = sum(sizes) / (jobs * _BATCHES_PER_WORKER)
+    batches = []
+    batch: list[tuple[int, FileItem]] = []
+    batch_size = 0
+    for index in sorted(range(len(files)), key=sizes.__getitem__, reverse=True):
+        batch.append((index, files[index]))
+        batch_size += sizes[index]
+        if batch_size >= target_size:
+            batches.append(batch)
+            batch = []
+            batch_size = 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _file_size(filepath: str) -> int:
+    """Return the size of a file, or 0 if it cannot be read."""
+    try:
+        return os.path.getsize(filepath)
+    except OSError:
+        return 0
+
+
+def _fork_context() -> BaseContext | None:
+    """Return the context to fork workers with, or None if they cannot be forked.
+
+    Workers are not forked on macOS, where forking is unsafe with some system libraries.
+    """
+    if (
+        multiprocessing is None
+        or sys.platform == "darwin"
+        or "fork" not in multiprocessing.get_all_start_methods()
+    ):
+        return None
+    return multiprocessing.get_context("fork")
+
+
 def _merge_mapreduce_data(
     linter: PyLinter,
     all_mapreduce_data: defaultdict[int, list[defaultdict[str, list[Any]]]],
@@ -129,45 +239,82 @@ def check_parallel(
 ) -> None:
     """Use the given linter to lint the files with given amount of workers (jobs).
 
-    This splits the work filestream-by-filestream. If you need to do work across
-    multiple files, as in the similarity-checker, then implement the map/reduce functionality.
+    This splits the files into batches, largest files first, which idle workers take
+    one at a time. The messages are reported in the order of the files. If you need to
+    do work across multiple files, as in the similarity-checker, then implement the
+    map/reduce functionality.
     """
-    # The linter is inherited by all the pool's workers, i.e. the linter
-    # is identical to the linter object here. This is required so that
-    # a custom PyLinter object can be used.
+    global _worker_linter  # pylint: disable=global-statement
+    # concurrent.futures.process imports subprocess, which is only needed to check
+    # files in parallel
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    files = list(files)
+    context = _fork_context()
+    if context is not None:
+        # Forked workers inherit the linter, with its plugins loaded, and the brain
+        # and cache of astroid, so there is nothing to load again
+        _worker_linter = linter
+        pickled_linter = None
+    else:
+        # The linter is inherited by all the pool's workers, i.e. the linter
+        # is identical to the linter object here. This is required so that
+        # a custom PyLinter object can be used.
+        # dill is slow to import and only needed to check files in parallel
+        import dill
+
+        pickled_linter = dill.dumps(linter)
+
     initializer = functools.partial(
         _worker_initialize, extra_packages_paths=extra_packages_paths
     )
-    with ProcessPoolExecutor(
-        max_workers=jobs, initializer=initializer, initargs=(dill.dumps(linter),)
-    ) as executor:
-        linter.open()
-        all_stats = []
-        all_mapreduce_data: defaultdict[int, list[defaultdict[str, list[Any]]]] = (
-            defaultdict(list)
-        )
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=context,
+            initializer=initializer,
+            initargs=(pickled_linter,),
+        ) as executor:
+            linter.open()
+            worker_stats = LinterStats()
+            all_mapreduce_data: defaultdict[int, list[defaultdict[str, list[Any]]]] = (
+                defaultdict(list)
+            )
+            # The results of the files checked, by position in files, until the
+            # files before them are reported
+            file_results = {}
+            next_index = 0
 
-        # Maps each file to be worked on by a single _worker_check_single_file() call,
-        # collecting any map/reduce data by checker module so that we can 'reduce' it
-        # later.
-        for (
-            worker_idx,  # used to merge map/reduce data across workers
-            module,
-            file_path,
-            base_name,
-            messages,
-            stats,
-            msg_status,
-            mapreduce_data,
-        ) in executor.map(_worker_check_single_file, files):
-            linter.file_state.base_name = base_name
-            linter.file_state._is_base_filestate = False
-            linter.set_current_module(module, file_path)
-            for msg in messages:
-                linter.reporter.handle_message(msg)
-            all_stats.append(stats)
-            all_mapreduce_data[worker_idx].append(mapreduce_data)
-            linter.msg_status |= msg_status
+            # Collects any map/reduce data by file, so that we can 'reduce' it later
+            for future in as_completed(
+                [
+                    executor.submit(_worker_check_files, batch)
+                    for batch in _batch_files(files, jobs)
+                ]
+            ):
+                results, stats, msg_status = future.result()
+                merge_stats_into(worker_stats, stats)
+                linter.msg_status |= msg_status
+                for index, *result in results:
+                    file_results[index] = result
+                while next_index in file_results:
+                    (
+                        module,
+                        file_path,
+                        base_name,
+                        messages,
+                        mapreduce_data,
+                    ) = file_results.pop(next_index)
+                    linter.file_state.base_name = base_name
+                    linter.file_state._is_base_filestate = False
+                    linter.set_current_module(module, file_path)
+                    for msg in messages:
+                        linter.reporter.handle_message(_unpack_message(msg))
+                    all_mapreduce_data[next_index].append(mapreduce_data)
+                    next_index += 1
+    finally:
+        if context is not None:
+            _worker_linter = None
 
     _merge_mapreduce_data(linter, all_mapreduce_data)
-    linter.stats = merge_stats([linter.stats, *all_stats])
+    linter.stats = merge_stats([linter.stats, worker_stats])
@@ -22,9 +22,14 @@ from typing import Any, Protocol
 
 import astroid
 from astroid import nodes
+from astroid.context import _invalidate_cache
+from astroid.inference_tip import clear_inference_tip_cache
+from astroid.interpreter.objectmodel import ObjectModel
+from astroid.nodes._base_nodes import LookupMixIn
 
 from pylint import checkers, exceptions, interfaces, reporters
 from pylint.checkers.base_checker import BaseChecker
+from pylint.checkers.utils import clear_lru_caches
 from pylint.config.arguments_manager import _ArgumentsManager
 from pylint.constants import (
     MAIN_CHECKER_NAME,
@@ -48,6 +53,7 @@ from pylint.lint.report_functions import (
     report_total_messages_stats,
 )
 from pylint.lint.utils import (
+    _imported_module_names,
     augmented_sys_path,
     get_fatal_error_message,
     prepare_crash_report,
@@ -354,6 +360,8 @@ class PyLinter(
         self.current_file: str | None = None
         self._ignore_file = False
         self._ignore_paths: list[Pattern[str]] = []
+        self._imported_module_names: set[str] = set()
+        """Names of the modules imported by the checked modules, for evicting modules."""
 
         self.register_checker(self)
 
@@ -489,6 +497,7 @@ class PyLinter(
             self.register_report(r_id, r_title, r_cb, checker)
         if hasattr(checker, "msgs"):
             self.msgs_store.register_messages_from_checker(checker)
+            self._clear_enabled_cache()
             for message in checker.messages:
                 if not message.default_enabled:
                     self.disable(message.msgid)
@@ -613,6 +622,7 @@ class PyLinter(
         for msg in self.msgs_store.messages:
             if not msg.may_be_emitted(self.config.py_version):
                 self._msgs_state[msg.msgid] = False
+        self._clear_enabled_cache()
 
     def _discover_files(self, files_or_modules: Sequence[str]) -> Iterator[str]:
         """Discover python modules and packages in sub-directory.
@@ -697,6 +707,15 @@ class PyLinter(
         # The contextmanager also opens all checkers and sets up the PyLinter class
         with augmented_sys_path(extra_packages_paths):
             with self._astroid_module_checker() as check_astroid_module:
+                if self.config.streaming or self.config.evict_checked_modules:
+                    # 2) and 3) Get the AST for each FileItem and lint it before
+                    # getting the next one
+                    for fileitem in fileitems:
+                        self._lint_files(
+                            self._get_asts((fileitem,), data), check_astroid_module
+                        )
+                    return
+
                 # 2) Get the AST for each FileItem
                 ast_per_fileitem = self._get_asts(fileitems, data)
 
@@ -704,7 +723,7 @@ class PyLinter(
                 self._lint_files(ast_per_fileitem, check_astroid_module)
 
     def _get_asts(
-        self, fileitems: Iterator[FileItem], data: str | None
+        self, fileitems: Iterable[FileItem], data: str | None
     ) -> dict[FileItem, nodes.Module | None]:
         """Get the AST for all given FileItems."""
         ast_per_fileitem: dict[FileItem, nodes.Module | None] = {}
@@ -796,6 +815,33 @@ class PyLinter(
         for msgid, line, args in spurious_messages:
             self.add_message(msgid, line, None, args)
 
+        if self.config.evict_checked_modules:
+            self._evict_module(module)
+
+    def _evict_module(self, module: nodes.Module) -> None:
+        """Remove a linted module from the astroid cache, unless a module checked
+        before it imports it.
+
+        Modules imported by modules checked after it are parsed again. The caches
+        holding inferred nodes are cleared too, since they would keep it alive.
+        """
+        self._imported_module_names.update(_imported_module_names(module))
+        if (
+            module.name in self._imported_module_names
+            or MANAGER.astroid_cache.get(module.name) is not module
+        ):
+            return
+        del MANAGER.astroid_cache[module.name]
+        _invalidate_cache()
+        clear_inference_tip_cache()
+        clear_lru_caches()
+        for lru_cache in (
+            LookupMixIn.lookup,
+            ObjectModel.attributes,
+            nodes.ClassDef._metaclass_lookup_attribute,
+        ):
+            lru_cache.cache_clear()  # type: ignore[attr-defined]
+
     def _check_file(
         self,
         get_ast: GetAstProtocol,
@@ -838,6 +884,9 @@ class PyLinter(
         for msgid, line, args in spurious_messages:
             self.add_message(msgid, line, None, args)
 
+        if self.config.evict_checked_modules:
+            self._evict_module(ast_node)
+
     def _get_file_descr_from_stdin(self, filepath: str) -> Iterator[FileItem]:
         """Return file description (tuple of module name, file path, base name) from
         given file path.
@@ -27,14 +27,23 @@ from pylint.reporters.base_reporter import BaseReporter
 
 try:
     import multiprocessing
-    from multiprocessing import synchronize  # noqa pylint: disable=unused-import
 except ImportError:
     multiprocessing = None  # type: ignore[assignment]
 
-try:
-    from concurrent.futures import ProcessPoolExecutor
-except ImportError:
-    ProcessPoolExecutor = None  # type: ignore[assignment,misc]
+
+def _can_check_in_parallel() -> bool:
+    """Return whether files can be checked in a pool of worker processes.
+
+    The modules this needs import subprocess, so they are only imported once jobs are
+    requested.
+    """
+    try:
+        # pylint: disable-next=unused-import
+        from concurrent.futures import ProcessPoolExecutor  # noqa
+        from multiprocessing import synchronize  # noqa pylint: disable=unused-import
+    except ImportError:
+        return False
+    return True
 
 
 def _query_cpu() -> int | None:
@@ -193,7 +202,7 @@ group are mutually exclusive.",
             )
             sys.exit(32)
         if linter.config.jobs > 1 or linter.config.jobs == 0:
-            if ProcessPoolExecutor is None:
+            if not _can_check_in_parallel():
                 print(
                     "concurrent.futures module is missing, fallback to single process",
                     file=sys.stderr,
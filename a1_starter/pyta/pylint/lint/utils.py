@@ -12,6 +12,9 @@ from collections.abc import Iterator, Sequence
 from datetime import datetime
 from pathlib import Path
 
+import astroid
+from astroid import nodes
+
 from pylint.constants import PYLINT_HOME, full_version
 
 
@@ -112,6 +115,29 @@ def get_fatal_error_message(filepath: str, issue_template_path: Path) -> str:
     )
 
 
+def _imported_module_names(module: nodes.Module) -> set[str]:
+    """Return the absolute names of the modules imported by module, along with the
+    packages containing them.
+
+    The names imported from a module are included too, since they may be submodules.
+    """
+    names: set[str] = set()
+    for node in module.nodes_of_class((nodes.Import, nodes.ImportFrom)):
+        if isinstance(node, nodes.Import):
+            imported = [name for name, _ in node.names]
+        else:
+            try:
+                base = module.relative_to_absolute_name(node.modname, node.level)
+            except astroid.TooManyLevelsError:
+                continue
+            imported = [base]
+            imported.extend(f"{base}.{name}" for name, _ in node.names if name != "*")
+        for name in imported:
+            parts = name.split(".")
+            names.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+    return names
+
+
 def _augment_sys_path(additional_paths: Sequence[str]) -> list[str]:
     original = list(sys.path)
     changes = []
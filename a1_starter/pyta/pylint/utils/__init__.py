@@ -6,12 +6,17 @@
 main pylint class.
 """
 
+from pylint.utils import utils as _utils
 from pylint.utils.ast_walker import ASTWalker
 from pylint.utils.docs import print_full_documentation
 from pylint.utils.file_state import FileState
-from pylint.utils.linterstats import LinterStats, ModuleStats, merge_stats
+from pylint.utils.linterstats import (
+    LinterStats,
+    ModuleStats,
+    merge_stats,
+    merge_stats_into,
+)
 from pylint.utils.utils import (
-    HAS_ISORT_5,
     IsortDriver,
     _check_csv,
     _check_regexp_csv,
@@ -47,7 +52,15 @@ __all__ = [
     "register_plugins",
     "tokenize_module",
     "merge_stats",
+    "merge_stats_into",
     "LinterStats",
     "ModuleStats",
     "print_full_documentation",
 ]
+
+
+def __getattr__(name: str) -> bool:
+    # HAS_ISORT_5 imports isort, so it is only looked up when it is used
+    if name == "HAS_ISORT_5":
+        return _utils.HAS_ISORT_5
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
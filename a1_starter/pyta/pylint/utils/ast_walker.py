@@ -4,10 +4,11 @@
 
 from __future__ import annotations
 
+import functools
 import sys
 import traceback
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import TYPE_CHECKING
 
 from astroid import nodes
@@ -24,6 +25,30 @@ if TYPE_CHECKING:
 # NodeNG will work too.
 AstCallback = Callable[[nodes.NodeNG], None]
 
+# The visit and leave callbacks of a node class, whether the walker descends into
+# the children of its nodes, and whether its nodes are statements
+_Dispatch = tuple[tuple[AstCallback, ...], tuple[AstCallback, ...], bool, bool]
+
+# Names of the node classes whose nodes may have statements among their descendants.
+# The nodes of all other classes are parts of expressions, so only have other parts
+# of expressions as descendants.
+_STATEMENT_CONTAINER_CIDS = frozenset(
+    cls.__name__.lower()
+    for cls in nodes.ALL_NODE_CLASSES
+    if isinstance(cls, type)
+    and (cls.is_statement or issubclass(cls, (nodes.Module, nodes.MatchCase)))
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _callback_members(checker_class: type[BaseChecker]) -> tuple[str, ...]:
+    """Return the names of the visit and leave methods of a checker class."""
+    return tuple(
+        member
+        for member in dir(checker_class)
+        if member.startswith(("visit_", "leave_")) and member[6:] != "default"
+    )
+
 
 class ASTWalker:
     def __init__(self, linter: PyLinter) -> None:
@@ -33,6 +58,11 @@ class ASTWalker:
         self.leave_events: defaultdict[str, list[AstCallback]] = defaultdict(list)
         self.linter = linter
         self.exception_msg = False
+        # callbacks per node class, built from the events as nodes of the class
+        # are walked
+        self._dispatch: dict[type[nodes.NodeNG], _Dispatch] = {}
+        # whether any callback is called on parts of expressions
+        self._walk_expressions = False
 
     def _is_method_enabled(self, method: AstCallback) -> bool:
         if not hasattr(method, "checks_msgs"):
@@ -42,59 +72,98 @@ class ASTWalker:
     def add_checker(self, checker: BaseChecker) -> None:
         """Walk to the checker's dir and collect visit and leave methods."""
         vcids: set[str] = set()
-        lcids: set[str] = set()
         visits = self.visit_events
         leaves = self.leave_events
-        for member in dir(checker):
+        for member in _callback_members(type(checker)):
             cid = member[6:]
-            if cid == "default":
-                continue
-            if member.startswith("visit_"):
-                v_meth = getattr(checker, member)
-                # don't use visit_methods with no activated message:
-                if self._is_method_enabled(v_meth):
-                    visits[cid].append(v_meth)
+            meth = getattr(checker, member)
+            # don't use visit_methods and leave_methods with no activated message:
+            if self._is_method_enabled(meth):
+                if member.startswith("visit_"):
+                    visits[cid].append(meth)
                     vcids.add(cid)
-            elif member.startswith("leave_"):
-                l_meth = getattr(checker, member)
-                # don't use leave_methods with no activated message:
-                if self._is_method_enabled(l_meth):
-                    leaves[cid].append(l_meth)
-                    lcids.add(cid)
+                else:
+                    leaves[cid].append(meth)
         visit_default = getattr(checker, "visit_default", None)
-        if visit_default:
+        if visit_default and self._is_method_enabled(visit_default):
             for cls in nodes.ALL_NODE_CLASSES:
                 cid = cls.__name__.lower()
                 if cid not in vcids:
                     visits[cid].append(visit_default)
         # For now, we have no "leave_default" method in Pylint
 
+        self._dispatch.clear()
+        self._walk_expressions = any(
+            callbacks and cid not in _STATEMENT_CONTAINER_CIDS
+            for events in (visits, leaves)
+            for cid, callbacks in events.items()
+        )
+
+    def _add_dispatch(self, cls: type[nodes.NodeNG]) -> _Dispatch:
+        """Add the callbacks of a node class to the dispatch table, and return them."""
+        cid = cls.__name__.lower()
+        dispatch = self._dispatch[cls] = (
+            tuple(self.visit_events.get(cid, ())),
+            tuple(self.leave_events.get(cid, ())),
+            self._walk_expressions or cid in _STATEMENT_CONTAINER_CIDS,
+            cls.is_statement,
+        )
+        return dispatch
+
     def walk(self, astroid: nodes.NodeNG) -> None:
-        """Call visit events of astroid checkers for the given node, recurse on
-        its children, then leave events.
-        """
-        cid = astroid.__class__.__name__.lower()
+        """Call visit events of astroid checkers for the given node, walk its
+        children, then leave events.
 
-        visit_events = self.visit_events[cid]
-        leave_events = self.leave_events[cid]
+        The children of parts of expressions are not walked if no checker has
+        callbacks for any part of an expression.
+        """
+        dispatch = self._dispatch
+        # the nodes whose children are being walked, with their leave events and
+        # the children left to walk
+        stack: list[
+            tuple[nodes.NodeNG, tuple[AstCallback, ...], Iterator[nodes.NodeNG]]
+        ] = []
+        node = astroid
 
         # pylint: disable = too-many-try-statements
         try:
-            if astroid.is_statement:
-                self.nbstatements += 1
-            # generate events for this node on each checker
-            for callback in visit_events:
-                callback(astroid)
-            # recurse on children
-            for child in astroid.get_children():
-                self.walk(child)
-            for callback in leave_events:
-                callback(astroid)
+            while True:
+                try:
+                    visit_events, leave_events, descend, is_statement = dispatch[
+                        node.__class__
+                    ]
+                except KeyError:
+                    visit_events, leave_events, descend, is_statement = (
+                        self._add_dispatch(node.__class__)
+                    )
+                if is_statement:
+                    self.nbstatements += 1
+                # generate events for this node on each checker
+                for callback in visit_events:
+                    callback(node)
+                if descend:
+                    stack.append((node, leave_events, node.get_children()))
+                else:
+                    for callback in leave_events:
+                        callback(node)
+                # leave the nodes whose children have all been walked, until one
+                # has a child left to walk
+                while stack:
+                    node, leave_events, children = stack[-1]
+                    child = next(children, None)
+                    if child is not None:
+                        node = child
+                        break
+                    stack.pop()
+                    for callback in leave_events:
+                        callback(node)
+                else:
+                    return
         except Exception:
             if self.exception_msg is False:
-                file = getattr(astroid.root(), "file", None)
+                file = getattr(node.root(), "file", None)
                 print(
-                    f"Exception on node {astroid!r} in file '{file}'",
+                    f"Exception on node {node!r} in file '{file}'",
                     file=sys.stderr,
                 )
                 traceback.print_exc()
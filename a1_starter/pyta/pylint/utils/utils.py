@@ -4,16 +4,6 @@
 
 from __future__ import annotations
 
-try:
-    import isort.api
-    import isort.settings
-
-    HAS_ISORT_5 = True
-except ImportError:  # isort < 5
-    import isort
-
-    HAS_ISORT_5 = False
-
 import argparse
 import codecs
 import os
@@ -352,11 +342,33 @@ def _ini_format(stream: TextIO, options: list[tuple[str, OptionDict, Any]]) -> N
             print(f"{optname}={value}", file=stream)
 
 
+def _import_isort() -> bool:
+    """Import isort, which is slow to import, and return whether it is isort 5 or later."""
+    global HAS_ISORT_5, isort  # pylint: disable=global-statement
+    try:
+        import isort.api
+        import isort.settings
+
+        HAS_ISORT_5 = True
+    except ImportError:  # isort < 5
+        import isort
+
+        HAS_ISORT_5 = False
+    return HAS_ISORT_5
+
+
+def __getattr__(name: str) -> Any:
+    # HAS_ISORT_5 is only set once isort has been imported
+    if name == "HAS_ISORT_5":
+        return _import_isort()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class IsortDriver:
     """A wrapper around isort API that changed between versions 4 and 5."""
 
     def __init__(self, config: argparse.Namespace) -> None:
-        if HAS_ISORT_5:
+        if _import_isort():
             self.isort5_config = isort.settings.Config(
                 # There is no typo here. EXTRA_standard_library is
                 # what most users want. The option has been named
@@ -21,7 +21,6 @@ __version__ = "2.9.2"  # Version number
 # First, remove underscore from builtins if it has been bound in the REPL.
 # Must appear before other imports from pylint/python_ta.
 import builtins
-import subprocess
 
 try:
     del builtins._
@@ -29,13 +28,15 @@ except AttributeError:
     pass
 
 
+import copy
 import importlib.util
+import io
 import logging
 import os
 import sys
 import tokenize
-import webbrowser
 from builtins import FileNotFoundError
+from collections import defaultdict
 from os import listdir
 from typing import AnyStr, Generator, Optional, TextIO, Union
 
@@ -44,8 +45,10 @@ import pylint.lint
 import pylint.utils
 from astroid import MANAGER, modutils
 from pylint.lint import PyLinter
+from pylint.utils import LinterStats
 from pylint.utils.pragma_parser import OPTION_PO
 
+from . import cache as lint_cache
 from .config import (
     find_local_config,
     load_config,
@@ -54,8 +57,8 @@ from .config import (
 )
 from .patches import patch_all
 from .reporters import REPORTERS
-from .reporters.core import PythonTaReporter
-from .upload import upload_to_server
+from .reporters.core import NewMessage, PythonTaReporter
+from .source import forget_source, get_source
 
 HELP_URL = "http://www.cs.toronto.edu/~david/pyta/checkers/index.html"
 
@@ -70,6 +73,8 @@ def check_errors(
     output: Optional[TextIO] = None,
     load_default_config: bool = True,
     autoformat: Optional[bool] = False,
+    jobs: int = 1,
+    cache: bool = False,
 ) -> PythonTaReporter:
     """Check a module for errors, printing a report."""
     return _check(
@@ -79,6 +84,8 @@ def check_errors(
         output=output,
         load_default_config=load_default_config,
         autoformat=autoformat,
+        jobs=jobs,
+        cache=cache,
     )
 
 
@@ -88,6 +95,8 @@ def check_all(
     output: Optional[TextIO] = None,
     load_default_config: bool = True,
     autoformat: Optional[bool] = False,
+    jobs: int = 1,
+    cache: bool = False,
 ) -> PythonTaReporter:
     """Check a module for errors and style warnings, printing a report."""
     return _check(
@@ -97,6 +106,8 @@ def check_all(
         output=output,
         load_default_config=load_default_config,
         autoformat=autoformat,
+        jobs=jobs,
+        cache=cache,
     )
 
 
@@ -107,6 +118,8 @@ def _check(
     output: Optional[TextIO] = None,
     load_default_config: bool = True,
     autoformat: Optional[bool] = False,
+    jobs: int = 1,
+    cache: bool = False,
 ) -> PythonTaReporter:
     """Check a module for problems, printing a report.
 
@@ -120,11 +133,15 @@ def _check(
     `load_default_config` is used to specify whether to load the default .pylintrc file that comes
     with PythonTA. It will load it by default.
     `autoformat` is used to specify whether the black formatting tool is run. It is not run by default.
+    `jobs` is the number of processes used to check files in parallel. If it is 0, one process per
+    CPU is used. Messages are still reported in the same order as when checking files one at a time.
+    `cache` is used to specify whether to reuse the messages of files that were already checked with
+    the same contents and configuration (see python_ta/cache.py). It is not used by default.
     """
     # Configuring logger
     logging.basicConfig(format="[%(levelname)s] %(message)s", level=logging.NOTSET)
 
-    linter = reset_linter(config=local_config, load_default_config=load_default_config)
+    linter = _get_linter(config=local_config, load_default_config=load_default_config)
     current_reporter = linter.reporter
     current_reporter.set_output(output)
     messages_config_path = linter.config.messages_config_path
@@ -143,44 +160,44 @@ def _check(
 
     # Try to check file, issue error message for invalid files.
     try:
+        if jobs != 1:
+            if _check_parallel(
+                module_name,
+                level,
+                local_config,
+                load_default_config,
+                autoformat,
+                jobs,
+                linter,
+                messages_config,
+                cache,
+            ):
+                linter.generate_reports()
+            return current_reporter
+
         # Flag indicating whether at least one file has been checked
         is_any_file_checked = False
+        # Flag indicating whether at least one new cache entry has been saved
+        is_any_result_saved = False
 
         for locations in _get_valid_files_to_check(module_name):
             f_paths = []  # Paths to files for data submission
-            errs = []  # Errors caught in files for data submission
-            config = {}  # Configuration settings for data submission
             for file_py in get_file_paths(locations):
                 allowed_pylint = linter.config.allow_pylint_comments
                 if not _verify_pre_check(file_py, allowed_pylint):
+                    forget_source(file_py)
                     continue  # Check the other files
-                # Load config file in user location. Construct new linter each
+                # Load config file in user location. Get a freshly configured linter each
                 # time, so config options don't bleed to unintended files.
                 # Reuse the same reporter each time to accumulate the results across different files.
-                linter = reset_linter(
+                linter = _get_linter(
                     config=local_config,
                     file_linted=file_py,
                     load_default_config=load_default_config,
                 )
 
                 if autoformat:
-                    linelen = (
-                        local_config["max-line-length"] if "max-line-length" in local_config else 88
-                    )
-                    subprocess.run(
-                        [
-                            sys.executable,
-                            "-m",
-                            "black",
-                            "--skip-string-normalization",
-                            "--line-length=" + str(linelen),
-                            file_py,
-                        ],
-                        encoding="utf-8",
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
+                    _autoformat(file_py, local_config)
 
                 if not is_any_file_checked:
                     prev_output = current_reporter.out
@@ -197,11 +214,24 @@ def _check(
                 # The current file was checked so update the flag
                 is_any_file_checked = True
 
-                module_name = os.path.splitext(os.path.basename(file_py))[0]
-                if module_name in MANAGER.astroid_cache:  # Remove module from astroid cache
-                    del MANAGER.astroid_cache[module_name]
-                linter.check([file_py])  # Lint !
-                current_reporter.print_messages(level)
+                results = None
+                if cache:
+                    config = lint_cache.config_hash(linter, messages_config, __version__)
+                    key = lint_cache.cache_key(file_py, config)
+                    results = lint_cache.load_results(key)
+                if results is None:
+                    module_name = os.path.splitext(os.path.basename(file_py))[0]
+                    if module_name in MANAGER.astroid_cache:  # Remove module from astroid cache
+                        del MANAGER.astroid_cache[module_name]
+                    linter.check([file_py])  # Lint !
+                    if cache:
+                        is_any_result_saved |= lint_cache.save_results(
+                            key, _collect_results(current_reporter, [current_reporter.current_file])
+                        )
+                    current_reporter.print_messages(level)
+                else:
+                    _replay_results(current_reporter, results, level)
+                forget_source(file_py)
                 if linter.config.pyta_file_permission:
                     f_paths.append(file_py)  # Appending paths for upload
                 logging.info(
@@ -214,24 +244,12 @@ def _check(
                         file_py, messages_config_path
                     )
                 )
-            if linter.config.pyta_error_permission:
-                errs = list(current_reporter.messages.values())
-            if (
-                f_paths != [] or errs != []
-            ):  # Only call upload_to_server() if there's something to upload
-                # Checks if default configuration was used without changing options through the local_config argument
-                if linter.config_file[-19:-10] != "python_ta" or local_config != "":
-                    config = linter.config.__dict__
-                upload_to_server(
-                    errors=errs,
-                    paths=f_paths,
-                    config=config,
-                    url=linter.config.pyta_server_address,
-                    version=__version__,
-                )
+            _upload(linter, current_reporter, f_paths, local_config)
         # Only generate reports (display the webpage) if there were valid files to check
         if is_any_file_checked:
             linter.generate_reports()
+        if is_any_result_saved:
+            lint_cache.prune()
         return current_reporter
     except Exception as e:
         logging.error(
@@ -241,6 +259,229 @@ def _check(
         raise e
 
 
+def _autoformat(file_py: str, local_config: Union[dict, str]) -> None:
+    """Format file_py in place with black."""
+    import subprocess
+
+    linelen = local_config["max-line-length"] if "max-line-length" in local_config else 88
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "black",
+            "--skip-string-normalization",
+            "--line-length=" + str(linelen),
+            file_py,
+        ],
+        encoding="utf-8",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _upload(
+    linter: PyLinter,
+    reporter: PythonTaReporter,
+    f_paths: list[str],
+    local_config: Union[dict, str],
+) -> None:
+    """Upload the checked files f_paths and the errors in reporter, if the config of linter
+    gives permission to.
+    """
+    errs = []  # Errors caught in files for data submission
+    config = {}  # Configuration settings for data submission
+    if linter.config.pyta_error_permission:
+        errs = list(reporter.messages.values())
+    if f_paths != [] or errs != []:  # Only call upload_to_server() if there's something to upload
+        # The upload module imports requests, which is slow to import
+        from .upload import upload_to_server
+
+        # Checks if default configuration was used without changing options through the local_config argument
+        if linter.config_file[-19:-10] != "python_ta" or local_config != "":
+            config = linter.config.__dict__
+        upload_to_server(
+            errors=errs,
+            paths=f_paths,
+            config=config,
+            url=linter.config.pyta_server_address,
+            version=__version__,
+        )
+
+
+def _check_parallel(
+    module_name: Union[list[str], str],
+    level: str,
+    local_config: Union[dict, str],
+    load_default_config: bool,
+    autoformat: Optional[bool],
+    jobs: int,
+    linter: PyLinter,
+    messages_config: dict,
+    cache: bool,
+) -> bool:
+    """Check the files of module_name in a pool of jobs worker processes, and report their messages
+    through the reporter of linter in the order the files are found, as _check does.
+
+    Return whether at least one file was checked. The cache is pruned if the workers saved new
+    entries to it.
+    """
+    # concurrent.futures.process imports multiprocessing, and with it subprocess
+    from concurrent.futures import ProcessPoolExecutor
+
+    reporter = linter.reporter
+    # At this point, the only possible errors are those from parsing the config file
+    # so print them, if there are any.
+    if reporter.messages:
+        reporter.print_messages()
+
+    is_any_file_checked = False
+    is_any_result_saved = False
+    with ProcessPoolExecutor(
+        max_workers=jobs or None,
+        initializer=_init_worker,
+        initargs=(
+            local_config,
+            load_default_config,
+            autoformat,
+            messages_config,
+            linter.config.z3,
+            cache,
+        ),
+    ) as executor:
+        for locations in _get_valid_files_to_check(module_name):
+            f_paths = []
+            for file_py in get_file_paths(locations):
+                if _verify_pre_check(file_py, linter.config.allow_pylint_comments):
+                    f_paths.append(file_py)
+                # The worker that checks the file reads it again
+                forget_source(file_py)
+            for file_py, (results, saved) in zip(f_paths, executor.map(_check_in_worker, f_paths)):
+                is_any_file_checked = True
+                is_any_result_saved |= saved
+                _replay_results(reporter, results, level)
+                logging.info(
+                    "File: {} was checked using the configuration file: {}".format(
+                        file_py, linter.config_file
+                    )
+                )
+                logging.info(
+                    "File: {} was checked using the messages-config file: {}".format(
+                        file_py, linter.config.messages_config_path
+                    )
+                )
+            if not linter.config.pyta_file_permission:
+                f_paths = []
+            _upload(linter, reporter, f_paths, local_config)
+    if is_any_result_saved:
+        lint_cache.prune()
+    return is_any_file_checked
+
+
+# The settings of this worker process of a parallel check
+_worker_state = {}
+
+
+def _init_worker(
+    local_config: Union[dict, str],
+    load_default_config: bool,
+    autoformat: Optional[bool],
+    messages_config: dict,
+    z3: bool,
+    cache: bool,
+) -> None:
+    """Set up this process to check files for _check_parallel."""
+    global PYLINT_PATCHED
+    if not PYLINT_PATCHED:
+        patch_all(messages_config, z3)
+        PYLINT_PATCHED = True
+    _worker_state.update(
+        local_config=local_config,
+        load_default_config=load_default_config,
+        autoformat=autoformat,
+        messages_config=messages_config,
+        cache=cache,
+    )
+
+
+def _check_in_worker(file_py: str) -> tuple[lint_cache.Results, bool]:
+    """Check file_py in this worker process.
+
+    Return the messages for each file the reporter saw, as (message, snippet) pairs, and whether
+    they were saved as a new cache entry. Message nodes are dropped, since astroid nodes cannot be
+    sent between processes.
+    """
+    local_config = _worker_state["local_config"]
+    linter = _get_linter(
+        config=local_config,
+        file_linted=file_py,
+        load_default_config=_worker_state["load_default_config"],
+    )
+    # Config errors were already reported by the parent process
+    linter.reporter.messages.clear()
+
+    if _worker_state["autoformat"]:
+        _autoformat(file_py, local_config)
+
+    # The cache key and the check both load the source of file_py, which workers must not keep
+    try:
+        if _worker_state["cache"]:
+            config = lint_cache.config_hash(linter, _worker_state["messages_config"], __version__)
+            key = lint_cache.cache_key(file_py, config)
+            results = lint_cache.load_results(key)
+            if results is not None:
+                return results, False
+
+        module_name = os.path.splitext(os.path.basename(file_py))[0]
+        if module_name in MANAGER.astroid_cache:  # Remove module from astroid cache
+            del MANAGER.astroid_cache[module_name]
+        linter.check([file_py])
+
+        results = _collect_results(linter.reporter, list(linter.reporter.messages))
+        linter.reporter.messages.clear()
+    finally:
+        forget_source(file_py)
+    saved = _worker_state["cache"] and lint_cache.save_results(key, results)
+    return results, saved
+
+
+def _collect_results(reporter: PythonTaReporter, filepaths: list[str]) -> lint_cache.Results:
+    """Return the messages reporter has for each of filepaths, as (message, snippet) pairs.
+
+    Message nodes are dropped, since astroid nodes cannot be sent between processes or saved.
+    Only the snippets of the first pyta-number-of-messages messages of each kind in a file are
+    rendered, as the reporters do not output the others.
+    """
+    max_messages = reporter.linter.config.pyta_number_of_messages
+    results = []
+    for filepath in filepaths:
+        num_occurrences = defaultdict(int)
+        messages = []
+        for m in reporter.messages[filepath]:
+            num_occurrences[m.msg_id] += 1
+            if isinstance(m, NewMessage) and (
+                max_messages == 0 or num_occurrences[m.msg_id] <= max_messages
+            ):
+                messages.append((m.message, m.snippet))
+            else:
+                messages.append((getattr(m, "message", m), None))
+        results.append((filepath, messages))
+    return results
+
+
+def _replay_results(reporter: PythonTaReporter, results: lint_cache.Results, level: str) -> None:
+    """Report results, as returned by _collect_results, through reporter as if the files they
+    are for were just checked.
+    """
+    for filepath, messages in results:
+        reporter.current_file = filepath
+        reporter.messages[filepath] = [
+            message if snippet is None else NewMessage(message, None, snippet)
+            for message, snippet in messages
+        ]
+        reporter.print_messages(level)
+
+
 def reset_linter(
     config: Optional[Union[dict, str]] = None,
     file_linted: Optional[AnyStr] = None,
@@ -379,6 +620,77 @@ def reset_linter(
     return linter
 
 
+# The linters built by _get_linter, by effective config, each with a snapshot of its configured
+# state: its options, message states, reporter class and config file messages
+_linters = {}
+
+
+def _config_key(
+    config: Optional[Union[dict, str]], file_linted: Optional[AnyStr], load_default_config: bool
+) -> tuple:
+    """Return a key that is equal for all calls of reset_linter with these arguments that
+    configure the linter the same way.
+    """
+    if isinstance(config, str) and config != "":
+        config_files = [config]
+        config_options = None
+    else:
+        config_files = [find_local_config(file_linted) if file_linted else None]
+        config_options = repr(sorted(config.items())) if isinstance(config, dict) else None
+    if load_default_config:
+        config_files.append(find_local_config(os.path.dirname(__file__)))
+
+    # Config files can be edited between checks in the same process
+    mtimes = []
+    for config_file in config_files:
+        try:
+            mtimes.append(os.stat(config_file).st_mtime_ns if config_file else None)
+        except OSError:
+            mtimes.append(None)
+    return load_default_config, tuple(config_files), tuple(mtimes), config_options
+
+
+def _get_linter(
+    config: Optional[Union[dict, str]] = None,
+    file_linted: Optional[AnyStr] = None,
+    load_default_config: bool = True,
+) -> PyLinter:
+    """Return a linter configured as reset_linter(config, file_linted, load_default_config) would
+    configure a new one.
+
+    Building a linter loads every checker and parses the config files, which takes longer than
+    checking most files, so a linter is built once per effective config and then reused. Before
+    it is handed out again, its options and message states are restored to their configured
+    values and it is given a new reporter, so config options don't bleed between files.
+    """
+    key = _config_key(config, file_linted, load_default_config)
+    if key not in _linters:
+        linter = reset_linter(config, file_linted, load_default_config)
+        # Patching pylint changes the messages a linter registers when it is built
+        if not PYLINT_PATCHED:
+            return linter
+        _linters[key] = (
+            linter,
+            copy.deepcopy(vars(linter.config)),
+            dict(linter._msgs_state),
+            type(linter.reporter),
+            {filepath: list(messages) for filepath, messages in linter.reporter.messages.items()},
+        )
+        return linter
+
+    linter, options, msgs_state, reporter_class, config_messages = _linters[key]
+    vars(linter.config).clear()
+    vars(linter.config).update(copy.deepcopy(options))
+    linter._msgs_state = dict(msgs_state)
+    linter.stats = LinterStats()
+    linter.msg_status = 0
+    reporter = reporter_class()
+    for filepath, messages in config_messages.items():
+        reporter.messages[filepath] = list(messages)
+    linter.set_reporter(reporter)
+    return linter
+
+
 def get_file_paths(rel_path: AnyStr) -> Generator[AnyStr, None, None]:
     """A generator for iterating python files within a directory.
     `rel_path` is a relative path to a file or directory.
@@ -404,17 +716,16 @@ def _verify_pre_check(filepath: AnyStr, allow_pylint_comments: bool) -> bool:
         # trying to disable a check.
         if allow_pylint_comments:
             return True
-        with tokenize.open(os.path.expanduser(filepath)) as f:
-            for tok_type, content, _, _, _ in tokenize.generate_tokens(f.readline):
-                if tok_type != tokenize.COMMENT:
-                    continue
-                match = OPTION_PO.search(content)
-                if match is not None:
-                    logging.error(
-                        'String "pylint:" found in comment. '
-                        + "No check run on file `{}.`\n".format(filepath)
-                    )
-                    return False
+        for tok_type, content, _, _, _ in get_source(filepath).tokens:
+            if tok_type != tokenize.COMMENT:
+                continue
+            match = OPTION_PO.search(content)
+            if match is not None:
+                logging.error(
+                    'String "pylint:" found in comment. '
+                    + "No check run on file `{}.`\n".format(filepath)
+                )
+                return False
     except IndentationError as e:
         logging.error(
             "python_ta could not check your code due to an "
@@ -432,10 +743,10 @@ def _verify_pre_check(filepath: AnyStr, allow_pylint_comments: bool) -> bool:
             + "invalid character. Please check the following lines "
             "in your file and all characters that are marked with a �."
         )
-        with open(os.path.expanduser(filepath), encoding="utf-8", errors="replace") as f:
-            for i, line in enumerate(f):
-                if "�" in line:
-                    logging.error(f"  Line {i + 1}: {line}")
+        text = get_source(filepath).data.decode("utf-8", errors="replace")
+        for i, line in enumerate(io.StringIO(text, newline=None)):
+            if "�" in line:
+                logging.error(f"  Line {i + 1}: {line}")
         return False
     return True
 
@@ -483,6 +794,8 @@ def _get_valid_files_to_check(module_name: Union[list[str], str]) -> Generator[A
 
 def doc(msg_id: str) -> None:
     """Open a webpage explaining the error for the given message."""
+    import webbrowser
+
     msg_url = HELP_URL + "#" + msg_id.lower()
     print("Opening {} in a browser.".format(msg_url))
     webbrowser.open(msg_url)
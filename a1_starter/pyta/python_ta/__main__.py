@@ -39,6 +39,19 @@ CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
     help="Specify the format of output report. This option is ignored if a --config argument is specified.",
     default="python_ta.reporters.HTMLReporter",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=0),
+    help="Number of processes to check files with (0 uses one per CPU)",
+    default=1,
+)
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Reuse the messages of files already checked with the same contents and configuration",
+    default=False,
+)
 def main(
     version: bool,
     config: Optional[str],
@@ -47,6 +60,8 @@ def main(
     exit_zero: bool,
     generate_config: bool,
     output_format: str,
+    jobs: int,
+    cache: bool,
 ) -> None:
     """A code checking tool for teaching Python.
     FILENAMES can be a string of a directory, or file to check (`.py` extension optional) or
@@ -68,9 +83,11 @@ def main(
     paths = [click.format_filename(fn) for fn in filenames]
 
     if config is None:
-        reporter = checker(module_name=paths, config={"output-format": output_format})
+        reporter = checker(
+            module_name=paths, config={"output-format": output_format}, jobs=jobs, cache=cache
+        )
     else:
-        reporter = checker(module_name=paths, config=config)
+        reporter = checker(module_name=paths, config=config, jobs=jobs, cache=cache)
 
     if not exit_zero and reporter.has_messages():
         sys.exit(1)
@@ -0,0 +1,222 @@
+"""An on-disk cache of the messages reported for each checked file.
+
+Each entry holds the messages (with their rendered snippets) that a check of one file produced,
+and is stored under a key derived from the file's path and contents, the effective configuration
+of the linter that checked it, the messages config, and the PythonTA version. A file whose key
+is found in the cache does not need to be parsed or linted again.
+
+Messages about other modules, such as no-member on an imported module, are computed when the
+file importing them is checked, so an entry is not invalidated when only an imported module
+changes.
+
+Entries are stored as JSON rather than pickled, so that reading the cache cannot run code written
+to the cache directory by someone else.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Any, Optional
+
+import platformdirs
+from pylint.lint import PyLinter
+from pylint.interfaces import Confidence
+from pylint.message import Message
+from pylint.typing import MessageLocationTuple
+
+from .source import get_source
+
+# The messages for each file a check reported on, as (message, snippet) pairs
+Results = list[tuple[str, list[tuple[Message, Optional[str]]]]]
+
+CACHE_DIR = os.environ.get("PYTA_CACHE_HOME") or platformdirs.user_cache_dir("python_ta")
+
+# Entries are evicted once they have not been used for MAX_AGE seconds, and the least recently
+# used entries are evicted while the cache is larger than MAX_SIZE bytes.
+MAX_AGE = 30 * 24 * 60 * 60
+MAX_SIZE = 256 * 1024 * 1024
+
+# The cache is pruned at most once every PRUNE_INTERVAL seconds, as pruning visits every entry
+PRUNE_INTERVAL = 24 * 60 * 60
+
+_SUFFIX = ".json"
+
+# The file whose modification time is when the cache was last pruned
+_PRUNED_STAMP = "last-pruned"
+
+
+def _canonical(value: Any) -> Any:
+    """Return value in a form whose repr does not depend on the process that built it."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(repr(_canonical(item)) for item in value)
+    if isinstance(value, dict):
+        return sorted((repr(k), _canonical(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, re.Pattern):
+        return value.pattern, value.flags
+    return value
+
+
+def config_hash(linter: PyLinter, messages_config: dict, version: str) -> str:
+    """Return a hash of the effective configuration of linter, messages_config and PythonTA
+    version.
+
+    Checking a file can change the state of linter, so this must be called on a linter that has
+    not checked any files yet.
+    """
+    config = (
+        type(linter.reporter).__qualname__,
+        _canonical(vars(linter.config)),
+        _canonical(linter._msgs_state),
+        _canonical(messages_config),
+        version,
+    )
+    return hashlib.sha256(repr(config).encode("utf-8")).hexdigest()
+
+
+def cache_key(file_py: str, config: str) -> str:
+    """Return the cache key of checking file_py with the configuration whose config_hash is
+    config.
+    """
+    digest = hashlib.sha256()
+    digest.update(os.path.abspath(file_py).encode("utf-8", "surrogateescape"))
+    digest.update(hashlib.sha256(get_source(file_py).data).digest())
+    digest.update(config.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _encode_message(message: Message) -> list:
+    """Return message in a JSON-compatible form, from which _decode_message rebuilds it.
+
+    The path of the message is relative to the working directory of the check, so it is not
+    stored; _decode_message computes it from the absolute path.
+    """
+    abspath, _, *location = message.location
+    return [
+        message.msg_id,
+        message.symbol,
+        [abspath, *location],
+        message.msg,
+        list(message.confidence),
+    ]
+
+
+def _decode_message(data: list) -> Message:
+    """Return the message that _encode_message returned data for, with its path relative to the
+    current working directory, as PyLinter.add_message computes it.
+    """
+    msg_id, symbol, (abspath, *location), msg, confidence = data
+    path = abspath.replace(os.getcwd() + os.sep, "", 1) if abspath else "configuration"
+    return Message(
+        msg_id,
+        symbol,
+        MessageLocationTuple(abspath, path, *location),
+        msg,
+        Confidence(*confidence),
+    )
+
+
+def _encode(results: Results) -> list:
+    """Return results in a JSON-compatible form, from which _decode rebuilds them."""
+    return [
+        [filepath, [[_encode_message(message), snippet] for message, snippet in messages]]
+        for filepath, messages in results
+    ]
+
+
+def _decode(data: list) -> Results:
+    """Return the results that _encode returned data for."""
+    return [
+        (filepath, [(_decode_message(message), snippet) for message, snippet in messages])
+        for filepath, messages in data
+    ]
+
+
+def _entry_path(key: str) -> str:
+    """Return the path of the cache entry for key."""
+    return os.path.join(CACHE_DIR, key[:2], key + _SUFFIX)
+
+
+def load_results(key: str) -> Optional[Results]:
+    """Return the results cached under key, or None if there are none."""
+    path = _entry_path(key)
+    try:
+        with open(path, encoding="utf-8") as f:
+            results = _decode(json.load(f))
+        # Mark the entry as recently used
+        os.utime(path)
+    except Exception:  # pylint: disable=broad-except
+        # There's an issue with the cache but we just continue as if it isn't there
+        return None
+    return results
+
+
+def save_results(key: str, results: Results) -> bool:
+    """Cache results under key, and return whether the entry was written. The entry is replaced
+    atomically, so concurrent checks never read a partly written entry.
+    """
+    path = _entry_path(key)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            json.dump(_encode(results), f)
+        os.replace(temporary_path, path)
+    except (OSError, TypeError, ValueError):
+        # The cache is only an optimization, e.g. the cache directory may be read-only
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        return False
+    return True
+
+
+def prune(
+    max_size: int = MAX_SIZE, max_age: float = MAX_AGE, interval: float = PRUNE_INTERVAL
+) -> None:
+    """Evict the entries that have not been used for max_age seconds, then the least recently
+    used entries until the cache takes at most max_size bytes.
+
+    Do nothing if the cache was pruned less than interval seconds ago. Checks only need to call
+    this after they save new entries.
+    """
+    now = time.time()
+    stamp = os.path.join(CACHE_DIR, _PRUNED_STAMP)
+    try:
+        if now - os.stat(stamp).st_mtime < interval:
+            return
+    except OSError:
+        pass
+    try:
+        with open(stamp, "w", encoding="utf-8"):
+            pass
+    except OSError:
+        return
+
+    entries = []
+    for root, _, files in os.walk(CACHE_DIR):
+        for filename in files:
+            path = os.path.join(root, filename)
+            try:
+                status = os.stat(path)
+                if filename.endswith(_SUFFIX) and now - status.st_mtime <= max_age:
+                    entries.append((status.st_mtime, status.st_size, path))
+                elif now - status.st_mtime > max_age:
+                    # Also removes temporary files left behind by interrupted checks
+                    os.remove(path)
+            except OSError:
+                continue
+
+    size = sum(entry_size for _, entry_size, _ in entries)
+    for _, entry_size, path in sorted(entries):
+        if size <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        size -= entry_size
@@ -1,2 +1,3 @@
 from .graph import *
 from .visitor import *
+from .dataflow import *
@@ -0,0 +1,184 @@
+"""Bit-vector dataflow analyses over control flow graphs.
+
+The facts at each program point are sets of variable names, represented as int bitsets whose bit
+positions are given by a VariableBits. Each block's effect on the facts is summarized by a gen and
+a kill bitset, with the facts after the block being gen | (facts & ~kill), and the facts are
+propagated until they reach a fixpoint.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+from .graph import CFGBlock
+
+
+class VariableBits:
+    """A mapping from variable names to distinct bits, to represent sets of variables as ints.
+
+    Names are given the next free bit when they are first seen.
+    """
+
+    # Map from each variable name to its bit
+    _bits: Dict[str, int]
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._bits = {}
+        for name in names:
+            self.bit(name)
+
+    def bit(self, name: str) -> int:
+        """Return the bit of the variable name."""
+        bit = self._bits.get(name)
+        if bit is None:
+            bit = self._bits[name] = 1 << len(self._bits)
+        return bit
+
+    def bits(self, names: Iterable[str]) -> int:
+        """Return the bitset of the variables names."""
+        bits = 0
+        for name in names:
+            bits |= self.bit(name)
+        return bits
+
+    def names(self, bits: int) -> Set[str]:
+        """Return the names of the variables in the bitset bits."""
+        return {name for name, bit in self._bits.items() if bits & bit}
+
+
+class DataflowAnalysis:
+    """A dataflow analysis over the blocks of a control flow graph reachable from a start block.
+
+    A forward analysis propagates facts from the predecessors of each block, and a backward
+    analysis from its successors. A must analysis intersects the facts from several blocks, and a
+    may analysis takes their union. Blocks without any such neighbours start from no facts.
+
+    The gen and kill bitsets of each block are computed once, by gen_kill. Blocks are processed
+    from a worklist ordered by reverse postorder for a forward analysis and by postorder for a
+    backward one, which holds each block at most once.
+
+    When only_feasible is True, only blocks and edges that are feasible based on edge z3
+    constraints are taken into account.
+
+    Instance attributes:
+        blocks: the blocks of the analysis, in reverse postorder
+        in_facts: the facts flowing into each block, i.e. at its entry for a forward analysis and
+            at its exit for a backward one
+        out_facts: the facts flowing out of each block
+    """
+
+    blocks: List[CFGBlock]
+    in_facts: Dict[CFGBlock, int]
+    out_facts: Dict[CFGBlock, int]
+    _gen_kill: Callable[[CFGBlock], Tuple[int, int]]
+    _forward: bool
+    _must: bool
+    _only_feasible: bool
+    # Map from each block to its gen and kill bitsets
+    _summaries: Dict[CFGBlock, Tuple[int, int]]
+
+    def __init__(
+        self,
+        start: CFGBlock,
+        gen_kill: Callable[[CFGBlock], Tuple[int, int]],
+        forward: bool = True,
+        must: bool = True,
+        only_feasible: bool = False,
+    ) -> None:
+        self._gen_kill = gen_kill
+        self._forward = forward
+        self._must = must
+        self._only_feasible = only_feasible
+        self._summaries = {}
+        self.blocks = _postorder(start, only_feasible)
+        self.blocks.reverse()
+        self.in_facts = {}
+        self.out_facts = {}
+
+    def solve(self, initial: int = 0) -> None:
+        """Compute in_facts and out_facts, starting with initial as the facts flowing out of every
+        block.
+        """
+        order = self.blocks if self._forward else self.blocks[::-1]
+        priority = {block: i for i, block in enumerate(order)}
+        self.out_facts = dict.fromkeys(order, initial)
+
+        worklist = list(range(len(order)))
+        queued = [True] * len(order)
+        while worklist:
+            i = heapq.heappop(worklist)
+            queued[i] = False
+            block = order[i]
+
+            facts = None
+            for neighbour in self._sources(block):
+                if neighbour in priority:
+                    neighbour_facts = self.out_facts[neighbour]
+                    if facts is None:
+                        facts = neighbour_facts
+                    elif self._must:
+                        facts &= neighbour_facts
+                    else:
+                        facts |= neighbour_facts
+            if facts is None:
+                facts = 0
+            self.in_facts[block] = facts
+
+            if block not in self._summaries:
+                self._summaries[block] = self._gen_kill(block)
+            gen, kill = self._summaries[block]
+            facts = gen | (facts & ~kill)
+            if facts != self.out_facts[block]:
+                self.out_facts[block] = facts
+                for neighbour in self._targets(block):
+                    j = priority.get(neighbour)
+                    if j is not None and not queued[j]:
+                        queued[j] = True
+                        heapq.heappush(worklist, j)
+
+    def _sources(self, block: CFGBlock) -> List[CFGBlock]:
+        """Return the blocks whose facts flow into block."""
+        if self._forward:
+            return [
+                edge.source
+                for edge in block.predecessors
+                if not self._only_feasible or edge.is_feasible
+            ]
+        return [
+            edge.target for edge in block.successors if not self._only_feasible or edge.is_feasible
+        ]
+
+    def _targets(self, block: CFGBlock) -> List[CFGBlock]:
+        """Return the blocks that the facts of block flow into."""
+        if self._forward:
+            return [
+                edge.target
+                for edge in block.successors
+                if not self._only_feasible or edge.is_feasible
+            ]
+        return [
+            edge.source
+            for edge in block.predecessors
+            if not self._only_feasible or edge.is_feasible
+        ]
+
+
+def _postorder(start: CFGBlock, only_feasible: bool) -> List[CFGBlock]:
+    """Return the blocks reachable from start in the order of a post-order traversal, as in
+    ControlFlowGraph.get_blocks_postorder.
+    """
+    postorder = []
+    visited = {start}
+    stack = [(start, iter(start.successors))]
+    while stack:
+        block, successors = stack[-1]
+        for edge in successors:
+            if (not only_feasible or edge.is_feasible) and edge.target not in visited:
+                visited.add(edge.target)
+                stack.append((edge.target, iter(edge.target.successors)))
+                break
+        else:
+            stack.pop()
+            postorder.append(block)
+    return postorder
@@ -1,32 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Generator, List, Optional, Set
-
-try:
-    from z3 import (
-        Z3_OP_UNINTERPRETED,
-        ExprRef,
-        Not,
-        Solver,
-        Z3Exception,
-        is_const,
-        unsat,
-    )
-
-    from ..z3.z3_parser import Z3ParseException, Z3Parser
-
-    z3_dependency_available = True
-except ImportError:
-    ExprRef = Any
-    Z3Parser = Any
-    Not = Any
-    Z3Exception = Any
-    is_const = Any
-    Z3_OP_UNINTERPRETED = Any
-    Z3ParseException = Any
-    Solver = Any
-    unsat = Any
-    z3_dependency_available = False
+import importlib.util
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Set
 
 from astroid import (
     AnnAssign,
@@ -41,6 +16,17 @@ from astroid import (
     Return,
 )
 
+if TYPE_CHECKING:
+    from z3 import ExprRef
+
+# z3 is slow to import, so it is only imported by the functions that use it, when they are called
+z3_dependency_available = importlib.util.find_spec("z3") is not None
+
+# Budget of the feasibility analysis of a single graph: the maximum number of edge traversals.
+# It bounds the work without a wall-clock limit, so results do not depend on the machine's load.
+# See ControlFlowGraph.update_edge_feasibility.
+FEASIBILITY_MAX_STEPS = 10000
+
 
 class ControlFlowGraph:
     """A graph representing the control flow of a Python program."""
@@ -55,8 +41,8 @@ class ControlFlowGraph:
     unreachable_blocks: Set[CFGBlock]
     # z3 constraints of preconditions
     precondition_constraints: List[ExprRef]
-    # map from variable names to z3 variables
-    _z3_vars: Dict[str, ExprRef]
+    # the arguments of the function, whose types give the z3 variables
+    _arguments: Optional[Arguments]
 
     def __init__(self, cfg_id: int = 0) -> None:
         self.block_count = 0
@@ -64,19 +50,14 @@ class ControlFlowGraph:
         self.unreachable_blocks = set()
         self.start = self.create_block()
         self.end = self.create_block()
-        self._z3_vars = {}
+        self._arguments = None
         self.precondition_constraints = []
 
     def add_arguments(self, args: Arguments) -> None:
         self.start.add_statement(args)
         args.parent.cfg = self
         args.parent.cfg_block = self.start
-
-        if ExprRef is not Any:
-            # Parse types
-            parser = Z3Parser()
-            z3_vars = parser.parse_arguments(args)
-            self._z3_vars.update(z3_vars)
+        self._arguments = args
 
     def create_block(
         self,
@@ -261,8 +242,10 @@ class ControlFlowGraph:
             if block in self.unreachable_blocks:
                 self.unreachable_blocks.remove(block)
 
-    def update_edge_z3_constraints(self) -> None:
-        """Traverse through edges and add Z3 constraints on each edge.
+    def update_edge_feasibility(self) -> None:
+        """Traverse through paths in DFS order and update the is_feasible attribute of each edge.
+        Edges that are unreachable with the given set of Z3 constraints will have is_feasible set
+        to False.
 
         Constraints are generated from:
         - Function preconditions
@@ -270,31 +253,136 @@ class ControlFlowGraph:
         - While conditions
 
         Constraints with reassigned variables are not included in subsequent edges.
+
+        An edge is feasible if the constraints on at least one path from the start block up to and
+        including the edge are satisfiable. The paths are those of get_paths, walked once with a
+        single incremental solver whose assertions follow the current path. The satisfiability of
+        each distinct set of constraints is checked once, and the walk does not go into blocks
+        from which every reachable edge is already known to be feasible.
+
+        The walk takes at most FEASIBILITY_MAX_STEPS edge traversals. If it runs out of them, it is
+        abandoned and every edge is assumed to be feasible, as when z3 is not available.
         """
-        if not z3_dependency_available:
+        global z3_dependency_available
+        if not z3_dependency_available or not self.start.successors:
+            return
+
+        try:
+            from z3 import Not, Solver, unsat
+
+            from ..z3.z3_parser import Z3Parser
+        except ImportError:
+            # z3 is installed but cannot be imported, e.g. if its library fails to load
+            z3_dependency_available = False
             return
 
-        for path_id, path in enumerate(self.get_paths()):
-            # starting a new path
-            z3_environment = Z3Environment(self._z3_vars, self.precondition_constraints)
-            for edge in path:
-                # traverse through edge
-                if edge.condition is not None:
-                    condition_z3_constraint = z3_environment.parse_constraint(edge.condition)
-                    if condition_z3_constraint is not None:
-                        if edge.negate is not None:
-                            z3_environment.add_constraint(
-                                Not(condition_z3_constraint)
-                                if edge.negate
-                                else condition_z3_constraint
-                            )
-
-                edge.z3_constraints[path_id] = z3_environment.update_constraints()
+        z3_vars = {}
+        if self._arguments is not None:
+            # Parse types
+            z3_vars = Z3Parser().parse_arguments(self._arguments)
+        environment = Z3Environment(z3_vars, self.precondition_constraints)
+        solver = Solver()
+        # The keys of the constraints asserted in solver, one per solver scope
+        asserted = []
+        # Map from each set of constraint keys to whether the set is satisfiable
+        satisfiable = {}
+        # Map from each edge with a condition to its constraint
+        edge_constraints = {}
+        # Map from each block to the edges reachable from it
+        reachable_edges = {}
+        seen_edges = set()
+        feasible_edges = set()
+        visited_edges = set()
+        visited_nodes = set()
+        steps = 0
+
+        def _edge_constraint(edge: CFGEdge) -> Optional[ExprRef]:
+            if edge not in edge_constraints:
+                constraint = environment.parse_constraint(edge.condition)
+                if constraint is not None and edge.negate is not None:
+                    edge_constraints[edge] = Not(constraint) if edge.negate else constraint
+                else:
+                    edge_constraints[edge] = None
+            return edge_constraints[edge]
+
+        def _is_satisfiable(constraints: List[ExprRef]) -> bool:
+            keys = [_constraint_key(constraint) for constraint in constraints]
+            key_set = frozenset(keys)
+            if key_set not in satisfiable:
+                # Keep the longest prefix of the current assertions that the constraints share
+                common = 0
+                while (
+                    common < len(asserted)
+                    and common < len(keys)
+                    and asserted[common] == keys[common]
+                ):
+                    common += 1
+                solver.pop(len(asserted) - common)
+                del asserted[common:]
+                for key, constraint in zip(keys[common:], constraints[common:]):
+                    solver.push()
+                    solver.add(constraint)
+                    asserted.append(key)
+                satisfiable[key_set] = solver.check() != unsat
+            return satisfiable[key_set]
+
+        def _is_settled(block: CFGBlock) -> bool:
+            if block not in reachable_edges:
+                reachable_edges[block] = set(self._get_edges(block, set()))
+            return reachable_edges[block] <= feasible_edges
+
+        def _dfs(current_edge: CFGEdge) -> bool:
+            """Return False if the walk ran out of its budget."""
+            nonlocal steps
+            if current_edge in visited_edges:
+                return True
+
+            steps += 1
+            if steps > FEASIBILITY_MAX_STEPS:
+                return False
+
+            seen_edges.add(current_edge)
+            visited_edges.add(current_edge)
+            visited_nodes.add(current_edge.source)
 
+            # traverse through edge
+            if current_edge.condition is not None:
+                constraint = _edge_constraint(current_edge)
+                if constraint is not None:
+                    environment.add_constraint(constraint)
+            constraints = environment.update_constraints()
+            if current_edge not in feasible_edges and _is_satisfiable(constraints):
+                feasible_edges.add(current_edge)
+
+            completed = True
+            target = current_edge.target
+            if not (
+                target == self.end
+                or target in visited_nodes
+                or set(target.successors).issubset(visited_edges)
+                or _is_settled(target)
+            ):
                 # traverse into target node
-                for node in edge.target.statements:
+                for node in target.statements:
                     if isinstance(node, (Assign, AugAssign, AnnAssign)):
-                        self._handle_variable_reassignment(node, z3_environment)
+                        self._handle_variable_reassignment(node, environment)
+
+                path_constraints = environment.constraints
+                path_variables = environment.variable_unassigned
+                for edge in target.successors:
+                    environment.constraints = path_constraints.copy()
+                    environment.variable_unassigned = path_variables.copy()
+                    if not _dfs(edge):
+                        completed = False
+                        break
+
+            visited_edges.remove(current_edge)
+            visited_nodes.remove(current_edge.source)
+            return completed
+
+        completed = _dfs(self.start.successors[0])
+        for edge in seen_edges:
+            edge.is_feasible = not completed or edge in feasible_edges
 
     def _handle_variable_reassignment(self, node: NodeNG, env: Z3Environment) -> None:
         """Check for reassignment statements and invoke Z3 environment"""
@@ -305,25 +393,6 @@ class ControlFlowGraph:
         elif isinstance(node, (AugAssign, AnnAssign)):
             env.assign(node.target.name)
 
-    def update_edge_feasibility(self) -> None:
-        """Traverse through edges in DFS order and update is_feasible
-        attribute of each edge. Edges that are unreachable with the given
-        set of Z3 constraints will have is_feasible set to False
-        """
-        if not z3_dependency_available:
-            return
-
-        def _check_unsat(constraints: List[ExprRef]) -> bool:
-            solver = Solver()
-            solver.add(constraints)
-            return solver.check() == unsat
-
-        for edge in self.get_edges():
-            if len(edge.z3_constraints) > 0:
-                edge.is_feasible = not all(
-                    _check_unsat(constraints) for constraints in edge.z3_constraints.values()
-                )
-
 
 class CFGBlock:
     """A node in a control flow graph.
@@ -385,7 +454,6 @@ class CFGEdge:
     label: Optional[str]
     condition: Optional[NodeNG]
     negate: Optional[bool]
-    z3_constraints: Dict[int, List[ExprRef]]
     is_feasible: bool
 
     def __init__(
@@ -403,7 +471,6 @@ class CFGEdge:
         self.negate = negate
         self.source.successors.append(self)
         self.target.predecessors.append(self)
-        self.z3_constraints = {}
         self.is_feasible = True
 
     def get_label(self) -> Optional[str]:
@@ -435,12 +502,15 @@ class Z3Environment:
     variable_unassigned: Dict[str, bool]
     variables: Dict[str, ExprRef]
     constraints: List[ExprRef]
+    # map from the keys of constraints to their variables
+    _constraint_vars: Dict[Any, Set[str]]
 
     def __init__(self, variables: Dict[str, ExprRef], constraints: List[ExprRef]) -> None:
         """Initialize the environment with function parameters and preconditions"""
         self.variable_unassigned = {var: True for var in variables}
         self.variables = variables
         self.constraints = constraints.copy()
+        self._constraint_vars = {}
 
     def assign(self, name: str) -> None:
         """Handle a variable assignment statement"""
@@ -454,7 +524,10 @@ class Z3Environment:
         updated_constraints = []
         for constraint in self.constraints:
             # discard expressions with reassigned variables
-            variables = _get_vars(constraint)
+            key = _constraint_key(constraint)
+            if key not in self._constraint_vars:
+                self._constraint_vars[key] = _get_vars(constraint)
+            variables = self._constraint_vars[key]
             reassigned = any(
                 not self.variable_unassigned.get(variable, False) for variable in variables
             )
@@ -472,6 +545,10 @@ class Z3Environment:
         """Parse an Astroid node to a Z3 constraint
         Return the resulting expression
         """
+        from z3 import Z3Exception
+
+        from ..z3.z3_parser import Z3ParseException, Z3Parser
+
         parser = Z3Parser(self.variables)
         try:
             return parser.parse(node)
@@ -481,6 +558,8 @@ class Z3Environment:
 
 def _get_vars(expr: ExprRef) -> Set[str]:
     """Retrieve all z3 variables from a z3 expression"""
+    from z3 import Z3_OP_UNINTERPRETED, is_const
+
     variables = set()
 
     def traverse(e: ExprRef) -> None:
@@ -492,3 +571,13 @@ def _get_vars(expr: ExprRef) -> Set[str]:
 
     traverse(expr)
     return variables
+
+
+def _constraint_key(constraint: ExprRef) -> Any:
+    """Return a key that is equal for structurally equal z3 constraints"""
+    from z3 import ExprRef
+
+    if isinstance(constraint, ExprRef):
+        return constraint.get_id()
+    # A Python value, e.g. the condition of `while True`
+    return type(constraint), repr(constraint)
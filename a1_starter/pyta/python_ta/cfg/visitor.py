@@ -4,8 +4,6 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from astroid import extract_node, nodes
 from astroid.exceptions import AstroidSyntaxError
 
-from python_ta.contracts import parse_assertions
-
 from .graph import CFGBlock, ControlFlowGraph
 
 
@@ -22,6 +20,11 @@ class CFGVisitor:
             This option specifies whether to restrict the creation of cfgs to just top-level
             function definitions or methods provided in this list. By default, it will create the
             cfg for the file as it normally would.
+      - "nested-functions": bool
+            This option specifies whether to create the cfgs of the functions defined in the module
+            or function being visited. If False, their definitions are only added as statements to
+            the enclosing cfg, and each cfg can be created separately by visiting its function. By
+            default, it will create them.
 
     Private Attributes:
     _control_boundaries: A stack of the boundaries the visitor is currently in.
@@ -43,6 +46,7 @@ class CFGVisitor:
         self.options = {
             "separate-condition-blocks": False,
             "functions": [],
+            "nested-functions": True,
         }
         if options is not None:
             self.options.update(options)
@@ -108,6 +112,8 @@ class CFGVisitor:
 
         if self._current_block is not None:
             self._current_block.add_statement(func)
+            if not self.options.get("nested-functions", True):
+                return
 
         previous_cfg = self._current_cfg
         previous_block = self._current_block
@@ -145,7 +151,6 @@ class CFGVisitor:
 
         if hasattr(func, "z3_constraints"):
             self._current_cfg.precondition_constraints = func.z3_constraints
-            self._current_cfg.update_edge_z3_constraints()
             self._current_cfg.update_edge_feasibility()
 
         self._current_block = previous_block
@@ -473,6 +478,9 @@ def _get_preconditions_node(func: nodes.FunctionDef) -> Optional[nodes.NodeNG]:
     """A helper method that takes in a function definition node, retrieves its preconditions, and then parses them
     into a AST node representing all the valid Python preconditions combined in an and statement. Returns None if
     there are no valid Python preconditions."""
+    # python_ta.contracts imports typeguard and wrapt, so it is only imported once it is needed
+    from python_ta.contracts import parse_assertions
+
     valid_assertions = [
         f"({assertion})"
         for assertion in parse_assertions(func)
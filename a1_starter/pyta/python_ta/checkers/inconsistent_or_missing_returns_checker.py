@@ -12,6 +12,7 @@ from pylint.lint import PyLinter
 
 class InconsistentReturnChecker(BaseChecker):
     name = "inconsistent-or-missing-returns"
+    requires_cfg = True
     msgs = {
         "R9710": (
             """This function has inconsistent return statements: it sometimes returns a non-None value and sometimes uses `return` without a value.
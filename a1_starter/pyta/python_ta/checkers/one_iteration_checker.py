@@ -11,6 +11,7 @@ from pylint.lint import PyLinter
 
 class OneIterationChecker(BaseChecker):
     name = "one_iteration"
+    requires_cfg = True
     msgs = {
         "E9996": (
             "This loop will only ever run for one iteration",
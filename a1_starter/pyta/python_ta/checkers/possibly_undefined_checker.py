@@ -11,7 +11,8 @@ from pylint.checkers import BaseChecker, utils
 from pylint.checkers.utils import only_required_for_messages
 from pylint.lint import PyLinter
 
-from python_ta.cfg.graph import CFGBlock, ControlFlowGraph
+from python_ta.cfg.dataflow import DataflowAnalysis, VariableBits
+from python_ta.cfg.graph import CFGBlock
 
 
 class PossiblyUndefinedChecker(BaseChecker):
@@ -19,6 +20,7 @@ class PossiblyUndefinedChecker(BaseChecker):
     is executed"""
 
     name = "possibly_undefined"
+    requires_cfg = True
     msgs = {
         "E9969": (
             "This variable might not be defined when this statement is executed.",
@@ -41,6 +43,7 @@ class PossiblyUndefinedChecker(BaseChecker):
     def __init__(self, linter=None) -> None:
         super().__init__(linter=linter)
         self._possibly_undefined: set[nodes.Name] = set()
+        self._variables = VariableBits()
 
     @only_required_for_messages("possibly-undefined")
     def visit_name(self, node: nodes.Name) -> None:
@@ -64,61 +67,50 @@ class PossiblyUndefinedChecker(BaseChecker):
         Data flow algorithms retrieved from:
         https://www.seas.harvard.edu/courses/cs252/2011sp/slides/Lec02-Dataflow.pdf#page=31
         """
-        out_facts = {}
-        cfg = ControlFlowGraph()
-        cfg.start = node.cfg_block
-        blocks = list(cfg.get_blocks_postorder(only_feasible=self.linter.config.z3))
-        blocks.reverse()
-
-        all_assigns = self._get_assigns(node)
-        for block in blocks:
-            out_facts[block] = all_assigns.copy()
-
-        worklist = blocks
-        while len(worklist) != 0:
-            b = worklist.pop()
-            outs = [
-                out_facts[p.source]
-                for p in b.predecessors
-                if p.source in out_facts and (not self.linter.config.z3 or p.is_feasible)
-            ]
-            if outs == []:
-                in_facts = set()
+        self._variables = VariableBits()
+        all_assigns = self._variables.bits(self._get_assigns(node))
+        analysis = DataflowAnalysis(
+            node.cfg_block, self._gen_kill, only_feasible=self.linter.config.z3
+        )
+        analysis.solve(all_assigns)
+        for block in analysis.blocks:
+            self._transfer(block, analysis.in_facts[block], all_assigns)
+
+    def _gen_kill(self, block: CFGBlock) -> tuple[int, int]:
+        gen = 0
+        kill = 0
+        for node in self._get_block_nodes(block):
+            if isinstance(node, nodes.AssignName):
+                gen |= self._variables.bit(node.name)
+            elif isinstance(node, nodes.DelName):
+                kill |= self._variables.bit(node.name)
+        return gen & ~kill, kill
+
+    def _transfer(self, block: CFGBlock, in_facts: int, local_vars: int) -> None:
+        gen = in_facts
+        kill = 0
+        for node in self._get_block_nodes(block):
+            if isinstance(node, nodes.AssignName):
+                gen |= self._variables.bit(node.name)
+            elif isinstance(node, nodes.DelName):
+                kill |= self._variables.bit(node.name)
             else:
-                in_facts = set.intersection(*outs)
-            temp = self._transfer(b, in_facts, all_assigns)
-            if temp != out_facts[b]:
-                out_facts[b] = temp
-                worklist.extend(
-                    [
-                        succ.target
-                        for succ in b.successors
-                        if not self.linter.config.z3 or succ.is_feasible
-                    ]
-                )
-
-    def _transfer(self, block: CFGBlock, in_facts: set[str], local_vars: set[str]) -> set[str]:
-        gen = in_facts.copy()
-        kill = set()
+                name = node.name
+                bit = self._variables.bit(name)
+                if (
+                    not (name in nodes.Module.scope_attrs or utils.is_builtin(name))
+                    and local_vars & bit
+                    and not gen & ~kill & bit
+                ):
+                    self._possibly_undefined.add(node)
+                elif node in self._possibly_undefined:
+                    self._possibly_undefined.remove(node)
+
+    def _get_block_nodes(self, block: CFGBlock) -> Generator[nodes.NodeNG, None, None]:
+        """Generate the `AssignName`, `DelName` and `Name` nodes of block in evaluation order."""
         for statement in block.statements:
-            if isinstance(statement, nodes.FunctionDef):
-                continue
-            for node in self.get_nodes(statement):
-                if isinstance(node, nodes.AssignName):
-                    gen.add(node.name)
-                elif isinstance(node, nodes.DelName):
-                    kill.add(node.name)
-                else:
-                    name = node.name
-                    if (
-                        not (name in nodes.Module.scope_attrs or utils.is_builtin(name))
-                        and name in local_vars
-                        and name not in gen.difference(kill)
-                    ):
-                        self._possibly_undefined.add(node)
-                    elif node in self._possibly_undefined:
-                        self._possibly_undefined.remove(node)
-        return gen.difference(kill)
+            if not isinstance(statement, nodes.FunctionDef):
+                yield from self.get_nodes(statement)
 
     def _get_assigns(self, node: Union[nodes.FunctionDef, nodes.Module]) -> set[str]:
         """Returns a set of all local and parameter variables that could be
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import pycodestyle
+from functools import cache
+
 from astroid import nodes
 from pylint.checkers import BaseRawFileChecker
 from pylint.lint import PyLinter
 
+from python_ta.source import get_source
+
 
 class PycodestyleChecker(BaseRawFileChecker):
     """A checker class to report PEP8 style errors in the file.
@@ -29,24 +32,46 @@ class PycodestyleChecker(BaseRawFileChecker):
     )
 
     def process_module(self, node: nodes.NodeNG) -> None:
+        import pycodestyle
+
         style_guide = pycodestyle.StyleGuide(
-            paths=[node.stream().name],
-            reporter=JSONReport,
+            paths=[node.file],
+            reporter=_json_report(),
             ignore=self.linter.config.pycodestyle_ignore,
         )
-        report = style_guide.check_files()
+        report = style_guide.options.report
+        report.start()
+        style_guide.input_file(node.file, lines=get_source(node.file).lines)
+        report.stop()
 
         for line_num, msg, code in report.get_file_results():
             self.add_message("pep8-errors", line=line_num, args=(code, msg))
 
 
-class JSONReport(pycodestyle.StandardReport):
-    def get_file_results(self) -> list[tuple]:
-        self._deferred_print.sort()
-        return [
-            (line_number, f"line {line_number}, column {offset}: {text}", code)
-            for line_number, offset, code, text, _ in self._deferred_print
-        ]
+@cache
+def _json_report() -> type:
+    """Return a pycodestyle report class that collects the results of a file.
+
+    The class is created on first use, so pycodestyle is only imported when this checker runs.
+    """
+    import pycodestyle
+
+    class JSONReport(pycodestyle.StandardReport):
+        def get_file_results(self) -> list[tuple]:
+            self._deferred_print.sort()
+            return [
+                (line_number, f"line {line_number}, column {offset}: {text}", code)
+                for line_number, offset, code, text, _ in self._deferred_print
+            ]
+
+    return JSONReport
+
+
+def __getattr__(name: str) -> type:
+    """Return JSONReport, created by _json_report when it is first accessed."""
+    if name == "JSONReport":
+        return _json_report()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def register(linter: PyLinter) -> None:
@@ -11,14 +11,15 @@ An assignment statement is redundant if it satisfies the following two propertie
 
 from __future__ import annotations
 
-from typing import Union
+from typing import Generator, Union
 
 from astroid import nodes
 from pylint.checkers import BaseChecker
 from pylint.checkers.utils import only_required_for_messages
 from pylint.lint import PyLinter
 
-from python_ta.cfg.graph import CFGBlock, ControlFlowGraph
+from python_ta.cfg.dataflow import DataflowAnalysis, VariableBits
+from python_ta.cfg.graph import CFGBlock
 
 
 class RedundantAssignmentChecker(BaseChecker):
@@ -32,6 +33,7 @@ class RedundantAssignmentChecker(BaseChecker):
     the behavior of the program."""
 
     name = "redundant_assignment"
+    requires_cfg = True
     msgs = {
         "E9959": (
             "Assigning to variable(s) %s here is redundant, because they are not used before getting reassigned later."
@@ -58,6 +60,7 @@ class RedundantAssignmentChecker(BaseChecker):
         self._redundant_assignment: dict[
             nodes.Assign | nodes.AugAssign | nodes.AnnAssign, list[str]
         ] = {}
+        self._variables = VariableBits()
 
     @only_required_for_messages("redundant-assignment")
     def visit_assign(self, node: nodes.Assign) -> None:
@@ -94,49 +97,88 @@ class RedundantAssignmentChecker(BaseChecker):
         Data flow algorithms retrieved from:
         https://www.seas.harvard.edu/courses/cs252/2011sp/slides/Lec02-Dataflow.pdf#page=31
         """
-        # Stores all the variable names that will be re-defined before any usage at a
+        # The facts are the variable names that will be re-defined before any usage at a
         # particular program point.
-        out_facts = {}
-        cfg = ControlFlowGraph()
-        cfg.start = node.cfg_block
-        worklist = list(cfg.get_blocks_postorder(only_feasible=self.linter.config.z3))
-        worklist.reverse()
-
-        all_assigns = self._get_assigns(node)
-        for block in worklist:
-            out_facts[block] = all_assigns.copy()
-
-        while len(worklist) != 0:
-            b = worklist.pop()
-            outs = [
-                out_facts[p.target]
-                for p in b.successors
-                if p.target in out_facts and (not self.linter.config.z3 or p.is_feasible)
-            ]
-            if outs == []:
-                in_facts = set()
+        self._variables = VariableBits()
+        all_assigns = self._variables.bits(self._get_assigns(node))
+        analysis = DataflowAnalysis(
+            node.cfg_block, self._gen_kill, forward=False, only_feasible=self.linter.config.z3
+        )
+        analysis.solve(all_assigns)
+        for block in analysis.blocks:
+            self._transfer(block, analysis.in_facts[block])
+
+    def _gen_kill(self, block: CFGBlock) -> tuple[int, int]:
+        gen = 0
+        kill = 0
+        for node in self._get_block_nodes(block):
+            if isinstance(node, nodes.AssignName):
+                parent = (
+                    node.parent.parent if isinstance(node.parent, nodes.Tuple) else node.parent
+                )
+                if isinstance(parent, nodes.AnnAssign) and parent.value is None:
+                    continue
+                bit = self._variables.bit(node.name)
+                if isinstance(node.parent, nodes.AugAssign):
+                    kill |= bit
+                else:
+                    kill &= ~bit
+                gen |= bit
+            elif isinstance(node, (nodes.Nonlocal, nodes.Global)):
+                kill &= ~self._variables.bits(node.names)
             else:
-                in_facts = set.intersection(*outs)
-            temp = self._transfer(b, in_facts)
-            if b in out_facts and temp != out_facts[b]:
-                out_facts[b] = temp
-                worklist.extend(
-                    [
-                        pred.source
-                        for pred in b.predecessors
-                        if pred.source.reachable and (not self.linter.config.z3 or pred.is_feasible)
-                    ]
+                kill |= self._variables.bit(node.name)
+        return gen & ~kill, kill
+
+    def _transfer(self, block: CFGBlock, out_facts: int) -> None:
+        gen = out_facts
+        kill = 0
+        for node in self._get_block_nodes(block):
+            if isinstance(node, nodes.AssignName):
+                # checking for parent node that accounts for parallel assignment
+                parent = (
+                    node.parent.parent if isinstance(node.parent, nodes.Tuple) else node.parent
                 )
+                if isinstance(parent, nodes.AnnAssign) and parent.value is None:
+                    continue
+                bit = self._variables.bit(node.name)
+                if gen & ~kill & bit:
+                    # add redundant assignment
+                    if parent not in self._redundant_assignment:
+                        self._redundant_assignment[parent] = []
+                    if node.name not in self._redundant_assignment[parent]:
+                        self._redundant_assignment[parent].append(node.name)
+                elif (
+                    parent in self._redundant_assignment
+                    and node.name in self._redundant_assignment[parent]
+                ):
+                    # remove redundant assignment
+                    self._redundant_assignment[parent].remove(node.name)
+                    if len(self._redundant_assignment[parent]) == 0:
+                        self._redundant_assignment.pop(parent)
+
+                # When node.parent is an AugAssign, the name counts as a use of the variable,
+                # and so is added to kill.
+                if isinstance(node.parent, nodes.AugAssign):
+                    kill |= bit
+                else:
+                    kill &= ~bit
+                gen |= bit
+            elif isinstance(node, (nodes.Nonlocal, nodes.Global)):
+                kill &= ~self._variables.bits(node.names)
+            else:
+                kill |= self._variables.bit(node.name)
 
-    def _transfer(self, block: CFGBlock, out_facts: set[str]) -> set[str]:
-        gen = out_facts.copy()
-        kill = set()
+    def _get_block_nodes(self, block: CFGBlock) -> Generator[nodes.NodeNG, None, None]:
+        """Generate the nodes of block that assign, use or declare variables, from the last
+        statement to the first.
+        """
         for statement in reversed(block.statements):
             if isinstance(statement, nodes.FunctionDef):
                 # `nodes_of_class` below doesnt block looking for required nodes
                 # in function definitions, hence this case.
                 continue
-            for node in statement.nodes_of_class(
+            yield from statement.nodes_of_class(
                 (
                     nodes.AssignName,
                     nodes.DelName,
@@ -145,42 +187,7 @@ class RedundantAssignmentChecker(BaseChecker):
                     nodes.Global,
                 ),
                 nodes.FunctionDef,
-            ):
-                if isinstance(node, nodes.AssignName):
-                    # checking for parent node that accounts for parallel assignment
-                    parent = (
-                        node.parent.parent if isinstance(node.parent, nodes.Tuple) else node.parent
-                    )
-                    if isinstance(parent, nodes.AnnAssign) and parent.value is None:
-                        continue
-                    elif node.name in gen.difference(kill):
-                        # add redundant assignment
-                        if parent not in self._redundant_assignment:
-                            self._redundant_assignment[parent] = []
-                        if node.name not in self._redundant_assignment[parent]:
-                            self._redundant_assignment[parent].append(node.name)
-                    elif (
-                        parent in self._redundant_assignment
-                        and node.name in self._redundant_assignment[parent]
-                    ):
-                        # remove redundant assignment
-                        self._redundant_assignment[parent].remove(node.name)
-                        if len(self._redundant_assignment[parent]) == 0:
-                            self._redundant_assignment.pop(parent)
-
-                    # When node.parent is an AugAssign, the name counts as a use of the variable,
-                    # and so is added to kill.
-                    if isinstance(node.parent, nodes.AugAssign):
-                        kill.add(node.name)
-                    else:
-                        kill.discard(node.name)
-                    gen.add(node.name)
-                elif isinstance(node, (nodes.Nonlocal, nodes.Global)):
-                    kill.difference_update(set(node.names))
-                else:
-                    kill.add(node.name)
-
-        return gen.difference(kill)
+            )
 
     def _get_assigns(self, node: Union[nodes.FunctionDef, nodes.Module]) -> set[str]:
         """Returns a set of all local and parameter variables that could be
@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import doctest
 import string
 
 from astroid import nodes
@@ -45,6 +44,9 @@ class UnmentionedParameterChecker(BaseChecker):
 
     def _strip_docstring_of_doctest(self, docstring: str) -> str:
         """Return the docstring without the doctest"""
+        # doctest imports unittest and pdb, so it is only imported when a docstring is checked
+        import doctest
+
         parsed = doctest.DocTestParser().parse(docstring)
         return "".join(part for part in parsed if not isinstance(part, doctest.Example))
 
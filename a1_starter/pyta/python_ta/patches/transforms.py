@@ -1,8 +1,15 @@
 """Patch to add transforms for setting type constraints and creating control flow graphs.
+
+The control flow graphs are created lazily: the cfg of a module or function is only created when
+the cfg or cfg_block attribute of one of its nodes is first accessed, and only for modules checked
+while an enabled checker declares that it uses control flow graphs (by setting a true
+`requires_cfg` class attribute).
 """
 
 import logging
+from typing import Any, Union
 
+from astroid import nodes
 from pylint.lint import PyLinter
 
 from ..cfg.visitor import CFGVisitor
@@ -25,12 +32,78 @@ def patch_ast_transforms(z3: bool):
             except Exception as e:
                 logging.warning(f"Could not run Z3Visitor: {e}")
 
-        # Run the CFGVisitor
-        try:
-            ast.accept(CFGVisitor())
-        except Exception as e:
-            logging.warning(f"Could not run Z3Visitor: {e}")
+        # Allow the CFGVisitor to be run on first access
+        if _requires_cfg(self):
+            ast.lazy_cfgs = True
 
         return ast
 
     PyLinter.get_ast = new_get_ast
+    nodes.NodeNG.cfg = property(_get_cfg, _attribute_setter("cfg"))
+    nodes.NodeNG.cfg_block = property(_get_cfg_block, _attribute_setter("cfg_block"))
+
+
+def _requires_cfg(linter: PyLinter) -> bool:
+    """Return whether a checker with an enabled message uses control flow graphs."""
+    return any(
+        getattr(checker, "requires_cfg", False)
+        and any(linter.is_message_enabled(msgid) for msgid in checker.msgs)
+        for checker in linter.get_checkers()
+    )
+
+
+def _has_cfg(node: nodes.NodeNG) -> bool:
+    """Return whether node is a module or function that the CFGVisitor creates a cfg for."""
+    return isinstance(node, nodes.Module) or type(node) is nodes.FunctionDef
+
+
+def _create_cfg(scope: Union[nodes.Module, nodes.FunctionDef]) -> None:
+    """Create the cfg of scope, without the cfgs of the functions defined in it, if its module
+    allows it and it has not been created yet.
+    """
+    if "cfg" in scope.__dict__ or not getattr(scope.root(), "lazy_cfgs", False):
+        return
+    # Only attempt to create the cfg once, even if the CFGVisitor fails
+    scope.cfg = None
+    try:
+        scope.accept(CFGVisitor({"nested-functions": False}))
+    except Exception as e:
+        logging.warning(f"Could not run CFGVisitor: {e}")
+
+
+def _get_cfg(node: nodes.NodeNG) -> Any:
+    """Return the cfg of the module or function node, creating it if needed."""
+    if _has_cfg(node):
+        _create_cfg(node)
+    cfg = node.__dict__.get("cfg")
+    if cfg is None:
+        raise AttributeError(f"'{type(node).__name__}' object has no attribute 'cfg'")
+    return cfg
+
+
+def _get_cfg_block(node: nodes.NodeNG) -> Any:
+    """Return the block of node, creating the cfg that contains it if needed.
+
+    The block of a module or function is the start of its own cfg.
+    """
+    if _has_cfg(node):
+        return node.cfg.start
+    if "cfg_block" not in node.__dict__:
+        scope = node.parent
+        while scope is not None and not _has_cfg(scope):
+            scope = scope.parent
+        if scope is not None:
+            _create_cfg(scope)
+    try:
+        return node.__dict__["cfg_block"]
+    except KeyError:
+        raise AttributeError(f"'{type(node).__name__}' object has no attribute 'cfg_block'")
+
+
+def _attribute_setter(name: str):
+    """Return a setter storing the value of attribute name in the instance dict."""
+
+    def setter(node: nodes.NodeNG, value: Any) -> None:
+        node.__dict__[name] = value
+
+    return setter
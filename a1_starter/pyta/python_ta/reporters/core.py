@@ -7,8 +7,9 @@ import os.path
 import sys
 from collections import defaultdict
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Union
 
 from astroid import NodeNG
 from pylint.message import Message
@@ -16,16 +17,31 @@ from pylint.message.message_definition import MessageDefinition
 from pylint.reporters import BaseReporter
 from pylint.reporters.ureports.nodes import BaseLayout
 
+from ..source import get_source
 from .node_printers import LineType, render_message
 
 
 class NewMessage:
-    """Extension of Pylint's Message class to incorporate astroid node and source code snippet."""
+    """Extension of Pylint's Message class to incorporate astroid node and source code snippet.
 
-    def __init__(self, message: Message, node: NodeNG, snippet: Optional[str]) -> None:
+    The snippet may be given as a function that renders it, which is only called when the snippet
+    is first accessed. Reporters only output some of the messages, and rendering a snippet takes
+    much longer than creating its message.
+    """
+
+    def __init__(
+        self, message: Message, node: NodeNG, snippet: Union[str, Callable[[], str], None]
+    ) -> None:
         self.message = message
         self.node = node
-        self.snippet = snippet
+        self._snippet = snippet
+
+    @property
+    def snippet(self) -> Optional[str]:
+        """The source code snippet of this message, rendered on first access."""
+        if callable(self._snippet):
+            self._snippet = self._snippet()
+        return self._snippet
 
     def __getattr__(self, item):
         return getattr(self.message, item)
@@ -126,7 +142,7 @@ class PythonTaReporter(BaseReporter):
             if msg.symbol in NO_SNIPPET or msg.msg.startswith("Invalid module"):
                 snippet = ""
             else:
-                snippet = self._build_snippet(msg, node)
+                snippet = partial(self._build_snippet, msg, node, self.source_lines)
 
             curr_messages[-1] = NewMessage(msg, node, snippet)
 
@@ -156,13 +172,13 @@ class PythonTaReporter(BaseReporter):
         """
 
     # Rendering
-    def _build_snippet(self, msg: Message, node: NodeNG) -> str:
-        """Return a code snippet for the given Message object, formatted appropriately according
-        to line type.
+    def _build_snippet(self, msg: Message, node: NodeNG, source_lines: list[str]) -> str:
+        """Return a code snippet for the given Message object from source_lines, the lines of the
+        file it is on, formatted appropriately according to line type.
         """
         code_snippet = ""
 
-        for lineno, slice_, line_type, text in render_message(msg, node, self.source_lines):
+        for lineno, slice_, line_type, text in render_message(msg, node, source_lines):
             code_snippet += self._add_line(lineno, line_type, slice_, text)
 
         return code_snippet
@@ -255,8 +271,7 @@ class PythonTaReporter(BaseReporter):
         if self.current_file not in self.messages:
             self.messages[self.current_file] = []
 
-        with open(filepath, encoding="utf-8") as f:
-            self.source_lines = [line.rstrip("\r\n") for line in f.readlines()]
+        self.source_lines = [line.rstrip("\r\n") for line in get_source(filepath).lines]
 
     def on_close(self, stats, previous_stats):
         """Hook called when a module finished analyzing.
@@ -1,13 +1,7 @@
 import os
 import sys
-import webbrowser
 from datetime import datetime
-from http.server import BaseHTTPRequestHandler, HTTPServer
 
-from jinja2 import Environment, FileSystemLoader
-from pygments import highlight
-from pygments.formatters import HtmlFormatter
-from pygments.lexers import PythonLexer
 from pylint.reporters.ureports.nodes import BaseLayout
 
 from .core import PythonTaReporter
@@ -59,6 +53,9 @@ class HTMLReporter(PythonTaReporter):
         This method can be implemented to display them after they've
         been aggregated.
         """
+        # jinja2 is only imported when a report is rendered, as importing it is slow
+        from jinja2 import Environment, FileSystemLoader
+
         grouped_messages = {path: self.group_messages(msgs) for path, msgs in self.messages.items()}
 
         template_f = self.linter.config.pyta_template_file
@@ -93,6 +90,8 @@ class HTMLReporter(PythonTaReporter):
 
         Adapted from: https://github.com/plotly/plotly.py/blob/master/packages/python/plotly/plotly/io/_base_renderers.py#L655
         """
+        import webbrowser
+        from http.server import BaseHTTPRequestHandler, HTTPServer
 
         class OneShotRequestHandler(BaseHTTPRequestHandler):
             def do_GET(self):
@@ -125,6 +124,10 @@ class HTMLReporter(PythonTaReporter):
     @classmethod
     def _colourify(cls, colour_class: str, text: str) -> str:
         """Return a colourized version of text, using colour_class."""
+        from pygments import highlight
+        from pygments.formatters import HtmlFormatter
+        from pygments.lexers import PythonLexer
+
         colour = cls._COLOURING[colour_class]
         new_text = text.replace(" ", cls._SPACE)
         if "-line" not in colour_class:
@@ -43,13 +43,13 @@ class JSONReporter(PythonTaReporter):
     def _output_messages(self, msgs: list[NewMessage]) -> list[dict]:
         """Returns a list of dictionaries containing formatted error messages."""
         max_messages = self.linter.config.pyta_number_of_messages
-        num_occurrences = {msg.message.msg_id: 0 for msg in msgs}
+        num_occurrences = {msg.msg_id: 0 for msg in msgs}
         output_lst = []
 
         for msg in msgs:
-            if max_messages == 0 or num_occurrences[msg.message.msg_id] < max_messages:
+            if max_messages == 0 or num_occurrences[msg.msg_id] < max_messages:
                 output_lst.append(msg.to_dict())
-            num_occurrences[msg.message.msg_id] += 1
+            num_occurrences[msg.msg_id] += 1
 
         for msg_dict in output_lst:
             msg_dict["number_of_occurrences"] = num_occurrences[msg_dict["msg_id"]]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+
+from pylint.reporters.ureports.nodes import BaseLayout
+
+from .json_reporter import JSONReporter
+
+
+class NDJSONReporter(JSONReporter):
+    """Reporter that streams newline-delimited JSON.
+
+    Writes one compact JSON object per file as soon as the file has been checked, in the same
+    format as the objects in the list output by JSONReporter, and flushes the output stream.
+    The messages of a file are then discarded, unless they are needed to upload them.
+    """
+
+    name = "NDJSONReporter"
+
+    OUTPUT_FILENAME = "pyta_report.ndjson"
+
+    # Whether messages were reported for any file, including those already written
+    _any_messages: bool
+
+    def __init__(self) -> None:
+        """Initialize this reporter."""
+        super().__init__()
+        self._any_messages = False
+
+    def print_messages(self, level: str = "all") -> None:
+        """Write the messages for the current file."""
+        msgs = self.messages[self.current_file]
+        self._any_messages = self._any_messages or bool(msgs)
+        self.writeln(
+            json.dumps(
+                {"filename": self.current_file, "msgs": self._output_messages(msgs)},
+                separators=(",", ":"),
+            )
+        )
+        self.out.flush()
+        if not self.linter.config.pyta_error_permission:
+            del self.messages[self.current_file]
+
+    def has_messages(self) -> bool:
+        """Return whether there are any messages registered."""
+        return self._any_messages or super().has_messages()
+
+    def display_messages(self, layout: BaseLayout) -> None:
+        """Do nothing to display messages, since they were written as each file was checked."""
@@ -0,0 +1,106 @@
+"""A registry of the source code of the files being checked.
+
+Checking a file needs its source code in several places: the pre-check tokenizes it, astroid
+parses it, the setendings transform and the pycodestyle checker read its lines, and the reporter
+renders snippets from its lines. Each of them used to open and decode the file separately. The
+registry reads and decodes each file once and serves every one of them from the same copy.
+
+An entry is read again if its file's size or modification time has changed since it was read,
+e.g. after the file was formatted by black.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import tokenize
+from typing import Optional
+
+
+class SourceFile:
+    """The source code of a file, read from disk once and decoded on first use.
+
+    Instance attributes:
+        path: the absolute path of the file
+        data: the contents of the file
+        stat: the result of os.stat on the file when it was read
+    """
+
+    path: str
+    data: bytes
+    stat: os.stat_result
+    _encoding: Optional[str]
+    _text: Optional[str]
+    _lines: Optional[list[str]]
+    _tokens: Optional[list[tokenize.TokenInfo]]
+
+    def __init__(self, path: str) -> None:
+        """Read the file at path."""
+        self.path = path
+        with open(path, "rb") as f:
+            self.stat = os.fstat(f.fileno())
+            self.data = f.read()
+        self._encoding = None
+        self._text = None
+        self._lines = None
+        self._tokens = None
+
+    @property
+    def encoding(self) -> str:
+        """The encoding of the file, from its coding cookie or BOM, or else utf-8."""
+        if self._encoding is None:
+            self._encoding = tokenize.detect_encoding(io.BytesIO(self.data).readline)[0]
+        return self._encoding
+
+    @property
+    def text(self) -> str:
+        """The decoded contents of the file, with newlines translated to '\\n' as when the file
+        is opened in text mode.
+        """
+        if self._text is None:
+            text = self.data.decode(self.encoding)
+            self._text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return self._text
+
+    @property
+    def lines(self) -> list[str]:
+        """The lines of text, each ending with its '\\n', as returned by readlines()."""
+        if self._lines is None:
+            self._lines = io.StringIO(self.text).readlines()
+        return self._lines
+
+    @property
+    def tokens(self) -> list[tokenize.TokenInfo]:
+        """The tokens of text."""
+        if self._tokens is None:
+            self._tokens = list(tokenize.generate_tokens(io.StringIO(self.text).readline))
+        return self._tokens
+
+
+# The source files read so far, by absolute path
+_sources: dict[str, SourceFile] = {}
+
+
+def get_source(filepath: str) -> SourceFile:
+    """Return the source code of the file at filepath, reading it if it has not been read yet or
+    has changed since.
+    """
+    path = os.path.abspath(os.path.expanduser(filepath))
+    source = _sources.get(path)
+    if source is not None:
+        stat = os.stat(path)
+        if (stat.st_size, stat.st_mtime_ns) == (source.stat.st_size, source.stat.st_mtime_ns):
+            return source
+    source = SourceFile(path)
+    _sources[path] = source
+    return source
+
+
+def forget_source(filepath: Optional[str] = None) -> None:
+    """Drop the source code of the file at filepath from the registry, or of every file if
+    filepath is None.
+    """
+    if filepath is None:
+        _sources.clear()
+    else:
+        _sources.pop(os.path.abspath(os.path.expanduser(filepath)), None)
@@ -28,9 +28,13 @@ Astroid Source:
 https://github.com/PyCQA/astroid/blob/master/astroid/transforms.py
 """
 
+import re
+
 from astroid import nodes
 from astroid.transforms import TransformVisitor
 
+from python_ta.source import get_source
+
 CONSUMABLES = " \n\t\\"
 
 
@@ -95,9 +99,9 @@ NODES_WITH_CHILDREN = [
 ]
 
 
-# Predicate functions, for setting locations based on source code.
-# Predicates can only return a single truthy value, because of how its used in
-# `astroid/transforms.py`
+# Search functions, for setting locations based on source code.
+# Each returns the text to search for around a node, which always starts with a
+# character that is not in CONSUMABLES, or None if there is nothing to search for.
 # ====================================================
 def _token_search(token):
     """
@@ -105,16 +109,14 @@ def _token_search(token):
     @rtype: function
     """
 
-    def _is_token(s, index, node):
+    def _token(node):
         """Fix to include certain tokens such as a paren, bracket, or brace.
-        @type s: string
-        @type index: int
         @type node: Astroid node
-        @rtype: bool
+        @rtype: string
         """
-        return s[index] == token
+        return token
 
-    return _is_token
+    return _token
 
 
 def _keyword_search(keyword):
@@ -123,28 +125,24 @@ def _keyword_search(keyword):
     @rtype: function
     """
 
-    def _is_keyword(s, index, node):
+    def _keyword(node):
         """Search for a keyword. Right-to-left.
-        @type s: string
-        @type index: int
         @type node: Astroid node
-        @rtype: bool
+        @rtype: string
         """
-        return s[index : index + len(keyword)] == keyword
+        return keyword
 
-    return _is_keyword
+    return _keyword
 
 
-def _is_arg_name(s, index, node):
+def _arg_name(node):
     """Search for the name of the argument. Right-to-left."""
-    if not node.arg:
-        return False
-    return s[index : index + len(node.arg)] == node.arg
+    return node.arg or None
 
 
 # Nodes the require the source code for proper location setting
 # Elements here are in the form
-# (node class, predicate for start | None, predicate for end | None)
+# (node class, search for start | None, search for end | None)
 NODES_REQUIRING_SOURCE = [
     (nodes.AsyncFor, _keyword_search("async"), None),
     (nodes.AsyncFunctionDef, _keyword_search("async"), None),
@@ -157,7 +155,7 @@ NODES_REQUIRING_SOURCE = [
     (nodes.Expr, _token_search("("), _token_search(")")),
     (nodes.GeneratorExp, _token_search("("), _token_search(")")),
     (nodes.If, _keyword_search("elif"), None),
-    (nodes.Keyword, _is_arg_name, None),
+    (nodes.Keyword, _arg_name, None),
     (nodes.List, _token_search("["), _token_search("]")),
     (nodes.ListComp, _token_search("["), _token_search("]")),
     (nodes.Set, None, _token_search("}")),
@@ -175,6 +173,7 @@ def init_register_ending_setters(source_code):
     @rtype: TransformVisitor
     """
     ending_transformer = TransformVisitor()
+    source_searcher = SourceSearcher(source_code)
 
     # Check consistency of astroid-provided fromlineno and col_offset attributes.
     for node_class in nodes.ALL_NODE_CLASSES:
@@ -192,48 +191,133 @@ def init_register_ending_setters(source_code):
     ending_transformer.register_transform(nodes.ClassDef, _set_start_from_first_decorator)
     ending_transformer.register_transform(nodes.FunctionDef, _set_start_from_first_decorator)
     ending_transformer.register_transform(nodes.Tuple, _set_start_from_first_child)
-    ending_transformer.register_transform(nodes.Arguments, fix_arguments(source_code))
-    ending_transformer.register_transform(nodes.Slice, fix_slice(source_code))
+    ending_transformer.register_transform(nodes.Arguments, fix_arguments(source_searcher))
+    ending_transformer.register_transform(nodes.Slice, fix_slice(source_searcher))
 
     for node_class in NODES_WITHOUT_CHILDREN:
         ending_transformer.register_transform(node_class, set_without_children)
     for node_class in NODES_WITH_CHILDREN:
         ending_transformer.register_transform(node_class, set_from_last_child)
 
-    ending_transformer.register_transform(nodes.Subscript, fix_subscript(source_code))
+    ending_transformer.register_transform(nodes.Subscript, fix_subscript(source_searcher))
 
     # Nodes where the source code must also be provided.
-    # source_code and the predicate functions get stored in the TransformVisitor
-    for node_class, start_pred, end_pred in NODES_REQUIRING_SOURCE:
-        if start_pred is not None:
+    # source_searcher and the search functions get stored in the TransformVisitor
+    for node_class, start_search, end_search in NODES_REQUIRING_SOURCE:
+        if start_search is not None:
             ending_transformer.register_transform(
-                node_class, start_setter_from_source(source_code, start_pred)
+                node_class, start_setter_from_source(source_searcher, start_search)
             )
-        if end_pred is not None:
+        if end_search is not None:
             # This is for searching for a trailing comma after a tuple's final element
             if node_class is nodes.Tuple:
                 ending_transformer.register_transform(
-                    node_class, end_setter_from_source(source_code, end_pred, True)
+                    node_class, end_setter_from_source(source_searcher, end_search, True)
                 )
             else:
                 ending_transformer.register_transform(
-                    node_class, end_setter_from_source(source_code, end_pred)
+                    node_class, end_setter_from_source(source_searcher, end_search)
                 )
 
     # Nodes where extra parentheses are included
-    ending_transformer.register_transform(nodes.BinOp, add_parens(source_code))
-    ending_transformer.register_transform(nodes.Const, add_parens(source_code))
-    ending_transformer.register_transform(nodes.Tuple, add_parens(source_code))
+    ending_transformer.register_transform(nodes.BinOp, add_parens(source_searcher))
+    ending_transformer.register_transform(nodes.Const, add_parens(source_searcher))
+    ending_transformer.register_transform(nodes.Tuple, add_parens(source_searcher))
 
     return ending_transformer
 
 
+class SourceSearcher:
+    """Searches in the lines of a module's source code.
+
+    The transforms below search the source code for the next or previous occurrence of a
+    character from a node's position. These searches are done with str.find and compiled
+    regular expressions rather than character by character in Python.
+    Note that the searches are by character, not by token: e.g. a '#' in a string is taken
+    as the start of a comment.
+    """
+
+    # The sets of characters that searches skip over, and the patterns matching any other
+    # character, and matching the runs of skipped characters at the end of a string
+    SKIPPED = (CONSUMABLES, CONSUMABLES + ",")
+    _CODE_PATTERNS = {skipped: re.compile("[^" + re.escape(skipped) + "]") for skipped in SKIPPED}
+    _TRAILING_PATTERNS = {
+        skipped: re.compile("[" + re.escape(skipped) + "]*\\Z") for skipped in SKIPPED
+    }
+
+    def __init__(self, source_code):
+        """
+        @type source_code: list of strings
+        """
+        self.source_code = source_code
+
+    def first_char(self, char, line_i, start):
+        """Return the first column >= start of char in line line_i before any comment, or -1."""
+        line = self.source_code[line_i]
+        column = line.find(char, start)
+        if column == -1 or line.find("#", start, column) != -1:
+            return -1
+        return column
+
+    def first_code(self, line_i, start, skipped=CONSUMABLES):
+        """Return the first column >= start in line line_i of a character not in skipped, or -1.
+
+        Precondition: skipped is one of SKIPPED.
+        """
+        match = self._CODE_PATTERNS[skipped].search(self.source_code[line_i], start)
+        return match.start() if match else -1
+
+    def last_code(self, line_i, stop, skipped=CONSUMABLES):
+        """Return the last column <= stop in line line_i of a character not in skipped, or -1.
+
+        Precondition: skipped is one of SKIPPED.
+        """
+        line = self.source_code[line_i]
+        if stop >= len(line):
+            stop = len(line) - 1
+        if stop < 0 or line[stop] not in skipped:
+            return stop
+        # Search windows of the line ending at stop, doubling in size, so that a short
+        # search does not scan the whole line
+        size = 16
+        while True:
+            window_start = max(0, stop + 1 - size)
+            column = self._TRAILING_PATTERNS[skipped].search(line, window_start, stop + 1).start()
+            if column > window_start or window_start == 0:
+                return column - 1
+            size *= 2
+
+    def find_forward(self, line_i, char_i, char):
+        """Search for char from column char_i of line line_i onwards, skipping comments.
+        Return its (line, column), or the position where the search stopped.
+        """
+        while line_i < len(self.source_code) and char_i < len(self.source_code[line_i]):
+            found = self.first_char(char, line_i, char_i)
+            if found != -1:
+                return line_i, found
+            line_i, char_i = line_i + 1, 0
+        return line_i, char_i
+
+    def next_code(self, line_i, start):
+        """Return the (line, column) of the first character that is not in CONSUMABLES from
+        column start of line line_i onwards, skipping comments, or None.
+        """
+        column = self.first_code(line_i, start)
+        if column != -1 and self.source_code[line_i][column] != "#":
+            return line_i, column
+        for i in range(line_i + 1, len(self.source_code)):
+            column = self.first_code(i, 0)
+            if column != -1 and self.source_code[i][column] != "#":
+                return i, column
+        return None
+
+
 # Transform functions.
 # These functions are called on individual nodes to either fix the
 # `fromlineno` and `col_offset` properties of the nodes,
 # or to set the `end_lineno` and `end_col_offset` attributes for a node.
 # ====================================================
-def fix_slice(source_code):
+def fix_slice(source_searcher):
     """
     The Slice node column positions are mostly set properly when it has (Const)
     children. The main problem is when Slice node doesn't have children.
@@ -253,16 +337,7 @@ def fix_slice(source_code):
             has_children = False
 
         # Search the remaining source code for the "]" char.
-        while (
-            line_i < len(source_code)
-            and char_i < len(source_code[line_i])
-            and source_code[line_i][char_i] != "]"
-        ):
-            if char_i == len(source_code[line_i]) - 1 or source_code[line_i][char_i] == "#":
-                char_i = 0
-                line_i += 1
-            else:
-                char_i += 1
+        line_i, char_i = source_searcher.find_forward(line_i, char_i, "]")
 
         if not has_children:
             node.fromlineno, node.col_offset = line_i + 1, char_i
@@ -273,7 +348,7 @@ def fix_slice(source_code):
     return _find_square_brackets
 
 
-def fix_subscript(source_code):
+def fix_subscript(source_searcher):
     """For a Subscript node.
 
     Need to include this because the index/extended slice is a value rather than
@@ -294,12 +369,7 @@ def fix_subscript(source_code):
             line_i = node.value.end_lineno - 1  # convert 1 to 0 index.
             char_i = node.value.end_col_offset
 
-        while char_i < len(source_code[line_i]) and source_code[line_i][char_i] != "]":
-            if char_i == len(source_code[line_i]) - 1 or source_code[line_i][char_i] == "#":
-                char_i = 0
-                line_i += 1
-            else:
-                char_i += 1
+        line_i, char_i = source_searcher.find_forward(line_i, char_i, "]")
 
         node.end_lineno, node.end_col_offset = line_i + 1, char_i + 1
         return node
@@ -307,7 +377,7 @@ def fix_subscript(source_code):
     return _fix_end
 
 
-def fix_arguments(source_code):
+def fix_arguments(source_searcher):
     """For an Arguments node"""
 
     def _find(node: nodes.Arguments) -> nodes.Arguments:
@@ -337,12 +407,7 @@ def fix_arguments(source_code):
         else:
             end_char = ":"
 
-        while char_i < len(source_code[line_i]) and source_code[line_i][char_i] != end_char:
-            if char_i == len(source_code[line_i]) - 1 or source_code[line_i][char_i] == "#":
-                char_i = 0
-                line_i += 1
-            else:
-                char_i += 1
+        line_i, char_i = source_searcher.find_forward(line_i, char_i, end_char)
 
         node.end_lineno, node.end_col_offset = line_i + 1, char_i
 
@@ -459,21 +524,22 @@ def _get_last_child(node):
         return skip_to_last_child  # postcondition: node, or None.
 
 
-def end_setter_from_source(source_code, pred, only_consumables=False):
+def end_setter_from_source(source_searcher, search, only_consumables=False):
     """Returns a *function* that sets ending locations for a node from source.
 
     The basic technique is to do the following:
       1. Find the ending locations for the node based on its last child.
-      2. Starting at that point, iterate through characters in the source code
-         up to and including the first index that satisfies pred.
+      2. Starting at that point, find the first occurrence in the source code of the
+         text returned by search(node), skipping comments.
 
-    pred is a function that takes a string and index and returns a bool,
-    e.g. _is_close_paren
+    search is a function that takes a node and returns the text to search for,
+    e.g. _token_search(")")
 
-    If only_consumables is True, the search halts when it reaches a non-consumable
-    character that fails pred *on the first line*.
+    The search halts at any other character that is not in CONSUMABLES, except on the
+    first line, where it only halts if only_consumables is True.
     TODO: really the behaviour should be the same for all lines searched for.
     """
+    source_code = source_searcher.source_code
 
     def set_endings_from_source(node):
         # Tuple nodes have an end_col_offset that includes the end paren,
@@ -482,83 +548,90 @@ def end_setter_from_source(source_code, pred, only_consumables=False):
         if not hasattr(node, "end_col_offset") or isinstance(node, nodes.Tuple):
             set_from_last_child(node)
 
+        text = search(node)
+        if text is None:
+            return node
+
         # Initialize counters. Note: we need to offset lineno,
         # since it's 1-indexed.
         end_col_offset, lineno = node.end_col_offset, node.end_lineno - 1
 
         # First, search the remaining part of the current end line.
-        for j in range(end_col_offset, len(source_code[lineno])):
-            if source_code[lineno][j] == "#":
-                break  # skip over comment lines
-            if pred(source_code[lineno], j, node):
-                node.end_col_offset = j + 1
+        if only_consumables:
+            j = source_searcher.first_code(lineno, end_col_offset)
+            if j != -1 and source_code[lineno][j] != "#":
+                if source_code[lineno].startswith(text, j):
+                    node.end_col_offset = j + 1
                 return node
-            elif only_consumables and source_code[lineno][j] not in CONSUMABLES:
+        else:
+            j = source_searcher.first_char(text, lineno, end_col_offset)
+            if j != -1:
+                node.end_col_offset = j + 1
                 return node
 
-        # If that doesn't work, search remaining lines
-        for i in range(lineno + 1, len(source_code)):
-            # Search each character
-            for j in range(len(source_code[i])):
-                if source_code[i][j] == "#":
-                    break  # skip over comment lines
-                if pred(source_code[i], j, node):
-                    node.end_col_offset, node.end_lineno = j + 1, i + 1
-                    return node
-                # only consume inert characters.
-                elif source_code[i][j] not in CONSUMABLES:
-                    return node
+        # If that doesn't work, search remaining lines, only consuming inert characters.
+        found = source_searcher.next_code(lineno + 1, 0) if lineno + 1 < len(source_code) else None
+        if found is not None:
+            i, j = found
+            if source_code[i].startswith(text, j):
+                node.end_col_offset, node.end_lineno = j + 1, i + 1
         return node
 
     return set_endings_from_source
 
 
-def start_setter_from_source(source_code, pred):
+def start_setter_from_source(source_searcher, search):
     """Returns a *function* that sets start locations for a node from source.
-    Recall `source_code`, `pred` are within the lexical scope of the returned function.
+    Recall `source_searcher`, `search` are within the lexical scope of the returned function.
 
     The basic technique is to do the following:
       1. Find the start locations for the node (already set).
-      2. Starting at that point, iterate through characters in the source code
-         in reverse until reaching the first index that satisfies pred.
+      2. Starting at that point, find the last occurrence in the source code of the
+         text returned by search(node), right-to-left.
 
-    pred is a function that takes a string and index and returns a bool,
-    e.g. _is_open_paren
+    search is a function that takes a node and returns the text to search for,
+    e.g. _token_search("(")
     """
+    source_code = source_searcher.source_code
 
     def set_start_from_source(node):
+        text = search(node)
+        if text is None:
+            return node
+
         # Initialize counters. Note: fromlineno is 1-indexed.
         col_offset, lineno = node.col_offset, node.fromlineno - 1
 
         # First, search the remaining part of the current start line
-        for j in range(min(len(source_code[lineno]) - 1, col_offset), -1, -1):
-            if pred(source_code[lineno], j, node):
-                node.col_offset = j
-                return node
+        j = min(len(source_code[lineno]) - 1, col_offset)
+        j = source_code[lineno].rfind(text, 0, j + len(text)) if j >= 0 else -1
+        if j != -1:
+            node.col_offset = j
+            return node
 
-        # If that doesn't work, search remaining lines
+        # If that doesn't work, search remaining lines, only consuming inert characters.
         for i in range(lineno - 1, -1, -1):
-            # Search each character, right-to-left
-            for j in range(len(source_code[i]) - 1, -1, -1):
-                if pred(source_code[i], j, node):
-                    node.end_col_offset, node.end_lineno = j, i + 1
-                    return node
-                # only consume inert characters.
-                elif source_code[i][j] not in CONSUMABLES:
-                    return node
+            j = source_searcher.last_code(i, len(source_code[i]))
+            if j == -1:
+                continue
+            if source_code[i].startswith(text, j):
+                node.end_col_offset, node.end_lineno = j, i + 1
+            return node
         return node
 
     return set_start_from_source
 
 
-def add_parens(source_code):
+def add_parens(source_searcher):
     def h(node):
-        _add_parens(source_code)(node)
+        _add_parens(source_searcher)(node)
 
     return h
 
 
-def _add_parens(source_code):
+def _add_parens(source_searcher):
+    source_code = source_searcher.source_code
+
     def h(node):
         # Initialize counters. Note: fromlineno is 1-indexed.
         prev = node.fromlineno, node.col_offset, node.end_lineno, node.end_col_offset
@@ -566,64 +639,30 @@ def _add_parens(source_code):
             col_offset, lineno = node.col_offset, node.fromlineno - 1
             end_col_offset, end_lineno = node.end_col_offset, node.end_lineno - 1
 
-            # First, search the remaining part of the current start line
+            # First, search the remaining part of the current start line,
+            # then the remaining lines, right-to-left, skipping inert characters and commas.
             prev_char, new_lineno, new_coloffset = None, None, None
-            for j in range(col_offset - 1, -1, -1):
-                if source_code[lineno][j] in CONSUMABLES or source_code[lineno][j] == ",":
-                    continue
-                else:
-                    prev_char, new_lineno, new_coloffset = source_code[lineno][j], lineno, j
+            line = source_code[lineno]
+            if col_offset > 0 and line[col_offset - 1] not in CONSUMABLES + ",":
+                # The usual case, where the previous character is adjacent
+                prev_char, new_lineno, new_coloffset = line[col_offset - 1], lineno, col_offset - 1
+            for i in range(lineno if prev_char is None else -1, -1, -1):
+                stop = col_offset - 1 if i == lineno else len(source_code[i])
+                j = source_searcher.last_code(i, stop, CONSUMABLES + ",")
+                if j != -1:
+                    prev_char, new_lineno, new_coloffset = source_code[i][j], i, j
                     break
 
-            if prev_char is None:
-                # Search remaining lines
-                for i in range(lineno - 1, -1, -1):
-                    # Search each character, right-to-left
-                    for j in range(len(source_code[i]) - 1, -1, -1):
-                        if source_code[i][j] in CONSUMABLES or source_code[i][j] == ",":
-                            continue
-                        else:
-                            prev_char, new_lineno, new_coloffset = source_code[i][j], i, j
-
-                            break
-                    if prev_char is not None:
-                        break
-
             if prev_char != "(":
                 # No enclosing parentheses
                 break
 
             # Now search for matching ')'
-            next_char, new_end_lineno, new_end_coloffset = None, None, None
-            for j in range(end_col_offset, len(source_code[end_lineno])):
-                if source_code[end_lineno][j] == "#":
-                    break  # skip over comment lines
-                elif source_code[end_lineno][j] in CONSUMABLES:
-                    continue
-                else:
-                    next_char, new_end_lineno, new_end_coloffset = (
-                        source_code[end_lineno][j],
-                        end_lineno,
-                        j,
-                    )
-                    break
-
-            if next_char is None:
-                # Search remaining lines
-                for i in range(end_lineno + 1, len(source_code)):
-                    # Search each character
-                    for j in range(len(source_code[i])):
-                        if source_code[i][j] == "#":
-                            break  # skip over comment lines
-                        elif source_code[i][j] in CONSUMABLES:
-                            continue
-                        else:
-                            next_char, new_end_lineno, new_end_coloffset = source_code[i][j], i, j
-                            break
-                    if next_char is not None:
-                        break
-
-            if next_char != ")":
+            found = source_searcher.next_code(end_lineno, end_col_offset)
+            if found is None:
+                break
+            new_end_lineno, new_end_coloffset = found
+            if source_code[new_end_lineno][new_end_coloffset] != ")":
                 break
 
             # At this point, an enclosing pair of parentheses has been found
@@ -650,10 +689,17 @@ def register(linter):
     old_get_ast = linter.get_ast
 
     def new_get_ast(filepath, modname, data):
-        ast = old_get_ast(filepath, modname, data)
+        # Parse the file from the source registry rather than have astroid read it again
+        source = get_source(filepath) if data is None else None
+        ast = old_get_ast(filepath, modname, data if source is None else source.text)
         if ast is not None:
-            with open(filepath, encoding="utf-8") as f:
-                source_code = f.readlines()
+            if source is not None:
+                # Let node.stream() return the file's own bytes, as if astroid had read the file
+                ast.file_bytes = source.data
+                ast.file_encoding = source.encoding
+                source_code = source.lines
+            else:
+                source_code = get_source(filepath).lines
             ending_transformer = init_register_ending_setters(source_code)
             ending_transformer.visit(ast)
         return ast
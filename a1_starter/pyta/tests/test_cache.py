@@ -0,0 +1,42 @@
+"""Tests for the on-disk cache of python_ta lint results."""
+
+import os
+
+import python_ta
+from python_ta import cache as lint_cache
+
+CONFIG = {"output-format": "python_ta.reporters.PlainReporter"}
+
+
+def _check(filepath: str, output: str, cache: bool) -> list[tuple]:
+    """Return the locations and ids of the messages of checking filepath."""
+    reporter = python_ta.check_all(filepath, config=CONFIG, output=output, cache=cache)
+    return [
+        (m.message.location if hasattr(m, "message") else m.location, m.msg_id)
+        for messages in reporter.messages.values()
+        for m in messages
+    ]
+
+
+def test_cache_hit_from_other_cwd(tmp_path, monkeypatch) -> None:
+    """A cache filled from one working directory gives the messages of an uncached check when
+    it is read from another one.
+    """
+    monkeypatch.setattr(lint_cache, "CACHE_DIR", str(tmp_path / "cache"))
+    module = tmp_path / "lt" / "m1.py"
+    module.parent.mkdir()
+    module.write_text('"""Module."""\n\n\ndef f(x):\n    return x\n', encoding="utf-8")
+    other = tmp_path / "wd" / "sub"
+    other.mkdir(parents=True)
+    output = str(tmp_path / "report.txt")
+
+    monkeypatch.chdir(tmp_path)
+    _check(str(module), output, cache=True)
+    monkeypatch.chdir(other)
+    uncached = _check(str(module), output, cache=False)
+    cached = _check(str(module), output, cache=True)
+
+    assert uncached
+    assert cached == uncached
+    assert all(location.path == str(module) for location, _ in cached)
+    assert os.listdir(lint_cache.CACHE_DIR)